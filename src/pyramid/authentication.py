@@ -15,10 +15,10 @@ from webob.cookies import CookieProfile
 
 from pyramid.interfaces import IAuthenticationPolicy, IDebugLogger
 
-from pyramid.security import Authenticated, Everyone
+from pyramid.security import Authenticated, Everyone, _get_callback_results
 
 from pyramid.util import strings_differ, bytes_, ascii_, text_
-from pyramid.util import SimpleSerializer
+from pyramid.util import LRUCache, SimpleSerializer
 
 VALID_TOKEN = re.compile(r"^[A-Za-z][A-Za-z0-9+_-]*$")
 
@@ -28,6 +28,9 @@ class CallbackAuthenticationPolicy(object):
 
     debug = False
     callback = None
+    # set to False to run the callback every time it is needed, rather than
+    # once per request and userid
+    cache_callback = True
 
     def _log(self, msg, methodname, request):
         logger = request.registry.queryUtility(IDebugLogger)
@@ -42,6 +45,19 @@ class CallbackAuthenticationPolicy(object):
             princid = None
         return princid
 
+    def _run_callback(self, userid, request):
+        if not self.cache_callback:
+            return self.callback(userid, request)
+        results = _get_callback_results(request)
+        try:
+            return results[(self, userid)]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable userid
+            return self.callback(userid, request)
+        result = results[(self, userid)] = self.callback(userid, request)
+        return result
+
     def authenticated_userid(self, request):
         """ Return the authenticated userid or ``None``.
 
@@ -51,6 +67,15 @@ class CallbackAuthenticationPolicy(object):
         If a ``callback`` is registered, this will return the userid if
         and only if the callback returns a value that is not ``None``.
 
+        The result of the ``callback`` is remembered for the rest of the
+        request (it is shared with :meth:`effective_principals`), until
+        :func:`pyramid.security.remember` or :func:`pyramid.security.forget`
+        is called.  Set the policy's ``cache_callback`` attribute to
+        ``False`` to call the ``callback`` every time instead.
+
+        .. versionchanged:: 2.0
+           The result of the ``callback`` is remembered for the request.
+
         """
         debug = self.debug
         userid = self.unauthenticated_userid(request)
@@ -79,7 +104,7 @@ class CallbackAuthenticationPolicy(object):
                 request,
             )
             return userid
-        callback_ok = self.callback(userid, request)
+        callback_ok = self._run_callback(userid, request)
         if callback_ok is not None:  # is not None!
             debug and self._log(
                 'groupfinder callback returned %r; returning %r'
@@ -116,6 +141,13 @@ class CallbackAuthenticationPolicy(object):
             extra_principals = callback(userid, request)
             return [Everyone, Authenticated, userid] + extra_principals
 
+        As for :meth:`authenticated_userid`, the result of the ``callback``
+        is remembered for the rest of the request unless the policy's
+        ``cache_callback`` attribute is ``False``.
+
+        .. versionchanged:: 2.0
+           The result of the ``callback`` is remembered for the request.
+
         """
         debug = self.debug
         effective_principals = [Everyone]
@@ -149,7 +181,7 @@ class CallbackAuthenticationPolicy(object):
             )
             groups = []
         else:
-            groups = self.callback(userid, request)
+            groups = self._run_callback(userid, request)
             debug and self._log(
                 'groupfinder callback returned %r as groups' % (groups,),
                 'effective_principals',
@@ -573,6 +605,17 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
 
         This option is available as of :app:`Pyramid` 1.10.
 
+    ``ticket_cache_size``
+
+        Default: ``None``.  If set to an integer, remember up to that many
+        recently verified auth tickets, keyed by the cookie value (and the
+        remote address when ``include_ip`` is set), so that a request
+        bearing a ticket which has already been seen skips recomputing its
+        digest.  The ``timeout`` is still enforced on every request.
+        Optional.
+
+        This option is available as of :app:`Pyramid` 2.0.
+
     .. versionchanged:: 1.4
 
        Added the ``hashalg`` option, defaulting to ``sha512``.
@@ -587,6 +630,10 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
 
        Added the ``samesite`` option and made the default ``'Lax'``.
 
+    .. versionchanged:: 2.0
+
+       Added the ``ticket_cache_size`` option.
+
     Objects of this class implement the interface described by
     :class:`pyramid.interfaces.IAuthenticationPolicy`.
 
@@ -610,6 +657,7 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        ticket_cache_size=None,
     ):
         self.cookie = AuthTktCookieHelper(
             secret,
@@ -626,6 +674,7 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
             parent_domain=parent_domain,
             domain=domain,
             samesite=samesite,
+            ticket_cache_size=ticket_cache_size,
         )
         self.callback = callback
         self.debug = debug
@@ -863,6 +912,7 @@ class AuthTktCookieHelper(object):
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        ticket_cache_size=None,
     ):
         self.cookie_profile = CookieProfile(
             cookie_name=cookie_name,
@@ -887,6 +937,11 @@ class AuthTktCookieHelper(object):
         self.parent_domain = parent_domain
         self.domain = domain
         self.hashalg = hashalg
+        # (cookie, remote_addr) -> (timestamp, userid, tokens, user_data)
+        # of verified tickets, with the userid decoded
+        self.ticket_cache = None
+        if ticket_cache_size is not None:
+            self.ticket_cache = LRUCache(ticket_cache_size)
 
     def _get_cookies(self, request, value, max_age=None):
         cur_domain = request.domain
@@ -927,12 +982,26 @@ class AuthTktCookieHelper(object):
         else:
             remote_addr = '0.0.0.0'
 
-        try:
-            timestamp, userid, tokens, user_data = self.parse_ticket(
-                self.secret, cookie, remote_addr, self.hashalg
-            )
-        except self.BadTicket:
-            return None
+        ticket_cache = self.ticket_cache
+        ticket = None
+        if ticket_cache is not None:
+            ticket = ticket_cache.get((cookie, remote_addr))
+
+        if ticket is not None:
+            timestamp, userid, tokens, user_data = ticket
+            tokens = list(tokens)
+        else:
+            try:
+                timestamp, userid, tokens, user_data = self._verify_ticket(
+                    cookie, remote_addr
+                )
+            except self.BadTicket:
+                return None
+            if ticket_cache is not None:
+                ticket_cache.put(
+                    (cookie, remote_addr),
+                    (timestamp, userid, tuple(tokens), user_data),
+                )
 
         now = self.now  # service tests
 
@@ -943,15 +1012,6 @@ class AuthTktCookieHelper(object):
             # the auth_tkt data has expired
             return None
 
-        userid_typename = 'userid_type:'
-        user_data_info = user_data.split('|')
-        for datum in filter(None, user_data_info):
-            if datum.startswith(userid_typename):
-                userid_type = datum[len(userid_typename) :]
-                decoder = self.userid_type_decoders.get(userid_type)
-                if decoder:
-                    userid = decoder(userid)
-
         reissue = self.reissue_time is not None
 
         if reissue and not hasattr(request, '_authtkt_reissued'):
@@ -981,6 +1041,24 @@ class AuthTktCookieHelper(object):
         identity['userdata'] = user_data
         return identity
 
+    def _verify_ticket(self, cookie, remote_addr):
+        # Return the (timestamp, userid, tokens, user_data) of a valid
+        # ticket, with the userid decoded, or raise BadTicket.
+        timestamp, userid, tokens, user_data = self.parse_ticket(
+            self.secret, cookie, remote_addr, self.hashalg
+        )
+
+        userid_typename = 'userid_type:'
+        user_data_info = user_data.split('|')
+        for datum in filter(None, user_data_info):
+            if datum.startswith(userid_typename):
+                userid_type = datum[len(userid_typename) :]
+                decoder = self.userid_type_decoders.get(userid_type)
+                if decoder:
+                    userid = decoder(userid)
+
+        return timestamp, userid, tokens, user_data
+
     def forget(self, request):
         """ Return a set of expires Set-Cookie headers, which will destroy
         any existing auth_tkt cookie when attached to a response"""
@@ -6,7 +6,7 @@ from pyramid.location import lineage
 
 from pyramid.security import ACLAllowed, ACLDenied, Allow, Deny, Everyone
 
-from pyramid.util import is_nonstr_iter
+from pyramid.util import ClockCache, is_nonstr_iter
 
 
 @implementer(IAuthorizationPolicy)
@@ -57,6 +57,16 @@ class ACLAuthorizationPolicy(object):
       walking process ends after we've processed the any ACL directly
       attached to ``context``; a set of principals is returned.
 
+    ACLs of more than a few ACEs which are lists or tuples defined as the
+    ``__acl__`` attribute of a resource class (rather than callables,
+    properties, or ACLs assigned to a resource instance) are compiled the
+    first time they are consulted into a mapping of permission to principal
+    to the first matching ACE, so that a check costs a few dictionary lookups
+    rather than a scan of every ACE.  A compiled ACL is discarded when the
+    ACL it was compiled from is changed, although changes to a permission
+    sequence *inside* an existing ACE are not noticed: replace the ACE
+    instead.
+
     Objects of this class implement the
     :class:`pyramid.interfaces.IAuthorizationPolicy` interface.
     """
@@ -75,23 +85,19 @@ class ACLAuthorizationPolicy(object):
             except AttributeError:
                 continue
 
-            if acl and callable(acl):
-                acl = acl()
+            acl, ace = _find_location_ace(
+                location, acl, principals, permission
+            )
 
-            for ace in acl:
-                ace_action, ace_principal, ace_permissions = ace
-                if ace_principal in principals:
-                    if not is_nonstr_iter(ace_permissions):
-                        ace_permissions = [ace_permissions]
-                    if permission in ace_permissions:
-                        if ace_action == Allow:
-                            return ACLAllowed(
-                                ace, acl, permission, principals, location
-                            )
-                        else:
-                            return ACLDenied(
-                                ace, acl, permission, principals, location
-                            )
+            if ace is not None:
+                if ace[0] == Allow:
+                    return ACLAllowed(
+                        ace, acl, permission, principals, location
+                    )
+                else:
+                    return ACLDenied(
+                        ace, acl, permission, principals, location
+                    )
 
         # default deny (if no ACL in lineage at all, or if none of the
         # principals were mentioned in any ACE we found)
@@ -99,6 +105,70 @@ class ACLAuthorizationPolicy(object):
             '<default deny>', acl, permission, principals, context
         )
 
+    def permits_many(self, contexts, principals, permission):
+        """ Return a list containing the result of
+        :meth:`~ACLAuthorizationPolicy.permits` for each of ``contexts``.
+        The ACL of a resource shared by the lineages of several contexts
+        (e.g. their common parent) is only consulted once."""
+        # id(location) -> (location, result, acl); ``result`` is the ACL
+        # result from the nearest matching ACE at or above the location, or
+        # ``None`` if there is none, in which case ``acl`` is the topmost
+        # ACL at or above it (or ``None``).  Holding the location keeps its
+        # id from being reused during the call.
+        memo = {}
+        placeholder = '<No ACL found on any object in resource lineage>'
+        results = []
+
+        for context in contexts:
+            # locations walked so far, with their ACL or ``None``
+            walked = []
+            result = top_acl = None
+            for location in lineage(context):
+                known = memo.get(id(location))
+                if known is not None:
+                    result, top_acl = known[1], known[2]
+                    break
+
+                try:
+                    acl = location.__acl__
+                except AttributeError:
+                    walked.append((location, None))
+                    continue
+
+                acl, ace = _find_location_ace(
+                    location, acl, principals, permission
+                )
+
+                if ace is not None:
+                    if ace[0] == Allow:
+                        result = ACLAllowed(
+                            ace, acl, permission, principals, location
+                        )
+                    else:
+                        result = ACLDenied(
+                            ace, acl, permission, principals, location
+                        )
+                    walked.append((location, None))
+                    break
+                walked.append((location, acl))
+
+            # record the outcome for each location walked, from the top down
+            for location, acl in reversed(walked):
+                if result is None and top_acl is None:
+                    top_acl = acl
+                memo[id(location)] = (location, result, top_acl)
+
+            if result is None:
+                # default deny
+                if top_acl is None:
+                    top_acl = placeholder
+                result = ACLDenied(
+                    '<default deny>', top_acl, permission, principals, context
+                )
+            results.append(result)
+
+        return results
+
     def principals_allowed_by_permission(self, context, permission):
         """ Return the set of principals explicitly granted the
         permission named ``permission`` according to the ACL directly
@@ -138,3 +208,124 @@ class ACLAuthorizationPolicy(object):
             allowed.update(allowed_here)
 
         return allowed
+
+
+def _find_location_ace(location, acl, principals, permission):
+    # Return the ACL of ``location`` (given its ``__acl__``, which is called
+    # if it is callable) and its first ACE matching ``principals`` and
+    # ``permission``, or ``None``.
+    if acl and callable(acl):
+        # callables typically build a new ACL each time; compiling it would
+        # cost more than a single scan
+        acl = acl()
+        return acl, _find_ace(acl, principals, permission)
+    if acl is not _class_acl(location.__class__):
+        # ACLs assigned to instances or returned by properties are often
+        # built anew on each request, so only ACLs which are attributes of
+        # classes are compiled
+        return acl, _find_ace(acl, principals, permission)
+    return acl, _find_compiled_ace(acl, principals, permission)
+
+
+def _class_acl(cls):
+    # Return the ``__acl__`` attribute of ``cls`` as stored in the class
+    # (e.g. a property rather than the ACL it returns), or ``None``; this is
+    # much quicker than ``inspect.getattr_static``.
+    for klass in cls.__mro__:
+        attrs = klass.__dict__
+        if '__acl__' in attrs:
+            return attrs['__acl__']
+    return None
+
+
+def _find_ace(acl, principals, permission):
+    # Return the first ACE in ``acl`` which matches any of ``principals`` and
+    # ``permission``, or ``None``.
+    for ace in acl:
+        ace_action, ace_principal, ace_permissions = ace
+        if ace_principal in principals:
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            if permission in ace_permissions:
+                return ace
+    return None
+
+
+class _CompiledACL(object):
+    """ The ACEs of an ACL indexed by permission and principal."""
+
+    def __init__(self, acl):
+        # a copy of the ACL compiled, compared against the ACL to notice
+        # changes to it
+        self.aces = acl[:]
+        # permission -> principal -> index of the first matching ACE
+        self.permissions = {}
+        # indexes of ACEs whose permissions can only be tested with ``in``
+        # (e.g. ``ALL_PERMISSIONS``) or whose principal is unhashable
+        self.dynamic = []
+        for index, (ace_action, ace_principal, ace_permissions) in enumerate(
+            acl
+        ):
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            elif ace_permissions.__class__ not in _static_permissions:
+                self.dynamic.append(index)
+                continue
+            try:
+                for permission in ace_permissions:
+                    principals = self.permissions.setdefault(permission, {})
+                    principals.setdefault(ace_principal, index)
+            except TypeError:
+                # unhashable permission or principal
+                self.dynamic.append(index)
+
+    def find(self, principals, permission):
+        """ Return the first ACE which matches any of ``principals`` and
+        ``permission``, or ``None``.  Raises :exc:`TypeError` if a principal
+        or the permission is unhashable."""
+        found = None
+        by_principal = self.permissions.get(permission)
+        if by_principal:
+            for principal in principals:
+                index = by_principal.get(principal)
+                if index is not None and (found is None or index < found):
+                    found = index
+        for index in self.dynamic:
+            if found is not None and index > found:
+                break
+            ace_action, ace_principal, ace_permissions = self.aces[index]
+            if ace_principal in principals:
+                if not is_nonstr_iter(ace_permissions):
+                    ace_permissions = [ace_permissions]
+                if permission in ace_permissions:
+                    found = index
+                    break
+        if found is None:
+            return None
+        return self.aces[found]
+
+
+_static_permissions = (list, tuple, set, frozenset)
+
+# scanning a short ACL is quicker than looking up its compiled form
+_compile_min_aces = 8
+
+# id(acl) -> (acl, _CompiledACL); keeping a reference to the ACL ensures that
+# its id is not reused while it is cached
+_acl_cache = ClockCache(1000)
+
+
+def _find_compiled_ace(acl, principals, permission):
+    # As ``_find_ace``, using a cached ``_CompiledACL`` for list and tuple
+    # ACLs which are not short.
+    if acl.__class__ not in (list, tuple) or len(acl) < _compile_min_aces:
+        return _find_ace(acl, principals, permission)
+    key = id(acl)
+    cached = _acl_cache.get(key)
+    if cached is None or cached[0] is not acl or cached[1].aces != acl:
+        cached = (acl, _CompiledACL(acl))
+        _acl_cache.put(key, cached)
+    try:
+        return cached[1].find(principals, permission)
+    except TypeError:
+        return _find_ace(acl, principals, permission)
@@ -35,6 +35,8 @@ from pyramid.settings import aslist
 
 from pyramid.threadlocal import manager
 
+from pyramid.traversal import _resize_segment_cache
+
 from pyramid.util import WeakOrderedSet, get_callable_name, object_description
 
 from pyramid.config.actions import action_method, ActionState
@@ -362,7 +364,16 @@ class Configurator(
 
         self._fix_registry()
 
-        self._set_settings(settings)
+        settings = self._set_settings(settings)
+
+        miss_cache_size = settings['view_lookup_miss_cache_size']
+        if miss_cache_size:
+            registry._view_lookup_miss_cache_size = miss_cache_size
+            registry._clear_view_lookup_cache()
+
+        segment_cache_size = settings['path_segment_cache_size']
+        if segment_cache_size:
+            _resize_segment_cache(segment_cache_size)
 
         if isinstance(debug_logger, str):
             debug_logger = logging.getLogger(debug_logger)
@@ -506,6 +517,7 @@ class Configurator(
 
             def _clear_view_lookup_cache():
                 _registry._view_lookup_cache = {}
+                _registry._view_lookup_miss_cache = None
 
             _registry._clear_view_lookup_cache = _clear_view_lookup_cache
 
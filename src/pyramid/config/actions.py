@@ -1,7 +1,7 @@
 import functools
-import itertools
 import operator
 import sys
+import time
 import traceback
 from zope.interface import implementer
 
@@ -10,7 +10,7 @@ from pyramid.exceptions import (
     ConfigurationError,
     ConfigurationExecutionError,
 )
-from pyramid.interfaces import IActionInfo
+from pyramid.interfaces import IActionInfo, IDebugLogger
 from pyramid.registry import undefer
 from pyramid.util import is_nonstr_iter
 from pyramid.util import reraise
@@ -152,15 +152,33 @@ class ActionConfiguratorMixin(object):
             self.action_state.execute_actions(introspector=self.introspector)
         finally:
             self.end()
+        order_timings = self.action_state.order_timings
         self.action_state = ActionState()  # old actions have been processed
 
+        settings = self.registry.settings
+        if settings and settings.get('debug_commit'):
+            logger = self.registry.queryUtility(IDebugLogger)
+            if logger is not None:
+                for order, count, seconds in order_timings:
+                    logger.debug(
+                        'committed %d actions of order %s in %.3fs'
+                        % (count, order, seconds)
+                    )
+        if settings and settings.get('freeze_route_lookups'):
+            self._freeze_route_lookups()
+
 
 # this class is licensed under the ZPL (stolen from Zope)
 class ActionState(object):
+    timer = staticmethod(time.perf_counter)  # testing
+
     def __init__(self):
         # NB "actions" is an API, dep'd upon by pyramid_zcml's load_zcml func
         self.actions = []
         self._seen_files = set()
+        # (order, number of actions, seconds) for each order of actions run
+        # by the last call to execute_actions
+        self.order_timings = []
 
     def processSpec(self, spec):
         """Check whether a callable needs to be processed.  The ``spec``
@@ -271,6 +289,8 @@ class ActionState(object):
         [('f', (1,), {}), ('g', (8,), {})]
 
         """
+        timer = self.timer
+        order_timings = {}
         try:
             all_actions = []
             executed_actions = []
@@ -278,6 +298,7 @@ class ActionState(object):
             conflict_state = ConflictResolverState()
 
             while True:
+                start = timer()
                 # We clear the actions list prior to execution so if there
                 # are some new actions then we add them to the mix and resolve
                 # conflicts again. This orders the new actions as well as
@@ -323,10 +344,22 @@ class ActionState(object):
 
                 executed_actions.append(action)
 
+                # the time spent resolving and executing each action is
+                # accounted to its order
+                timing = order_timings.get(action['order'] or 0)
+                if timing is None:
+                    timing = order_timings[action['order'] or 0] = [0, 0.0]
+                timing[0] += 1
+                timing[1] += timer() - start
+
             self.actions = all_actions
             return executed_actions
 
         finally:
+            self.order_timings = [
+                (order, count, seconds)
+                for order, (count, seconds) in sorted(order_timings.items())
+            ]
             if clear:
                 self.actions = []
 
@@ -337,15 +370,16 @@ class ConflictResolverState(object):
         # that a new action does not conflict with something already executed
         self.resolved_ainfos = {}
 
-        # actions left over from a previous iteration
-        self.remaining_actions = []
+        # actions left over from a previous iteration, grouped by order and
+        # keyed by their position in the list of actions ("i")
+        self.remaining_actions = {}
 
         # after executing an action we memoize its order to avoid any new
         # actions sending us backward
         self.min_order = None
 
-        # unique tracks the index of the action so we need it to increase
-        # monotonically across invocations to resolveConflicts
+        # the position of the next action; it must increase monotonically
+        # across invocations to resolveConflicts
         self.start = 0
 
 
@@ -375,24 +409,24 @@ def resolveConflicts(actions, state=None):
     if state is None:
         state = ConflictResolverState()
 
-    # pick up where we left off last time, but track the new actions as well
-    state.remaining_actions.extend(normalize_actions(actions))
-    actions = state.remaining_actions
-
-    def orderandpos(v):
-        n, v = v
-        return (v['order'] or 0, n)
-
-    def orderonly(v):
-        n, v = v
-        return v['order'] or 0
-
-    sactions = sorted(enumerate(actions, start=state.start), key=orderandpos)
-    for order, actiongroup in itertools.groupby(sactions, orderonly):
+    # pick up where we left off last time, but track the new actions as well;
+    # the actions of each order are kept in the order they were added
+    remaining = state.remaining_actions
+    for action in normalize_actions(actions):
+        order = action['order'] or 0
+        actiongroup = remaining.get(order)
+        if actiongroup is None:
+            actiongroup = remaining[order] = {}
+        actiongroup[state.start] = action
+        state.start += 1
+
+    while remaining:
         # "order" is an integer grouping. Actions in a lower order will be
         # executed before actions in a higher order.  All of the actions in
         # one grouping will be executed (its callable, if any will be called)
         # before any of the actions in the next.
+        order = min(remaining)
+        actiongroup = remaining[order]
         output = []
         unique = {}
 
@@ -404,12 +438,12 @@ def resolveConflicts(actions, state=None):
                     order, state.min_order
                 )
             ]
-            for i, action in actiongroup:
+            for action in actiongroup.values():
                 for line in str(action['info']).rstrip().split('\n'):
                     r.append("  " + line)
             raise ConfigurationError('\n'.join(r))
 
-        for i, action in actiongroup:
+        for i, action in actiongroup.items():
             # Within an order, actions are executed sequentially based on
             # original action ordering ("i").
 
@@ -483,12 +517,21 @@ def resolveConflicts(actions, state=None):
         if conflicts:
             raise ConfigurationConflictError(conflicts)
 
-        # sort resolved actions by "i" and yield them one by one
-        for i, action in sorted(output, key=operator.itemgetter(0)):
+        # overridden actions are dropped; only the resolved actions remain
+        # until they are yielded
+        output.sort(key=operator.itemgetter(0))
+        if output:
+            actiongroup = remaining[order] = dict(output)
+        else:
+            del remaining[order]
+
+        # yield the resolved actions one by one
+        for i, action in output:
             # do not memoize the order until we resolve an action inside it
             state.min_order = action['order']
-            state.start = i + 1
-            state.remaining_actions.remove(action)
+            del actiongroup[i]
+            if not actiongroup:
+                del remaining[order]
             state.resolved_ainfos[action['discriminator']] = (i, action)
             yield action
 
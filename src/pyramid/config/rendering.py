@@ -5,6 +5,7 @@ from pyramid.config.actions import action_method
 
 DEFAULT_RENDERERS = (
     ('json', renderers.json_renderer_factory),
+    ('json-stream', renderers.JSONStream()),
     ('string', renderers.string_renderer_factory),
 )
 
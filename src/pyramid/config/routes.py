@@ -13,6 +13,7 @@ from pyramid.exceptions import ConfigurationError
 import pyramid.predicates
 from pyramid.request import route_request_iface
 from pyramid.urldispatch import RoutesMapper
+from pyramid.view import _freeze_route_view_lookups
 
 from pyramid.util import as_sorted_tuple, is_nonstr_iter
 
@@ -535,6 +536,14 @@ class RoutesConfiguratorMixin(object):
         ):
             self.add_route_predicate(name, factory)
 
+    def _freeze_route_lookups(self):
+        # resolve the request interface of every route up front so that the
+        # router does not need to query the registry for it on each request;
+        # the lookups are discarded by the router as soon as views are added
+        mapper = self.registry.queryUtility(IRoutesMapper)
+        if mapper is not None:
+            _freeze_route_view_lookups(self.registry, mapper)
+
     def get_routes_mapper(self):
         """ Return the :term:`routes mapper` object associated with
         this configurator's :term:`registry`."""
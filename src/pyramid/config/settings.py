@@ -91,6 +91,8 @@ def Settings(d=None, _environ_=os.environ, **kw):
     O('debug_routematch', 'debug_all')
     S('debug_templates', 'PYRAMID_DEBUG_TEMPLATES', asbool)
     O('debug_templates', 'debug_all')
+    S('debug_commit', 'PYRAMID_DEBUG_COMMIT', asbool)
+    O('debug_commit', 'debug_all')
 
     S('reload_all', 'PYRAMID_RELOAD_ALL', asbool)
     S('reload_templates', 'PYRAMID_RELOAD_TEMPLATES', asbool)
@@ -106,6 +108,14 @@ def Settings(d=None, _environ_=os.environ, **kw):
     S('default_locale_name', 'PYRAMID_DEFAULT_LOCALE_NAME', str, 'en')
     S('prevent_http_cache', 'PYRAMID_PREVENT_HTTP_CACHE', asbool)
     S('prevent_cachebust', 'PYRAMID_PREVENT_CACHEBUST', asbool)
+    S('freeze_route_lookups', 'PYRAMID_FREEZE_ROUTE_LOOKUPS', asbool)
     S('csrf_trusted_origins', 'PYRAMID_CSRF_TRUSTED_ORIGINS', aslist, [])
+    S(
+        'view_lookup_miss_cache_size',
+        'PYRAMID_VIEW_LOOKUP_MISS_CACHE_SIZE',
+        int,
+        0,
+    )
+    S('path_segment_cache_size', 'PYRAMID_PATH_SEGMENT_CACHE_SIZE', int, 0)
 
     return d
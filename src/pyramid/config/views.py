@@ -95,6 +95,7 @@ class MultiView(object):
         self.media_views = {}
         self.views = []
         self.accepts = []
+        self.plans = {}
 
     def __discriminator__(self, context, request):
         # used by introspection systems like so:
@@ -106,6 +107,10 @@ class MultiView(object):
         return view.__discriminator__(context, request)
 
     def add(self, view, order, phash=None, accept=None, accept_order=None):
+        self._add(view, order, phash, accept, accept_order)
+        self._compile_plans()
+
+    def _add(self, view, order, phash, accept, accept_order):
         if phash is not None:
             for i, (s, v, h) in enumerate(list(self.views)):
                 if phash == h:
@@ -131,6 +136,38 @@ class MultiView(object):
                 accept_order = [v for _, v in accept_order.sorted()]
             self.accepts = sort_accept_offers(accepts, accept_order)
 
+    def _compile_plans(self):
+        # Build a decision table mapping the id of each predicated view to
+        # its predicates and the view it wraps.  Predicates which are
+        # logically the same (equal phash) share a key so that __call__
+        # evaluates each of them at most once per request no matter how many
+        # views use it.  Views whose predicates cannot be inspected get no
+        # plan and are simply called.
+        predicate_keys = {}
+        plans = {}
+        all_views = list(self.views)
+        for subset in self.media_views.values():
+            all_views.extend(subset)
+        for order, view, phash in all_views:
+            preds = getattr(view, '__predicates__', None)
+            unpredicated = getattr(view, '__unpredicated__', None)
+            if not isinstance(preds, (list, tuple)) or unpredicated is None:
+                continue
+            checks = []
+            for pred in preds:
+                try:
+                    hashes = pred.phash()
+                except AttributeError:
+                    hashes = id(pred)
+                if is_nonstr_iter(hashes):
+                    hashes = tuple(hashes)
+                key = predicate_keys.setdefault(
+                    (pred.__class__, hashes), len(predicate_keys)
+                )
+                checks.append((key, pred))
+            plans[id(view)] = (checks, unpredicated)
+        self.plans = plans
+
     def get_views(self, request):
         if self.accepts and hasattr(request, 'accept'):
             views = []
@@ -160,7 +197,23 @@ class MultiView(object):
         return view(context, request)
 
     def __call__(self, context, request):
+        plans = self.plans
+        results = {}
         for order, view, phash in self.get_views(request):
+            plan = plans.get(id(view))
+            if plan is not None:
+                checks, view = plan
+                matched = True
+                for key, predicate in checks:
+                    if key in results:
+                        result = results[key]
+                    else:
+                        result = results[key] = predicate(context, request)
+                    if not result:
+                        matched = False
+                        break
+                if not matched:
+                    continue
             try:
                 return view(context, request)
             except PredicateMismatch:
@@ -214,6 +267,8 @@ def predicated_view(view, info):
 
     predicate_wrapper.__predicated__ = checker
     predicate_wrapper.__predicates__ = preds
+    # used by MultiView to call the view once it has checked the predicates
+    predicate_wrapper.__unpredicated__ = view
     return predicate_wrapper
 
 
@@ -1999,6 +2054,23 @@ class ViewsConfiguratorMixin(object):
         viewing.  If ``permission`` is specified, the security checking will
         be performed against the default root factory ACL.
 
+        The ``stat_cache_ttl`` keyword argument enables caching of the
+        location, size, modification time and content type of the files
+        served, revalidating each cached file against the disk once every
+        ``stat_cache_ttl`` seconds.  By default, this argument is ``None``,
+        meaning that every request looks up the file on disk.  See
+        :class:`pyramid.static.static_view` for more information.
+
+        The ``precompressed`` keyword argument, if ``True``, serves the
+        ``.br`` or ``.gz`` sibling of a requested file (e.g. ``app.js.br``
+        for ``app.js``) with the matching ``Content-Encoding`` if the client
+        accepts that encoding.  By default, this argument is ``False``.
+
+        The ``memory_cache_size`` keyword argument enables serving small
+        files from memory.  It is the maximum number of bytes of file
+        contents kept in memory.  By default, this argument is ``None``,
+        meaning that every file is read from disk.
+
         Any other keyword arguments sent to ``add_static_view`` are passed on
         to :meth:`pyramid.config.Configurator.add_route` (e.g. ``factory``,
         perhaps to define a custom factory with a custom ACL for this static
@@ -2236,10 +2308,18 @@ class StaticURLInfo(object):
             # it's a view name
             url = None
             cache_max_age = extra.pop('cache_max_age', None)
+            stat_cache_ttl = extra.pop('stat_cache_ttl', None)
+            precompressed = extra.pop('precompressed', False)
+            memory_cache_size = extra.pop('memory_cache_size', None)
 
             # create a view
             view = static_view(
-                spec, cache_max_age=cache_max_age, use_subpath=True
+                spec,
+                cache_max_age=cache_max_age,
+                use_subpath=True,
+                stat_cache_ttl=stat_cache_ttl,
+                precompressed=precompressed,
+                memory_cache_size=memory_cache_size,
             )
 
             # Mutate extra to allow factory, etc to be passed through here.
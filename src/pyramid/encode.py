@@ -1,3 +1,5 @@
+from functools import lru_cache
+import re
 from urllib.parse import quote as _url_quote
 from urllib.parse import quote_plus as _quote_plus
 
@@ -55,6 +57,10 @@ def urlencode(query, doseq=True, quote_via=quote_plus):
        Added the ``quote_via`` argument to allow alternate quoting algorithms
        to be used.
 
+    .. versionchanged:: 2.0
+       A key whose value is an empty sequence no longer causes the result to
+       start with a stray ``&``.
+
     """
     try:
         # presumed to be a dictionary
@@ -62,23 +68,50 @@ def urlencode(query, doseq=True, quote_via=quote_plus):
     except AttributeError:
         pass
 
-    result = ''
-    prefix = ''
+    if quote_via is quote_plus:
+        quote_key = _quote_plus_key
+        quote_value = _quote_plus_value
+    else:
+        quote_key = quote_value = quote_via
+
+    parts = []
+    append = parts.append
 
     for (k, v) in query:
-        k = quote_via(k)
+        if k.__class__ is str:
+            k = quote_key(k)
+        else:
+            k = quote_via(k)
 
         if is_nonstr_iter(v):
             for x in v:
-                x = quote_via(x)
-                result += '%s%s=%s' % (prefix, k, x)
-                prefix = '&'
+                append(k + '=' + quote_value(x))
         elif v is None:
-            result += '%s%s=' % (prefix, k)
+            append(k + '=')
         else:
-            v = quote_via(v)
-            result += '%s%s=%s' % (prefix, k, v)
+            append(k + '=' + quote_value(v))
+
+    return '&'.join(parts)
+
+
+# matches the strings which quote_plus leaves untouched because they only
+# contain ASCII letters and digits
+_unquoted_value = re.compile(r'[A-Za-z0-9]+\Z').match
+
+
+def _quote_plus_value(val):
+    # quote_plus leaves ASCII letters and digits (and the digits and sign of
+    # an integer) untouched, so skip it for such values
+    cls = val.__class__
+    if cls is str:
+        if _unquoted_value(val):
+            return val
+    elif cls is int:
+        return str(val)
+    return quote_plus(val)
 
-        prefix = '&'
 
-    return result
+@lru_cache(1000)
+def _quote_plus_key(key):
+    # query string keys come from a small set of names; only called for str
+    return _quote_plus_value(key)
@@ -442,6 +442,10 @@ class IRendererFactory(Interface):
         """ Return an object that implements
         :class:`pyramid.interfaces.IRenderer`. ``info`` is an
         object that implements :class:`pyramid.interfaces.IRendererInfo`.
+
+        The returned renderer is reused for every request rendered by the
+        same view and may be called by several threads at once, so it must
+        not keep per-request state.
         """
 
 
@@ -554,6 +558,11 @@ class IAuthorizationPolicy(Interface):
         ``pyramid.security.principals_allowed_by_permission`` API is
         used."""
 
+    # An authorization policy may also supply an optional method
+    # ``permits_many(contexts, principals, permission)`` returning a list of
+    # the results of ``permits`` for each of ``contexts``; it is used by
+    # ``request.has_permissions`` when present.
+
 
 class IMultiDict(IDict):  # docs-only interface
     """
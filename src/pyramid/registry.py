@@ -1,7 +1,7 @@
 import operator
 import threading
 
-from zope.interface import implementer
+from zope.interface import implementedBy, implementer
 from zope.interface.registry import Components
 
 from pyramid.decorator import reify
@@ -10,6 +10,8 @@ from pyramid.interfaces import IIntrospector, IIntrospectable, ISettings
 
 from pyramid.path import CALLER_PACKAGE, caller_package
 
+from pyramid.util import LRUCache
+
 
 class Registry(Components, dict):
     """ A registry object is an :term:`application registry`.
@@ -46,6 +48,10 @@ class Registry(Components, dict):
 
     _settings = None
 
+    # the maximum number of view lookup misses to remember; the miss cache is
+    # disabled when this is zero
+    _view_lookup_miss_cache_size = 0
+
     def __init__(self, package_name=CALLER_PACKAGE, *args, **kw):
         # add a registry-instance-specific lock, which is used when the lookup
         # cache is mutated
@@ -59,6 +65,8 @@ class Registry(Components, dict):
 
     def _clear_view_lookup_cache(self):
         self._view_lookup_cache = {}
+        size = self._view_lookup_miss_cache_size
+        self._view_lookup_miss_cache = LRUCache(size) if size else None
 
     def __nonzero__(self):
         # defeat bool determination via dict.__len__
@@ -100,6 +108,16 @@ class Registry(Components, dict):
         self.has_listeners = True
         return result
 
+    def _has_subscribers(self, event_class):
+        # whether notifying an instance of event_class would call any
+        # subscriber; zope caches the subscriptions lookup and invalidates
+        # it whenever a subscriber is (un)registered
+        if not self.has_listeners:
+            return False
+        return bool(
+            self.adapters.subscriptions([implementedBy(event_class)], None)
+        )
+
     def notify(self, *events):
         if self.has_listeners:
             # iterating over subscribers assures they get executed
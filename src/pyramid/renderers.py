@@ -167,19 +167,31 @@ def get_renderer(renderer_name, package=None, registry=None):
 
 def string_renderer_factory(info):
     def _render(value, system):
-        if not isinstance(value, str):
-            value = str(value)
         request = system.get('request')
+        response = None
         if request is not None:
             response = request.response
             ct = response.content_type
             if ct == response.default_content_type:
                 response.content_type = 'text/plain'
+        if hasattr(value, '__next__'):
+            # an iterator (e.g. a generator) of strings is streamed
+            charset = getattr(response, 'charset', None) or 'utf-8'
+            return _iterencode_strings(value, charset)
+        if not isinstance(value, str):
+            value = str(value)
         return value
 
     return _render
 
 
+def _iterencode_strings(chunks, charset):
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            chunk = str(chunk)
+        yield chunk.encode(charset)
+
+
 _marker = object()
 
 
@@ -226,9 +238,24 @@ class JSON(object):
         explained in :ref:`json_serializing_custom_objects` instead
         of replacing the serializer.
 
+        The serializer may return bytes rather than a string, in which case
+        they are used as the response body as-is.  This allows serializers
+        implemented in C which produce UTF-8 encoded JSON directly, such as
+        ``orjson.dumps``, to be used without decoding and re-encoding their
+        output.
+
+    The adapter (or ``__json__`` method) used to serialize an object is looked
+    up once per class of object and reused for other objects of the same
+    class, unless the object provides interfaces of its own or has a
+    ``__json__`` attribute which its class does not.
+
     .. versionadded:: 1.4
        Prior to this version, there was no public API for supplying options
        to the underlying serializer without defining a custom renderer.
+
+    .. versionchanged:: 2.0
+       The serializer may return bytes, and adapter lookups are cached per
+       class.
     """
 
     def __init__(self, serializer=json.dumps, adapters=(), **kw):
@@ -237,6 +264,9 @@ class JSON(object):
         self.serializer = serializer
         self.kw = kw
         self.components = Components()
+        # class -> adapter (or None) for instances of classes which do not
+        # define __json__ and do not provide interfaces of their own
+        self._adapter_cache = {}
         for type, adapter in adapters:
             self.add_adapter(type, adapter)
 
@@ -265,6 +295,7 @@ class JSON(object):
         self.components.registerAdapter(
             adapter, (type_or_iface,), IJSONAdapter
         )
+        self._adapter_cache = {}
 
     def __call__(self, info):
         """ Returns a plain JSON-encoded string with content-type
@@ -284,20 +315,129 @@ class JSON(object):
         return _render
 
     def _make_default(self, request):
+        adapter_cache = self._adapter_cache
+        lookup = self._lookup_adapter
+
         def default(obj):
-            if hasattr(obj, '__json__'):
-                return obj.__json__(request)
-            obj_iface = providedBy(obj)
-            adapters = self.components.adapters
-            result = adapters.lookup(
-                (obj_iface,), IJSONAdapter, default=_marker
-            )
-            if result is _marker:
+            instance_dict = getattr(obj, '__dict__', None)
+            if instance_dict and (
+                '__json__' in instance_dict or '__provides__' in instance_dict
+            ):
+                # the instance has a __json__ method or provides interfaces
+                # of its own, which other instances of its class may not
+                # share, so its adapter must not be cached per class
+                adapter = lookup(obj)
+            else:
+                cls = obj.__class__
+                adapter = adapter_cache.get(cls, _marker)
+                if adapter is _marker:
+                    adapter = adapter_cache[cls] = lookup(obj)
+            if adapter is None:
                 raise TypeError('%r is not JSON serializable' % (obj,))
-            return result(obj, request)
+            return adapter(obj, request)
 
         return default
 
+    def _lookup_adapter(self, obj):
+        if hasattr(obj, '__json__'):
+            return _call_json
+        adapters = self.components.adapters
+        return adapters.lookup((providedBy(obj),), IJSONAdapter)
+
+
+def _call_json(obj, request):
+    return obj.__json__(request)
+
+
+class JSONStream(JSON):
+    """ Renderer which encodes a value as JSON incrementally, returning an
+    iterator of bytes instead of a string.  The iterator becomes the
+    response's ``app_iter``, so the body is produced while the WSGI server
+    sends it and the whole payload is never held in memory at once.  The
+    response has no ``Content-Length`` and its content-type is set to
+    ``application/json`` unless it has already been changed.
+
+    An instance of this class is registered as the ``json-stream`` renderer
+    by default:
+
+    .. code-block:: python
+
+       from pyramid.view import view_config
+
+       @view_config(renderer='json-stream')
+       def export(request):
+           return (row.as_dict() for row in query_all_rows())
+
+    If the value is a list, a tuple or an iterator (such as a generator),
+    it is rendered as a JSON array, encoding one item at a time and
+    consuming the iterator lazily.  Any other value is encoded with
+    :meth:`json.JSONEncoder.iterencode`.  Chunks of roughly ``chunk_size``
+    bytes are yielded.
+
+    Objects which are not natively serializable are handled like they are
+    by :class:`pyramid.renderers.JSON`, and keyword arguments other than
+    ``chunk_size`` and ``adapters`` are passed to :class:`json.JSONEncoder`.
+
+    Because encoding happens after the view has returned, an error raised
+    while encoding cannot change the status of the response and results in
+    a truncated body.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, chunk_size=65536, adapters=(), **kw):
+        self.chunk_size = chunk_size
+        JSON.__init__(self, adapters=adapters, **kw)
+
+    def __call__(self, info):
+        """ Returns an iterator of JSON-encoded bytes with content-type
+        ``application/json``. The content-type may be overridden by
+        setting ``request.response.content_type``."""
+
+        def _render(value, system):
+            request = system.get('request')
+            if request is not None:
+                response = request.response
+                ct = response.content_type
+                if ct == response.default_content_type:
+                    response.content_type = 'application/json'
+            default = self._make_default(request)
+            encoder = json.JSONEncoder(default=default, **self.kw)
+            return self._iterencode(encoder, value)
+
+        return _render
+
+    def _iterencode(self, encoder, value):
+        if isinstance(value, (list, tuple)) or hasattr(value, '__next__'):
+            chunks = self._iterencode_array(encoder, value)
+        else:
+            chunks = encoder.iterencode(value)
+        chunk_size = self.chunk_size
+        buf = []
+        size = 0
+        for chunk in chunks:
+            buf.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                yield ''.join(buf).encode('utf-8')
+                buf = []
+                size = 0
+        if buf:
+            yield ''.join(buf).encode('utf-8')
+
+    def _iterencode_array(self, encoder, items):
+        encode = encoder.encode
+        separator = encoder.item_separator
+        yield '['
+        first = True
+        for item in items:
+            if first:
+                first = False
+            else:
+                yield separator
+            yield encode(item)
+        yield ']'
+
 
 json_renderer_factory = JSON()  # bw compat
 
@@ -393,7 +533,19 @@ class JSONP(JSON):
                         )
 
                     ct = 'application/javascript'
-                    body = '/**/{0}({1});'.format(callback, val)
+                    if isinstance(val, bytes):
+                        # bytes %-formatting needs Python 3.5
+                        body = b''.join(
+                            (
+                                b'/**/',
+                                callback.encode('utf-8'),
+                                b'(',
+                                val,
+                                b');',
+                            )
+                        )
+                    else:
+                        body = '/**/{0}({1});'.format(callback, val)
                 response = request.response
                 if response.content_type == response.default_content_type:
                     response.content_type = ct
@@ -461,10 +613,12 @@ class RendererHelper(object):
                 'get_csrf_token': partial(get_csrf_token, request),
             }
 
-        system_values = BeforeRender(system_values, value)
-
         registry = self.registry
-        registry.notify(system_values)
+        has_subscribers = getattr(registry, '_has_subscribers', None)
+        if has_subscribers is None or has_subscribers(BeforeRender):
+            system_values = BeforeRender(system_values, value)
+            registry.notify(system_values)
+
         result = renderer(value, system_values)
         return result
 
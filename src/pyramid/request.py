@@ -17,7 +17,7 @@ from pyramid.decorator import reify
 from pyramid.i18n import LocalizerRequestMixin
 from pyramid.response import Response, _get_response_factory
 from pyramid.security import AuthenticationAPIMixin, AuthorizationAPIMixin
-from pyramid.url import URLMethodsMixin
+from pyramid.url import URLMethodsMixin, _quote_script_name
 from pyramid.util import (
     InstancePropertyHelper,
     InstancePropertyMixin,
@@ -181,6 +181,20 @@ class Request(
 
     ResponseClass = Response
 
+    @property
+    def application_url(self):
+        """
+        The URL including SCRIPT_NAME (no PATH_INFO or query string)
+        """
+        # memoized for URL generation; see URLMethodsMixin
+        urls = self._get_application_urls()
+        url = urls.get(None)
+        if url is None:
+            url = urls[None] = self.host_url + _quote_script_name(
+                self.script_name, self.url_encoding
+            )
+        return url
+
     @reify
     def tmpl_context(self):
         # docs-deprecated template context for Pylons-like apps; do not
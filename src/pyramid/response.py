@@ -1,9 +1,10 @@
 import mimetypes
-from os.path import getmtime, getsize
+import os
 
 import venusian
 
 from webob import Response as _Response
+from webob.response import AppIterRange
 from zope.interface import implementer
 from pyramid.interfaces import IResponse, IResponseFactory
 
@@ -50,6 +51,17 @@ class FileResponse(Response):
     It's generally safe to leave this set to ``None`` if you're serving a
     binary file.  This argument will be ignored if you also leave
     ``content-type`` as ``None``.
+
+    Requests for a single byte range of the file are served by seeking to
+    the start of the range rather than by reading and discarding the bytes
+    which precede it.  When the web server does not offer
+    ``wsgi.file_wrapper``, the ``app_iter`` of the response is a
+    :class:`pyramid.response.FileIter`, which exposes the file descriptor
+    and the offset and length of the bytes to be served so that servers may
+    send them with ``os.sendfile``.
+
+    .. versionchanged:: 2.0
+       Byte ranges are served by seeking within the file.
     """
 
     def __init__(
@@ -67,22 +79,40 @@ class FileResponse(Response):
             content_type=content_type,
             content_encoding=content_encoding,
         )
-        self.last_modified = getmtime(path)
-        content_length = getsize(path)
         f = open(path, 'rb')
+        st = os.fstat(f.fileno())
+        self.last_modified = st.st_mtime
+        content_length = st.st_size
         app_iter = None
+        self._file = f
+        self._file_wrapper = self._wrapped_app_iter = None
         if request is not None:
             environ = request.environ
             if 'wsgi.file_wrapper' in environ:
-                app_iter = environ['wsgi.file_wrapper'](f, _BLOCK_SIZE)
+                self._file_wrapper = environ['wsgi.file_wrapper']
+                app_iter = self._file_wrapper(f, _BLOCK_SIZE)
+                self._wrapped_app_iter = app_iter
         if app_iter is None:
-            app_iter = FileIter(f, _BLOCK_SIZE)
+            app_iter = FileIter(f, _BLOCK_SIZE, offset=0)
         self.app_iter = app_iter
         # assignment of content_length must come after assignment of app_iter
         self.content_length = content_length
         if cache_max_age is not None:
             self.cache_expires = cache_max_age
 
+    def app_iter_range(self, start, stop):
+        app_iter = self._app_iter
+        if app_iter is not None and app_iter is self._wrapped_app_iter:
+            # The server's file wrapper serves the file from its current
+            # position up to the end of the file, so it may only be reused
+            # for ranges which extend to the end of the file; any other range
+            # is served with a FileIter that stops at ``stop``.
+            if stop is None or stop >= self.content_length:
+                self._file.seek(start)
+                return self._file_wrapper(self._file, _BLOCK_SIZE)
+            return FileIter(self._file, _BLOCK_SIZE, start, stop - start)
+        return super(FileResponse, self).app_iter_range(start, stop)
+
 
 class FileIter(object):
     """ A fixed-block-size iterator for use as a WSGI app_iter.
@@ -91,21 +121,71 @@ class FileIter(object):
     method that takes a size hint).
 
     ``block_size`` is an optional block size for iteration.
+
+    ``offset`` is the position in ``file`` of the first byte to serve.  If it
+    is ``None`` (the default), the bytes are served from the current position
+    of ``file``; otherwise ``file`` is first seeked to ``offset``.
+
+    ``length`` is the number of bytes to serve.  If it is ``None`` (the
+    default), the bytes are served up to the end of ``file``.
+
+    The ``offset`` and ``length`` attributes together with the ``fileno``
+    method allow a server to send the bytes with ``os.sendfile`` instead of
+    iterating.
+
+    .. versionchanged:: 2.0
+       Added the ``offset`` and ``length`` arguments, the ``fileno`` method
+       and the ``app_iter_range`` method.
     """
 
-    def __init__(self, file, block_size=_BLOCK_SIZE):
+    def __init__(self, file, block_size=_BLOCK_SIZE, offset=None, length=None):
         self.file = file
         self.block_size = block_size
+        if offset is not None:
+            file.seek(offset)
+        self.offset = offset
+        self.length = length
+        self.remaining = length
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        val = self.file.read(self.block_size)
+        size = self.block_size
+        remaining = self.remaining
+        if remaining is not None:
+            if remaining <= 0:
+                raise StopIteration
+            size = min(size, remaining)
+        val = self.file.read(size)
         if not val:
             raise StopIteration
+        if remaining is not None:
+            self.remaining = remaining - len(val)
         return val
 
+    def fileno(self):
+        """ Return the file descriptor of the underlying file."""
+        return self.file.fileno()
+
+    def app_iter_range(self, start, stop):
+        """ Return a new iterator which serves only the bytes ``start:stop``
+        of the bytes served by this iterator, seeking to ``start`` instead of
+        reading the bytes before it.  This is used by WebOb to serve
+        ``Range`` requests."""
+        offset = self.offset
+        if offset is None:
+            try:
+                offset = self.file.tell()
+            except (AttributeError, OSError):
+                return AppIterRange(self, start, stop)
+        if self.length is not None and (stop is None or stop > self.length):
+            stop = self.length
+        length = None if stop is None else max(stop - start, 0)
+        return self.__class__(
+            self.file, self.block_size, offset + start, length
+        )
+
     def close(self):
         self.file.close()
 
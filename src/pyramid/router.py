@@ -63,6 +63,7 @@ class Router(object):
 
         request.request_iface = IRequest
         context = None
+        view_lookup = None
         routes_mapper = self.routes_mapper
         debug_routematch = self.debug_routematch
         adapters = registry.adapters
@@ -103,9 +104,16 @@ class Router(object):
                     )
                     logger and logger.debug(msg)
 
-                request.request_iface = registry.queryUtility(
-                    IRouteRequest, name=route.name, default=IRequest
-                )
+                view_lookup = getattr(route, '_view_lookup', None)
+                if view_lookup is not None and view_lookup.is_current(
+                    registry
+                ):
+                    request.request_iface = view_lookup.request_iface
+                else:
+                    view_lookup = None
+                    request.request_iface = registry.queryUtility(
+                        IRouteRequest, name=route.name, default=IRequest
+                    )
 
                 root_factory = route.factory or self.root_factory
 
@@ -145,7 +153,12 @@ class Router(object):
         # find a view callable
         context_iface = providedBy(context)
         response = _call_view(
-            registry, request, context, context_iface, view_name
+            registry,
+            request,
+            context,
+            context_iface,
+            view_name,
+            view_lookup=view_lookup,
         )
 
         if response is None:
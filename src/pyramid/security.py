@@ -48,6 +48,15 @@ def _get_authentication_policy(request):
     return registry.queryUtility(IAuthenticationPolicy)
 
 
+def _get_callback_results(request):
+    # the results of authentication policy callbacks for this request,
+    # discarded by ``remember`` and ``forget``
+    results = getattr(request, '_authn_callback_results', None)
+    if results is None:
+        results = request._authn_callback_results = {}
+    return results
+
+
 def remember(request, userid, **kw):
     """
     Returns a sequence of header tuples (e.g. ``[('Set-Cookie', 'foo=abc')]``)
@@ -78,10 +87,15 @@ def remember(request, userid, **kw):
 
     .. versionchanged:: 1.10
         Removed the deprecated ``principal`` argument.
+
+    .. versionchanged:: 2.0
+        Discards the results of authentication policy callbacks remembered
+        for this request.
     """
     policy = _get_authentication_policy(request)
     if policy is None:
         return []
+    request._authn_callback_results = None
     return policy.remember(request, userid, **kw)
 
 
@@ -103,10 +117,15 @@ def forget(request):
 
     If no :term:`authentication policy` is in use, this function will
     always return an empty sequence.
+
+    .. versionchanged:: 2.0
+        Discards the results of authentication policy callbacks remembered
+        for this request.
     """
     policy = _get_authentication_policy(request)
     if policy is None:
         return []
+    request._authn_callback_results = None
     return policy.forget(request)
 
 
@@ -348,6 +367,16 @@ class AuthorizationAPIMixin(object):
 
         .. versionadded:: 1.5
 
+        .. versionchanged:: 2.0
+           When the :term:`authorization policy` is a
+           :class:`pyramid.authorization.ACLAuthorizationPolicy`, the result
+           is remembered for the rest of the request, keyed by the context,
+           the effective principals and the permission, so repeating a
+           check (e.g. once per row of a listing) does not consult the
+           policy again.  Changes made to the context's ACL later in the
+           same request are therefore not seen by a repeated check.  Other
+           authorization policies are consulted on every check.
+
         """
         if context is None:
             context = self.context
@@ -362,4 +391,74 @@ class AuthorizationAPIMixin(object):
                 'authorization policy'
             )  # should never happen
         principals = authn_policy.effective_principals(self)
-        return authz_policy.permits(context, principals, permission)
+        return _memoized_permits(
+            self, authz_policy, context, principals, permission
+        )
+
+    def has_permissions(self, permission, contexts):
+        """ Given a permission and a sequence of contexts, return a list
+        containing the result of :meth:`has_permission` for each context, in
+        order.
+
+        This is quicker than calling :meth:`has_permission` for each context
+        (e.g. each row of a table of resources): the effective principals
+        are computed once, and if the :term:`authorization policy` supplies
+        a ``permits_many`` method, as
+        :class:`pyramid.authorization.ACLAuthorizationPolicy` does, the
+        contexts are checked in a single call, which consults the ACLs of
+        their shared ancestors only once.
+
+        :param permission: Does this request have the given permission?
+        :type permission: str
+        :param contexts: An iterable of resource objects
+        :returns: A list of :class:`pyramid.security.Allowed` or
+                  :class:`pyramid.security.Denied` instances.
+
+        .. versionadded:: 2.0
+
+        """
+        reg = _get_registry(self)
+        authn_policy = reg.queryUtility(IAuthenticationPolicy)
+        if authn_policy is None:
+            allowed = Allowed('No authentication policy in use.')
+            return [allowed for context in contexts]
+        authz_policy = reg.queryUtility(IAuthorizationPolicy)
+        if authz_policy is None:
+            raise ValueError(
+                'Authentication policy registered without '
+                'authorization policy'
+            )  # should never happen
+        principals = authn_policy.effective_principals(self)
+        permits_many = getattr(authz_policy, 'permits_many', None)
+        if permits_many is not None:
+            return permits_many(contexts, principals, permission)
+        return [
+            authz_policy.permits(context, principals, permission)
+            for context in contexts
+        ]
+
+
+def _memoized_permits(request, policy, context, principals, permission):
+    from pyramid.authorization import ACLAuthorizationPolicy
+
+    # other policies may depend on more than the context, the principals and
+    # the permission (e.g. the time or the state of the request)
+    if policy.__class__.permits is not ACLAuthorizationPolicy.permits:
+        return policy.permits(context, principals, permission)
+    # the memo is discarded if the request's authorization policy changes
+    memo = getattr(request, '_permits_memo', None)
+    if memo is None or memo[0] is not policy:
+        memo = request._permits_memo = (policy, {})
+    try:
+        key = (id(context), frozenset(principals), permission)
+        cached = memo[1].get(key)
+    except TypeError:
+        # unhashable principals or permission
+        return policy.permits(context, principals, permission)
+    # the memo keeps a reference to the context, so that its id cannot be
+    # reused by another context during the request
+    if cached is not None and cached[0] is context:
+        return cached[1]
+    result = policy.permits(context, principals, permission)
+    memo[1][key] = (context, result)
+    return result
@@ -1,7 +1,10 @@
 import binascii
+import json
 import os
 import pickle
+import threading
 import time
+import zlib
 
 from zope.deprecation import deprecated
 from zope.interface import implementer
@@ -73,6 +76,131 @@ class PickleSerializer(object):
 JSONSerializer = JSONSerializer  # api
 
 
+class CompactJSONSerializer(object):
+    """ A serializer that dumps Python data to compact UTF-8 encoded JSON,
+    omitting the whitespace which :class:`pyramid.session.JSONSerializer`
+    puts after separators.
+
+    If ``compress_threshold`` is an integer, payloads longer than that many
+    bytes are compressed with :mod:`zlib` at the given ``level`` when doing
+    so makes them shorter.  Compressed payloads are prefixed with ``z`` (a
+    character no JSON document starts with) so that ``loads`` accepts both
+    forms.  Defaults to ``None`` (never compress).
+
+    .. versionadded:: 2.0
+
+    """
+
+    def __init__(self, compress_threshold=None, level=6):
+        self.compress_threshold = compress_threshold
+        self.level = level
+
+    def loads(self, bstruct):
+        """Accept bytes and return a Python object."""
+        try:
+            if bstruct[:1] == b'z':
+                bstruct = zlib.decompress(bstruct[1:])
+            return json.loads(bstruct.decode('utf-8'))
+        except (zlib.error, UnicodeDecodeError):
+            raise ValueError
+
+    def dumps(self, appstruct):
+        """Accept a Python object and return bytes."""
+        bstruct = json.dumps(appstruct, separators=(',', ':')).encode('utf-8')
+        threshold = self.compress_threshold
+        if threshold is not None and len(bstruct) > threshold:
+            compressed = b'z' + zlib.compress(bstruct, self.level)
+            if len(compressed) < len(bstruct):
+                return compressed
+        return bstruct
+
+
+class MeteredSerializer(object):
+    """ A serializer which delegates to ``serializer`` and keeps count of
+    the number of ``dumps`` and ``loads`` calls, the time spent in each and
+    the size of the serialized values, so that the cost of a session
+    serializer can be monitored.  The counters are available from
+    :meth:`stats`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    timer = staticmethod(time.perf_counter)  # testing
+
+    def __init__(self, serializer):
+        self.serializer = serializer
+        self._lock = threading.Lock()
+        self.dumps_count = 0
+        self.dumps_time = 0.0
+        self.loads_count = 0
+        self.loads_time = 0.0
+        self.loads_errors = 0
+        self.total_size = 0
+        self.max_size = 0
+
+    def loads(self, bstruct):
+        """Accept bytes and return a Python object."""
+        start = self.timer()
+        try:
+            return self.serializer.loads(bstruct)
+        except ValueError:
+            with self._lock:
+                self.loads_errors += 1
+            raise
+        finally:
+            elapsed = self.timer() - start
+            with self._lock:
+                self.loads_count += 1
+                self.loads_time += elapsed
+
+    def dumps(self, appstruct):
+        """Accept a Python object and return bytes."""
+        start = self.timer()
+        bstruct = self.serializer.dumps(appstruct)
+        elapsed = self.timer() - start
+        size = len(bstruct)
+        with self._lock:
+            self.dumps_count += 1
+            self.dumps_time += elapsed
+            self.total_size += size
+            if size > self.max_size:
+                self.max_size = size
+        return bstruct
+
+    def stats(self):
+        """ Return a dictionary of the counters."""
+        return {
+            'dumps': self.dumps_count,
+            'dumps_time': self.dumps_time,
+            'loads': self.loads_count,
+            'loads_time': self.loads_time,
+            'loads_errors': self.loads_errors,
+            'total_size': self.total_size,
+            'max_size': self.max_size,
+        }
+
+
+_serializer_factories = {
+    'json': JSONSerializer,
+    'compact_json': CompactJSONSerializer,
+    'pickle': PickleSerializer,
+}
+
+
+def _make_serializer(serializer):
+    if isinstance(serializer, str):
+        try:
+            factory = _serializer_factories[serializer]
+        except KeyError:
+            raise ValueError(
+                'Unknown session serializer %r, expected one of %s'
+                % (serializer, ', '.join(sorted(_serializer_factories)))
+            )
+        serializer = factory()
+    return serializer
+
+
 def BaseCookieSessionFactory(
     serializer,
     cookie_name='session',
@@ -85,6 +213,7 @@ def BaseCookieSessionFactory(
     timeout=1200,
     reissue_time=0,
     set_on_exception=True,
+    collect_stats=False,
 ):
     """
     Configure a :term:`session factory` which will provide cookie-based
@@ -110,7 +239,9 @@ def BaseCookieSessionFactory(
       An object with two methods: ``loads`` and ``dumps``.  The ``loads``
       method should accept bytes and return a Python object.  The ``dumps``
       method should accept a Python object and return bytes.  A ``ValueError``
-      should be raised for malformed inputs.
+      should be raised for malformed inputs.  The name of a built-in
+      serializer (``'json'``, ``'compact_json'`` or ``'pickle'``) may be
+      passed instead.
 
     ``cookie_name``
       The name of the cookie used for sessioning. Default: ``'session'``.
@@ -164,12 +295,30 @@ def BaseCookieSessionFactory(
       If ``True``, set a session cookie even if an exception occurs
       while rendering a view. Default: ``True``.
 
+    ``collect_stats``
+      If ``True``, wrap the serializer in a
+      :class:`pyramid.session.MeteredSerializer` which counts the size of the
+      session cookies written and the time spent serializing and
+      deserializing them.  The counters are available from
+      ``factory.serializer.stats()``.  Default: ``False``.
+
+    The serializer used by the sessions is available as the ``serializer``
+    attribute of the returned session factory.
+
     .. versionadded: 1.5a3
 
     .. versionchanged: 1.10
 
        Added the ``samesite`` option and made the default ``'Lax'``.
+
+    .. versionchanged: 2.0
+
+       Added the ``collect_stats`` option and accept the name of a built-in
+       ``serializer``.
     """
+    serializer = _make_serializer(serializer)
+    if collect_stats:
+        serializer = MeteredSerializer(serializer)
 
     @implementer(ISession)
     class CookieSession(dict):
@@ -325,6 +474,7 @@ def BaseCookieSessionFactory(
             )
             return True
 
+    CookieSession.serializer = serializer
     return CookieSession
 
 
@@ -343,6 +493,7 @@ def SignedCookieSessionFactory(
     hashalg='sha512',
     salt='pyramid.session.',
     serializer=None,
+    collect_stats=False,
 ):
     """
     Configure a :term:`session factory` which will provide signed
@@ -433,8 +584,21 @@ def SignedCookieSessionFactory(
       An object with two methods: ``loads`` and ``dumps``.  The ``loads``
       method should accept bytes and return a Python object.  The ``dumps``
       method should accept a Python object and return bytes.  A ``ValueError``
-      should be raised for malformed inputs.  If a serializer is not passed,
-      the :class:`pyramid.session.JSONSerializer` serializer will be used.
+      should be raised for malformed inputs.  The name of a built-in
+      serializer (``'json'``, ``'compact_json'`` or ``'pickle'``) may be
+      passed instead.  If a serializer is not passed, the
+      :class:`pyramid.session.JSONSerializer` serializer will be used.
+
+      ``'compact_json'`` selects a
+      :class:`pyramid.session.CompactJSONSerializer`, which produces smaller
+      cookies than the default.  Pass an instance with a
+      ``compress_threshold`` to also compress large sessions.
+
+    ``collect_stats``
+      If ``True``, count the size of the session cookies written and the time
+      spent serializing, signing and deserializing them.  The counters are
+      available from ``factory.serializer.stats()``; see
+      :class:`pyramid.session.MeteredSerializer`.  Default: ``False``.
 
     .. warning::
 
@@ -452,11 +616,14 @@ def SignedCookieSessionFactory(
     .. versionchanged: 2.0
 
         Changed the default ``serializer`` to be an instance of
-        :class:`pyramid.session.JSONSerializer`.
+        :class:`pyramid.session.JSONSerializer`.  Added the
+        ``collect_stats`` option and accept the name of a built-in
+        ``serializer``.
 
     """
     if serializer is None:
         serializer = JSONSerializer()
+    serializer = _make_serializer(serializer)
 
     signed_serializer = SignedSerializer(
         secret, salt, hashalg, serializer=serializer
@@ -474,6 +641,7 @@ def SignedCookieSessionFactory(
         timeout=timeout,
         reissue_time=reissue_time,
         set_on_exception=set_on_exception,
+        collect_stats=collect_stats,
     )
 
 
@@ -1,22 +1,29 @@
 # -*- coding: utf-8 -*-
+from datetime import datetime, timezone
 from functools import lru_cache
 import json
 import os
+import stat
+import time
 
 from os.path import getmtime, normcase, normpath, join, isdir, exists
 
 from pkg_resources import resource_exists, resource_filename, resource_isdir
 
+from webob.acceptparse import AcceptEncodingValidHeader
+
 from pyramid.asset import abspath_from_asset_spec, resolve_asset_spec
 
 from pyramid.httpexceptions import HTTPNotFound, HTTPMovedPermanently
 
 from pyramid.path import caller_package
 
-from pyramid.response import _guess_type, FileResponse
+from pyramid.response import _guess_type, FileResponse, Response
 
 from pyramid.traversal import traversal_path_info
 
+from pyramid.util import LRUCache
+
 
 class static_view(object):
     """ An instance of this class is a callable which can act as a
@@ -53,6 +60,45 @@ class static_view(object):
     the static application will consider request.environ[``PATH_INFO``] as
     ``PATH_INFO`` input. By default, this is ``False``.
 
+    ``stat_cache_ttl`` enables a cache of the files served by the view.  For
+    each requested path the cache remembers the resolved file path, its size,
+    modification time and content type, so that serving a cached file does not
+    need to look it up on disk (or through ``pkg_resources``) again.  Each
+    entry is revalidated against the disk once it is older than
+    ``stat_cache_ttl`` seconds.  By default, this is ``None``, which disables
+    the cache.
+
+    ``stat_cache_size`` is the maximum number of paths kept in the cache;
+    the least recently used paths are discarded first.  Cache statistics are
+    available from ``static_view.stat_cache.stats()`` (see
+    :class:`pyramid.util.LRUCache`).
+
+    ``precompressed`` enables serving precompressed variants of the static
+    files.  If it is ``True``, a request for ``foo.js`` is answered with the
+    contents of ``foo.js.br`` or ``foo.js.gz`` (in that order of preference)
+    if such a file exists next to ``foo.js`` and the client's
+    ``Accept-Encoding`` header accepts the ``br`` or ``gzip`` content
+    encoding.  The response carries the matching ``Content-Encoding`` and the
+    ``Content-Type`` of ``foo.js``.  Responses for files which have a
+    precompressed variant always include ``Vary: Accept-Encoding``.  By
+    default, this is ``False``.
+
+    Responses carry a strong ``ETag`` derived from the inode, size and
+    modification time of the file served.  Conditional ``GET`` and ``HEAD``
+    requests whose ``If-None-Match`` or ``If-Modified-Since`` header matches
+    the file are answered with a ``304 Not Modified`` response without
+    opening the file.
+
+    ``memory_cache_size`` enables a cache of the contents of small files, so
+    that they are served from memory rather than read from disk on every
+    request.  It is the maximum total number of bytes held by the cache; the
+    least recently used files are discarded first.  Only files of at most
+    ``memory_cache_file_size`` bytes (32 KiB by default) are cached.  A
+    cached file is read again as soon as its inode, size or modification
+    time change; combine it with ``stat_cache_ttl`` to also avoid looking
+    the file up on every request.  By default, ``memory_cache_size`` is
+    ``None``, which disables the cache.
+
     .. note::
 
        If the ``root_dir`` is relative to a :term:`package`, or is a
@@ -61,8 +107,15 @@ class static_view(object):
        assets within the named ``root_dir`` package-relative directory.
        However, if the ``root_dir`` is absolute, configuration will not be able
        to override the assets it contains.
+
+    .. versionchanged:: 2.0
+       Added the ``stat_cache_ttl``, ``stat_cache_size``, ``precompressed``,
+       ``memory_cache_size`` and ``memory_cache_file_size`` arguments, the
+       ``ETag`` header and the ``304 Not Modified`` responses.
     """
 
+    monotonic = staticmethod(time.monotonic)  # testing
+
     def __init__(
         self,
         root_dir,
@@ -70,6 +123,11 @@ class static_view(object):
         package_name=None,
         use_subpath=False,
         index='index.html',
+        stat_cache_ttl=None,
+        stat_cache_size=1000,
+        precompressed=False,
+        memory_cache_size=None,
+        memory_cache_file_size=32 * 1024,
     ):
         # package_name is for bw compat; it is preferred to pass in a
         # package-relative path as root_dir
@@ -83,6 +141,17 @@ class static_view(object):
         self.docroot = docroot
         self.norm_docroot = normcase(normpath(docroot))
         self.index = index
+        self.stat_cache_ttl = stat_cache_ttl
+        self.stat_cache = None
+        if stat_cache_ttl is not None:
+            self.stat_cache = LRUCache(stat_cache_size)
+        self.precompressed = precompressed
+        self.memory_cache = None
+        if memory_cache_size is not None:
+            self.memory_cache = LRUCache(
+                memory_cache_size, lambda cached: len(cached.body)
+            )
+        self.memory_cache_file_size = memory_cache_file_size
 
     def __call__(self, context, request):
         if self.use_subpath:
@@ -94,39 +163,190 @@ class static_view(object):
         if path is None:
             raise HTTPNotFound('Out of bounds: %s' % request.url)
 
+        info = self._get_file_info(path)
+        if info.is_dir and not request.path_url.endswith('/'):
+            self.add_slash_redirect(request)
+        if info.filepath is None:
+            raise HTTPNotFound(request.url)
+
+        variant = self._find_encoding(request, info)
+        if self._is_not_modified(request, variant):
+            # webob's conditional response logic turns this into a bodiless
+            # 304 response when it is served
+            response = Response(status=304, conditional_response=True)
+            response.last_modified = variant.mtime
+            if self.cache_max_age is not None:
+                response.cache_expires = self.cache_max_age
+        else:
+            try:
+                response = self._get_file_response(request, info, variant)
+            except OSError:
+                # the file was removed since it was stat-ed, possibly by a
+                # request before the stat cache entry for it expired
+                if self.stat_cache is not None:
+                    self.stat_cache.pop(path)
+                raise HTTPNotFound(request.url)
+        response.etag = variant.etag
+        if info.encodings:
+            response.vary = ('Accept-Encoding',)
+        return response
+
+    def _get_file_response(self, request, info, variant):
+        if (
+            self.memory_cache is not None
+            and variant.size <= self.memory_cache_file_size
+        ):
+            return self._get_memory_response(info, variant)
+        return FileResponse(
+            variant.filepath,
+            request,
+            self.cache_max_age,
+            info.content_type,
+            content_encoding=variant.content_encoding,
+        )
+
+    def _get_memory_response(self, info, variant):
+        # serve a small file from the memory cache, reading it again if its
+        # entity tag changed since it was cached
+        cache = self.memory_cache
+        cached = cache.get(variant.filepath)
+        if cached is None or cached.etag != variant.etag:
+            with open(variant.filepath, 'rb') as f:
+                st = os.fstat(f.fileno())
+                body = f.read()
+            response = Response(
+                body=body,
+                conditional_response=True,
+                content_type=info.content_type,
+                content_encoding=variant.content_encoding,
+            )
+            response.last_modified = st.st_mtime
+            cached = _StaticFileBody(variant.etag, response.headerlist, body)
+            # do not cache a file which changed after it was stat-ed
+            if _file_etag(st, variant.content_encoding) == variant.etag:
+                cache.put(variant.filepath, cached)
+        response = Response(
+            headerlist=list(cached.headerlist),
+            app_iter=[cached.body],
+            conditional_response=True,
+        )
+        if self.cache_max_age is not None:
+            response.cache_expires = self.cache_max_age
+        return response
+
+    def _is_not_modified(self, request, info):
+        # the same checks as webob's conditional responses, made before
+        # the file is opened
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        if request.if_none_match:
+            return info.etag in request.if_none_match
+        if request.if_modified_since:
+            # Last-Modified has a resolution of one second
+            last_modified = datetime.fromtimestamp(
+                int(info.mtime), timezone.utc
+            )
+            return last_modified <= request.if_modified_since
+        return False
+
+    def _find_encoding(self, request, info):
+        """ Return the :class:`_StaticFileInfo` of the representation of
+        ``info`` which best matches the ``Accept-Encoding`` header of
+        ``request``: one of its precompressed variants or ``info`` itself.
+        """
+        if not info.encodings:
+            return info
+        accept_encoding = request.accept_encoding
+        # without a (valid) Accept-Encoding header, serve the file as is
+        # rather than assume the client can decode it
+        if not isinstance(accept_encoding, AcceptEncodingValidHeader):
+            return info
+        offers = accept_encoding.acceptable_offers(
+            [variant.content_encoding for variant in info.encodings]
+        )
+        if not offers:
+            return info
+        best = offers[0][0]
+        for variant in info.encodings:
+            if variant.content_encoding == best:
+                return variant
+
+    def _get_file_info(self, path):
+        # return a _StaticFileInfo describing the file served for the
+        # secured ``path``, using the stat cache if it is enabled
+        cache = self.stat_cache
+        if cache is None:
+            return self._make_file_info(path)
+        now = self.monotonic()
+        info = cache.get(path)
+        if info is None or info.expires <= now:
+            info = self._make_file_info(path)
+            if info.filepath is not None:
+                # do not cache misses so that requests for many missing
+                # files do not evict the files which are actually served
+                info.expires = now + self.stat_cache_ttl
+                cache.put(path, info)
+            else:
+                cache.pop(path)
+        return info
+
+    def _make_file_info(self, path):
+        resource_path = None
         if self.package_name:  # package resource
             resource_path = '%s/%s' % (self.docroot.rstrip('/'), path)
-            if resource_isdir(self.package_name, resource_path):
-                if not request.path_url.endswith('/'):
-                    self.add_slash_redirect(request)
+            is_dir = resource_isdir(self.package_name, resource_path)
+            if is_dir:
                 resource_path = '%s/%s' % (
                     resource_path.rstrip('/'),
                     self.index,
                 )
 
             if not resource_exists(self.package_name, resource_path):
-                raise HTTPNotFound(request.url)
+                return _StaticFileInfo(None, is_dir)
             filepath = resource_filename(self.package_name, resource_path)
 
         else:  # filesystem file
 
             # os.path.normpath converts / to \ on windows
             filepath = normcase(normpath(join(self.norm_docroot, path)))
-            if isdir(filepath):
-                if not request.path_url.endswith('/'):
-                    self.add_slash_redirect(request)
+            is_dir = isdir(filepath)
+            if is_dir:
                 filepath = join(filepath, self.index)
             if not exists(filepath):
-                raise HTTPNotFound(request.url)
-
-        content_type, content_encoding = _guess_type(filepath)
-        return FileResponse(
-            filepath,
-            request,
-            self.cache_max_age,
-            content_type,
-            content_encoding=None,
-        )
+                return _StaticFileInfo(None, is_dir)
+
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return _StaticFileInfo(None, is_dir)
+        info = _StaticFileInfo(filepath, is_dir, st)
+        if self.precompressed:
+            info.encodings = self._find_precompressed(resource_path, filepath)
+        return info
+
+    def _find_precompressed(self, resource_path, filepath):
+        # return the infos of the precompressed variants of the file at
+        # ``filepath`` in order of preference
+        encodings = []
+        for content_encoding, ext in _precompressed_encodings:
+            if resource_path is not None:
+                if not resource_exists(self.package_name, resource_path + ext):
+                    continue
+                variant_path = resource_filename(
+                    self.package_name, resource_path + ext
+                )
+            else:
+                variant_path = filepath + ext
+            try:
+                st = os.stat(variant_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            encodings.append(
+                _StaticFileInfo(variant_path, False, st, content_encoding)
+            )
+        return encodings
 
     def add_slash_redirect(self, request):
         url = request.path_url + '/'
@@ -136,6 +356,60 @@ class static_view(object):
         raise HTTPMovedPermanently(url)
 
 
+class _StaticFileInfo(object):
+    """ What a :class:`static_view` knows about a requested path.
+
+    ``filepath`` is the path of the file to serve, or ``None`` if there is
+    no such file.  ``is_dir`` is true if the requested path is a directory,
+    in which case ``filepath`` refers to its index file.  ``size``,
+    ``mtime`` and ``inode`` are taken from ``stat`` and ``content_type`` is
+    guessed from ``filepath``.  ``content_encoding`` is the
+    ``Content-Encoding`` the file is served with; it is only set for the
+    precompressed variants listed in ``encodings``.  ``etag`` is the
+    entity tag of the file, derived from its inode, size, modification
+    time and content encoding.
+    """
+
+    expires = None
+    encodings = ()
+
+    def __init__(self, filepath, is_dir, st=None, content_encoding=None):
+        self.filepath = filepath
+        self.is_dir = is_dir
+        self.content_encoding = content_encoding
+        self.size = self.mtime = self.inode = self.etag = None
+        self.content_type = None
+        if st is not None:
+            self.size = st.st_size
+            self.mtime = st.st_mtime
+            self.inode = st.st_ino
+            self.etag = _file_etag(st, content_encoding)
+        if filepath is not None:
+            self.content_type = _guess_type(filepath)[0]
+
+
+def _file_etag(st, content_encoding=None):
+    etag = '%x-%x-%x' % (st.st_ino, st.st_size, st.st_mtime_ns)
+    if content_encoding is not None:
+        etag = '%s-%s' % (etag, content_encoding)
+    return etag
+
+
+class _StaticFileBody(object):
+    """ The contents of a small file held in memory by a
+    :class:`static_view`, with the headers of the responses serving them.
+    """
+
+    def __init__(self, etag, headerlist, body):
+        self.etag = etag
+        self.headerlist = headerlist
+        self.body = body
+
+
+# content encodings of precompressed files, in order of preference, and the
+# extensions of the files holding them
+_precompressed_encodings = (('br', '.br'), ('gzip', '.gz'))
+
 _seps = set(['/', os.sep])
 
 
@@ -15,7 +15,7 @@ from pyramid.encode import url_quote
 from pyramid.exceptions import URLDecodeError
 from pyramid.location import lineage
 from pyramid.threadlocal import get_current_registry
-from pyramid.util import ascii_, is_nonstr_iter, text_
+from pyramid.util import ClockCache, ascii_, is_nonstr_iter, text_
 
 PATH_SEGMENT_SAFE = "~!$&'()*+,;=:@"  # from webob
 PATH_SAFE = PATH_SEGMENT_SAFE + "/"
@@ -535,7 +535,57 @@ def unquote_bytes_to_wsgi(bytestring):
     return unquote_to_bytes(bytestring).decode('latin-1')
 
 
-_segment_cache = {}
+def _quote_segment(segment, safe):
+    return url_quote(text_(segment, 'utf-8'), safe)
+
+
+# remembers the quoted representations of the most recently used path
+# segments; see the ``path_segment_cache_size`` setting
+_cached_quote_segment = lru_cache(10000)(_quote_segment)
+
+
+def _resize_segment_cache(maxsize):
+    # replace the path segment cache with an empty one of another size; the
+    # cache (and its counters) is kept if it already has this size
+    global _cached_quote_segment
+    if _cached_quote_segment.cache_info().maxsize != maxsize:
+        _cached_quote_segment = lru_cache(maxsize)(_quote_segment)
+
+
+def warm_segment_cache(segments, safe=PATH_SEGMENT_SAFE):
+    """
+    Quote each of the path ``segments`` with :func:`quote_path_segment` so
+    that their quoted representations are cached before they are first
+    needed, e.g. at application startup for the names of the resources
+    which appear in most URLs.
+
+    .. versionadded:: 2.0
+
+    """
+    for segment in segments:
+        quote_path_segment(segment, safe)
+
+
+def segment_cache_stats():
+    """
+    Return a dictionary describing the cache used by
+    :func:`quote_path_segment`: its current ``size``, its ``maxsize`` and
+    the number of ``hits``, ``misses`` and ``evictions`` since it was created
+    (at startup, or when the ``pyramid.path_segment_cache_size`` setting
+    resized it).
+
+    .. versionadded:: 2.0
+
+    """
+    info = _cached_quote_segment.cache_info()
+    return {
+        'size': info.currsize,
+        'maxsize': info.maxsize,
+        'hits': info.hits,
+        'misses': info.misses,
+        # every miss adds an entry, so those not in the cache were evicted
+        'evictions': max(0, info.misses - info.currsize),
+    }
 
 
 def quote_path_segment(segment, safe=PATH_SEGMENT_SAFE):
@@ -554,31 +604,27 @@ def quote_path_segment(segment, safe=PATH_SEGMENT_SAFE):
     .. note::
 
        The return value for each segment passed to this
-       function is cached in a module-scope dictionary for
+       function is cached in a module-scope cache for
        speed: the cached version is returned when possible
-       rather than recomputing the quoted version.  No cache
-       emptying is ever done for the lifetime of an
-       application, however.  If you pass arbitrary
-       user-supplied strings to this function (as opposed to
-       some bounded set of values from a 'working set' known to
-       your application), it may become a memory leak.
+       rather than recomputing the quoted version.  The cache
+       holds at most 10000 segments by default (see the
+       ``pyramid.path_segment_cache_size`` setting), discarding
+       the least recently used ones first, so passing arbitrary
+       user-supplied strings to this function does not leak
+       memory.  See also :func:`warm_segment_cache` and
+       :func:`segment_cache_stats`.
+
+    .. versionchanged:: 2.0
+       The cache is bounded.
 
     """
-    # The bit of this code that deals with ``_segment_cache`` is an
-    # optimization: we cache all the computation of URL path segments
-    # in this module-scope dictionary with the original string as the
-    # key, so we can look it up later without needing to reencode
-    # or re-url-quote it
-    try:
-        if segment.__class__ not in (str, bytes):
-            segment = str(segment)
-        return _segment_cache[(segment, safe)]
-    except KeyError:
-        result = url_quote(text_(segment, 'utf-8'), safe)
-        # we don't need a lock to mutate _segment_cache, as the below
-        # will generate exactly one Python bytecode (STORE_SUBSCR)
-        _segment_cache[(segment, safe)] = result
-        return result
+    # The use of ``_cached_quote_segment`` is an optimization: we cache the
+    # computation of URL path segments with the original string as the key,
+    # so we can look it up later without needing to reencode or re-url-quote
+    # it
+    if segment.__class__ not in (str, bytes):
+        segment = str(segment)
+    return _cached_quote_segment(segment, safe)
 
 
 @implementer(ITraverser)
@@ -586,7 +632,16 @@ class ResourceTreeTraverser(object):
     """ A resource tree traverser that should be used (for speed) when
     every resource in the tree supplies a ``__name__`` and
     ``__parent__`` attribute (ie. every resource in the tree is
-    :term:`location` aware) ."""
+    :term:`location` aware) .
+
+    A resource may also supply a ``__traverse_many__(segments)`` method to
+    resolve several path segments at once (e.g. with a single database
+    query).  It is passed a tuple of the remaining path segments, up to but
+    not including any ``@@`` view selector, and must return a sequence of
+    the resources found for the leading segments, in order.  Returning
+    fewer resources than segments behaves as though ``__getitem__`` had
+    raised a :exc:`KeyError` for the first unresolved segment.  Resources
+    without ``__traverse_many__`` are traversed via ``__getitem__``."""
 
     VH_ROOT_KEY = VH_ROOT_KEY
     VIEW_SELECTOR = '@@'
@@ -641,6 +696,9 @@ class ResourceTreeTraverser(object):
             vpath = path
             vroot_idx = -1
 
+        return self._traverse(vpath, vroot_tuple, vroot_idx, subpath)
+
+    def _traverse(self, vpath, vroot_tuple, vroot_idx, subpath):
         root = self.root
         ob = vroot = root
 
@@ -666,6 +724,18 @@ class ResourceTreeTraverser(object):
                         'virtual_root_path': vroot_tuple,
                         'root': root,
                     }
+                traverse_many = getattr(ob, '__traverse_many__', None)
+                if traverse_many is not None:
+                    return self._traverse_many(
+                        traverse_many,
+                        ob,
+                        i,
+                        vpath_tuple,
+                        vroot,
+                        vroot_tuple,
+                        vroot_idx,
+                        subpath,
+                    )
                 try:
                     getitem = ob.__getitem__
                 except AttributeError:
@@ -706,12 +776,133 @@ class ResourceTreeTraverser(object):
             'root': root,
         }
 
+    def _traverse_many(
+        self,
+        traverse_many,
+        ob,
+        i,
+        vpath_tuple,
+        vroot,
+        vroot_tuple,
+        vroot_idx,
+        subpath,
+    ):
+        # ``ob`` can resolve several segments at once (e.g. in a single
+        # database query); hand it every segment up to the next view
+        # selector.  Traversal always ends within this run: either at an
+        # unresolved segment, at the view selector or at the end of the path.
+        view_selector = self.VIEW_SELECTOR
+        end = i + 1
+        vpath_len = len(vpath_tuple)
+        while end < vpath_len and vpath_tuple[end][:2] != view_selector:
+            end += 1
+        for next in traverse_many(vpath_tuple[i:end]):
+            if i == vroot_idx:
+                vroot = next
+            ob = next
+            i += 1
+        if i < end:
+            # fewer resources than segments: treat the first unresolved
+            # segment as though ``__getitem__`` had raised a KeyError
+            view_name = vpath_tuple[i]
+            subpath = vpath_tuple[i + 1 :]
+            traversed = vpath_tuple[: vroot_idx + i + 1]
+        elif end < vpath_len:
+            view_name = vpath_tuple[end][2:]
+            subpath = vpath_tuple[end + 1 :]
+            traversed = vpath_tuple[: vroot_idx + end + 1]
+        else:
+            view_name = ''
+            traversed = vpath_tuple
+        return {
+            'context': ob,
+            'view_name': view_name,
+            'subpath': subpath,
+            'traversed': traversed,
+            'virtual_root': vroot,
+            'virtual_root_path': vroot_tuple,
+            'root': self.root,
+        }
+
 
 ModelGraphTraverser = (
     ResourceTreeTraverser
 )  # b/w compat, not API, used in wild
 
 
+@implementer(ITraverser)
+class CachingResourceTreeTraverser(ResourceTreeTraverser):
+    """ A :class:`ResourceTreeTraverser` which remembers the result of
+    traversing recently requested paths, for applications whose root factory
+    returns the same long-lived root for every request (e.g. an object
+    database or an in-memory catalog).
+
+    Only resources which declare themselves cacheable by having a true
+    ``__traversal_cacheable__`` attribute take part: the result of a
+    traversal is cached only if the root and every resource on the way to
+    the context are cacheable.  A cached result is reused for as long as the
+    tree is unchanged; call :meth:`invalidate` whenever resources are added,
+    removed or renamed (e.g. from a subscriber to your own change events) to
+    discard every cached result.
+
+    To use it, register it as the traverser of the cacheable root::
+
+        config.add_traverser(CachingResourceTreeTraverser, Root)
+
+    The cache holds the results of at most 1000 paths, discarding the least
+    used first; its counters are available from
+    ``CachingResourceTreeTraverser.cache.stats()``.  To use a different size,
+    call ``CachingResourceTreeTraverser.cache.resize(size)`` (see
+    :class:`pyramid.util.ClockCache`).
+
+    .. versionadded:: 2.0
+    """
+
+    cache = ClockCache(1000)
+    generation = 0
+
+    @classmethod
+    def invalidate(cls):
+        """ Discard all the results cached by this traverser class."""
+        cls.generation += 1
+
+    def _traverse(self, vpath, vroot_tuple, vroot_idx, subpath):
+        root = self.root
+        if not getattr(root, '__traversal_cacheable__', False):
+            return ResourceTreeTraverser._traverse(
+                self, vpath, vroot_tuple, vroot_idx, subpath
+            )
+        cache = self.cache
+        generation = self.generation
+        key = (id(root), vpath, vroot_tuple, tuple(subpath))
+        cached = cache.get(key)
+        # the cached root is compared to make sure that the id of a root
+        # which has since been discarded is not reused by another root
+        if (
+            cached is None
+            or cached[0] != generation
+            or cached[1]['root'] is not root
+        ):
+            result = ResourceTreeTraverser._traverse(
+                self, vpath, vroot_tuple, vroot_idx, subpath
+            )
+            if not _is_traversal_cacheable(result['context'], root):
+                return result
+            cached = (generation, result)
+            cache.put(key, cached)
+        return dict(cached[1])
+
+
+def _is_traversal_cacheable(context, root):
+    for resource in lineage(context):
+        if not getattr(resource, '__traversal_cacheable__', False):
+            return False
+        if resource is root:
+            return True
+    # the context is not located under the root
+    return False
+
+
 @implementer(IResourceURL)
 class ResourceURL(object):
     VH_ROOT_KEY = VH_ROOT_KEY
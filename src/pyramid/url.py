@@ -21,7 +21,7 @@ QUERY_SAFE = "/?:@!$&'()*+,;="  # RFC 3986
 ANCHOR_SAFE = QUERY_SAFE
 
 
-def parse_url_overrides(request, kw):
+def parse_url_overrides(request, kw, default_app_url=None):
     """
     Parse special arguments passed when generating urls.
 
@@ -30,6 +30,10 @@ def parse_url_overrides(request, kw):
 
       ``(app_url, qs, anchor)``.
 
+    If none of ``_app_url``, ``_scheme``, ``_host`` or ``_port`` is passed,
+    ``app_url`` is ``default_app_url``, or ``request.application_url`` if
+    ``default_app_url`` is ``None``.
+
     """
     app_url = kw.pop('_app_url', None)
     scheme = kw.pop('_scheme', None)
@@ -41,6 +45,8 @@ def parse_url_overrides(request, kw):
     if app_url is None:
         if scheme is not None or host is not None or port is not None:
             app_url = request._partial_application_url(scheme, host, port)
+        elif default_app_url is not None:
+            app_url = default_app_url
         else:
             app_url = request.application_url
 
@@ -62,6 +68,24 @@ class URLMethodsMixin(object):
     """ Request methods mixin for BaseRequest having to do with URL
     generation """
 
+    def _get_application_urls(self):
+        # the application URLs computed for this request, keyed by the
+        # overrides they were computed with; they are discarded whenever the
+        # parts of the environ they are computed from change
+        e = self.environ
+        key = (
+            e.get('wsgi.url_scheme'),
+            e.get('HTTP_HOST'),
+            e.get('SERVER_NAME'),
+            e.get('SERVER_PORT'),
+            self.script_name,
+            getattr(self, 'url_encoding', 'utf-8'),
+        )
+        memo = getattr(self, '_application_urls', None)
+        if memo is None or memo[0] != key:
+            memo = self._application_urls = (key, {})
+        return memo[1]
+
     def _partial_application_url(self, scheme=None, host=None, port=None):
         """
         Construct the URL defined by request.application_url, replacing any
@@ -73,7 +97,19 @@ class URLMethodsMixin(object):
         ``scheme`` is passed as ``http`` and ``port`` is not passed, the
         ``port`` value is assumed to be ``80``.
 
+        The result is memoized for the lifetime of the request.
+
         """
+        urls = self._get_application_urls()
+        key = (scheme, host, port)
+        url = urls.get(key)
+        if url is None:
+            url = urls[key] = self._make_partial_application_url(
+                scheme, host, port
+            )
+        return url
+
+    def _make_partial_application_url(self, scheme, host, port):
         e = self.environ
         if scheme is None:
             scheme = e['wsgi.url_scheme']
@@ -108,8 +144,7 @@ class URLMethodsMixin(object):
             url += ':%s' % port
 
         url_encoding = getattr(self, 'url_encoding', 'utf-8')  # webob 1.2b3+
-        bscript_name = bytes_(self.script_name, url_encoding)
-        return url + url_quote(bscript_name, PATH_SAFE)
+        return url + _quote_script_name(self.script_name, url_encoding)
 
     def route_url(self, route_name, *elements, **kw):
         """Generates a fully qualified URL for a named :app:`Pyramid`
@@ -244,6 +279,55 @@ class URLMethodsMixin(object):
            empty string) they will not be included in the generated url.
 
         """
+        route = self._get_route(route_name)
+        return self._generate_route_url(route, elements, kw)
+
+    def route_urls(self, route_name, kws, *elements, **kw):
+        """ Generates a list of fully qualified URLs for a named
+        :app:`Pyramid` :term:`route configuration`, one for each of the
+        mappings of keyword arguments in the iterable ``kws``.
+
+        This is equivalent to::
+
+            [request.route_url(route_name, *elements, **dict(kw, **item))
+             for item in kws]
+
+        but the route is looked up, and the application URL computed, only
+        once for the whole batch, which makes it the cheaper way to generate
+        many URLs for the same route (e.g. for every row of a listing).
+        The ``*elements`` and ``**kw`` arguments are shared by all the URLs;
+        the keyword arguments in each item of ``kws`` take precedence over
+        them.  See :meth:`pyramid.request.Request.route_url` for the meaning
+        of the arguments.
+
+        For example, if you've defined a route named 'item' with the path
+        ``/items/{id}``, this call to ``route_urls``::
+
+            request.route_urls('item', [{'id': 1}, {'id': 2}])
+
+        Will return ``['http://e.com/items/1', 'http://e.com/items/2']``.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._generate_route_urls(route_name, kws, elements, kw, None)
+
+    def route_paths(self, route_name, kws, *elements, **kw):
+        """ Generates a list of paths for a named :app:`Pyramid`
+        :term:`route configuration`.  This method is to
+        :meth:`pyramid.request.Request.route_urls` what
+        :meth:`pyramid.request.Request.route_path` is to
+        :meth:`pyramid.request.Request.route_url`: any ``_app_url`` passed
+        is ignored and the ``script_name`` of the request is used instead.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._generate_route_urls(
+            route_name, kws, elements, kw, self.script_name
+        )
+
+    def _get_route(self, route_name):
         try:
             reg = self.registry
         except AttributeError:
@@ -253,11 +337,31 @@ class URLMethodsMixin(object):
 
         if route is None:
             raise KeyError('No such route named %s' % route_name)
+        return route
+
+    def _generate_route_urls(self, route_name, kws, elements, kw, app_url):
+        route = self._get_route(route_name)
+        default_app_url = None
+        if app_url is None:
+            default_app_url = self.application_url
+        urls = []
+        for item in kws:
+            route_kw = kw.copy()
+            route_kw.update(item)
+            if app_url is not None:
+                route_kw['_app_url'] = app_url
+            urls.append(
+                self._generate_route_url(
+                    route, elements, route_kw, default_app_url
+                )
+            )
+        return urls
 
+    def _generate_route_url(self, route, elements, kw, default_app_url=None):
         if route.pregenerator is not None:
             elements, kw = route.pregenerator(self, elements, kw)
 
-        app_url, qs, anchor = parse_url_overrides(self, kw)
+        app_url, qs, anchor = parse_url_overrides(self, kw, default_app_url)
 
         path = route.generate(kw)  # raises KeyError if generate fails
 
@@ -885,6 +989,11 @@ def current_route_path(request, *elements, **kw):
     return request.current_route_path(*elements, **kw)
 
 
+@lru_cache(1000)
+def _quote_script_name(script_name, url_encoding):
+    return url_quote(bytes_(script_name, url_encoding), PATH_SAFE)
+
+
 @lru_cache(1000)
 def _join_elements(elements):
     return '/'.join(
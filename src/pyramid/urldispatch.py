@@ -1,3 +1,4 @@
+import heapq
 import re
 from zope.interface import implementer
 
@@ -20,10 +21,14 @@ class Route(object):
         self.pattern = pattern
         self.path = pattern  # indefinite b/w compat, not in interface
         self.match, self.generate = _compile_route(pattern)
+        self.static_prefix = _static_prefix(pattern)
         self.name = name
         self.factory = factory
         self.predicates = predicates
         self.pregenerator = pregenerator
+        # set when the route's view lookups are frozen, see
+        # pyramid.view._RouteViewLookup
+        self._view_lookup = None
 
 
 @implementer(IRoutesMapper)
@@ -33,6 +38,7 @@ class RoutesMapper(object):
         self.static_routes = []
 
         self.routes = {}
+        self._dispatch_tree = None
 
     def has_routes(self):
         return bool(self.routelist)
@@ -67,6 +73,7 @@ class RoutesMapper(object):
             self.static_routes.append(route)
 
         self.routes[name] = route
+        self._dispatch_tree = None
         return route
 
     def generate(self, name, kw):
@@ -83,7 +90,11 @@ class RoutesMapper(object):
                 e.encoding, e.object, e.start, e.end, e.reason
             )
 
-        for route in self.routelist:
+        tree = self._dispatch_tree
+        if tree is None:
+            tree = self._dispatch_tree = _DispatchNode.build(self.routelist)
+
+        for route in tree.candidates(path):
             match = route.match(path)
             if match is not None:
                 preds = route.predicates
@@ -95,6 +106,70 @@ class RoutesMapper(object):
         return {'route': None, 'match': None}
 
 
+class _DispatchNode(object):
+    """ A node in the literal-prefix tree used by :class:`RoutesMapper`.
+
+    Each route is stored on the node reached by walking the complete path
+    segments of its static prefix.  A route can only ever match a path that
+    starts with its static prefix, so the routes stored on the nodes visited
+    while walking a path's segments are the only possible candidates for that
+    path.  Each route is also stored along with its position in the route
+    list so that the candidates from several nodes can be tried in the
+    original first-match-wins order.
+    """
+
+    def __init__(self):
+        # the routes stored on this node, in order
+        self.routes = []
+        # (order, route) for each of ``routes``
+        self.ordered = []
+        # the routes stored on this node and its ancestors, in order; merged
+        # when first needed
+        self.merged = None
+        self.children = {}
+
+    @classmethod
+    def build(cls, routelist):
+        root = cls()
+        for order, route in enumerate(routelist):
+            node = root
+            # routes without a static prefix (e.g. custom IRoute objects)
+            # are always candidates
+            prefix = getattr(route, 'static_prefix', '')
+            # the final element is either empty or a partial segment
+            for segment in prefix.split('/')[1:-1]:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = cls()
+                node = child
+            node.routes.append(route)
+            node.ordered.append((order, route))
+        return root
+
+    def candidates(self, path):
+        node = self
+        found = [node] if node.routes else []
+        for segment in path.split('/')[1:-1]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.routes:
+                found.append(node)
+        if not found:
+            return ()
+        # the nodes with routes above the deepest one found are always the
+        # same, so the candidates only depend on that node
+        node = found[-1]
+        if len(found) == 1:
+            return node.routes
+        merged = node.merged
+        if merged is None:
+            # the order keys are unique so the routes are never compared
+            ordered = heapq.merge(*[each.ordered for each in found])
+            merged = node.merged = [route for order, route in ordered]
+        return merged
+
+
 # stolen from bobo and modified
 old_route_re = re.compile(r'(\:[_a-zA-Z]\w*)')
 star_at_end = re.compile(r'\*(\w*)$')
@@ -111,7 +186,7 @@ def update_pattern(matchobj):
     return '{%s}' % name[1:]
 
 
-def _compile_route(route):
+def _normalize_pattern(route):
     # This function really wants to consume Unicode patterns natively, but if
     # someone passes us a bytestring, we allow it by converting it to Unicode
     # using the ASCII decoding.  We decode it using ASCII because we don't
@@ -133,6 +208,21 @@ def _compile_route(route):
     if not route.startswith('/'):
         route = '/' + route
 
+    return route
+
+
+def _static_prefix(route):
+    """ Return the literal text every path matched by the pattern
+    ``route`` must start with."""
+    route = _normalize_pattern(route)
+    if star_at_end.search(route):
+        route = route.rsplit('*', 1)[0]
+    return route_re.split(route)[0]
+
+
+def _compile_route(route):
+    route = _normalize_pattern(route)
+
     remainder = None
     if star_at_end.search(route):
         route, remainder = route.rsplit('*', 1)
@@ -1,8 +1,10 @@
+from collections import OrderedDict
 from contextlib import contextmanager
 import functools
 from hmac import compare_digest
 import inspect
 import platform
+import threading
 import weakref
 
 from pyramid.path import DottedNameResolver as _DottedNameResolver
@@ -301,6 +303,203 @@ class WeakOrderedSet(object):
             return self._items[oid]()
 
 
+class LRUCache(object):
+    """ A thread-safe mapping which holds at most ``maxsize`` items,
+    discarding the least recently used item when it is full.
+
+    If ``sizeof`` is given, it is called with each cached value and
+    ``maxsize`` bounds the sum of the sizes it returns (e.g. a number of bytes)
+    rather than the number of items.  A value larger than ``maxsize`` is not
+    cached at all.  The current total is available as ``currsize``.
+
+    The number of lookups which found (``hits``) or did not find (``misses``)
+    a value and the number of items discarded to make room for new ones
+    (``evictions``) are counted, so that the effectiveness of the cache can
+    be monitored.
+    """
+
+    def __init__(self, maxsize, sizeof=None):
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self.maxsize = maxsize
+        self.sizeof = sizeof
+        self.currsize = 0
+        # key -> (value, size)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """ Return the value for ``key`` and mark it as recently used, or
+        ``default`` if it is not cached."""
+        with self._lock:
+            try:
+                value = self._data[key][0]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ Cache ``value`` for ``key``, evicting the least recently used
+        items until it fits."""
+        size = 1 if self.sizeof is None else self.sizeof(value)
+        with self._lock:
+            data = self._data
+            old = data.pop(key, None)
+            if old is not None:
+                self.currsize -= old[1]
+            if size > self.maxsize:
+                return
+            while self.currsize + size > self.maxsize:
+                evicted = data.popitem(last=False)[1]
+                self.currsize -= evicted[1]
+                self.evictions += 1
+            data[key] = (value, size)
+            self.currsize += size
+
+    def pop(self, key, default=None):
+        """ Remove ``key`` from the cache and return its value, or
+        ``default`` if it is not cached."""
+        with self._lock:
+            try:
+                value, size = self._data.pop(key)
+            except KeyError:
+                return default
+            self.currsize -= size
+            return value
+
+    def clear(self):
+        """ Remove all items from the cache.  The counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self.currsize = 0
+
+    def stats(self):
+        """ Return a dictionary of the cache counters."""
+        return {
+            'size': len(self._data),
+            'currsize': self.currsize,
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class ClockCache(object):
+    """ A thread-safe mapping which holds at most ``maxsize`` items.
+
+    Unlike :class:`LRUCache`, looking up a value takes no lock and does not
+    reorder the cache, so that a hit costs little more than a ``dict``
+    lookup.  When the cache is full, items are discarded in the order they
+    were added, except that an item which has been looked up since it was
+    added (or last spared) is spared once and moved to the back of the queue
+    instead: an approximation of LRU eviction known as the CLOCK algorithm.
+
+    The ``hits``, ``misses`` and ``evictions`` counters are maintained as by
+    :class:`LRUCache`, but as lookups do not take the lock, concurrent
+    lookups may occasionally be missing from the counts.
+    """
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        # keys looked up since they were added or last spared
+        self._referenced = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """ Return the value for ``key``, or ``default`` if it is not
+        cached."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._referenced.add(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """ Cache ``value`` for ``key``, evicting an item if the cache is
+        full."""
+        with self._lock:
+            data = self._data
+            if key not in data:
+                self._evict(self.maxsize - 1)
+            data[key] = value
+
+    def _evict(self, size):
+        # discard items until at most ``size`` remain; the lock is held
+        data = self._data
+        referenced = self._referenced
+        while len(data) > size:
+            key = next(iter(data))
+            if key in referenced:
+                referenced.discard(key)
+                data.move_to_end(key)
+            else:
+                del data[key]
+                self.evictions += 1
+        if len(referenced) > len(data):
+            # drop the keys of items evicted while they were looked up
+            referenced.intersection_update(data)
+
+    def resize(self, maxsize):
+        """ Change the maximum number of items held by the cache, evicting
+        items if it holds more than ``maxsize``."""
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict(maxsize)
+
+    def pop(self, key, default=None):
+        """ Remove ``key`` from the cache and return its value, or
+        ``default`` if it is not cached."""
+        with self._lock:
+            self._referenced.discard(key)
+            return self._data.pop(key, default)
+
+    def clear(self):
+        """ Remove all items from the cache.  The counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._referenced.clear()
+
+    def stats(self):
+        """ Return a dictionary of the cache counters."""
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
 def strings_differ(string1, string2):
     """Check whether two strings differ while avoiding timing attacks.
 
@@ -12,6 +12,7 @@ from pyramid.interfaces import (
     IView,
     IViewClassifier,
     IRequest,
+    IRouteRequest,
     IExceptionViewClassifier,
 )
 
@@ -590,6 +591,32 @@ def _find_views(
     cache = registry._view_lookup_cache
     views = cache.get((request_iface, context_iface, view_name))
     if views is None:
+        miss_cache = getattr(registry, '_view_lookup_miss_cache', None)
+        if miss_cache is not None:
+            # the names of the views which may be found for the interfaces
+            # are remembered, so that a name which is not one of them is a
+            # miss without a cache entry of its own whatever its value
+            names_key = (
+                request_iface,
+                context_iface,
+                tuple(view_types),
+                view_classifier,
+            )
+            names = miss_cache.get(names_key)
+            if names is None:
+                names = _view_names(
+                    registry,
+                    request_iface,
+                    context_iface,
+                    view_types,
+                    view_classifier,
+                )
+                miss_cache.put(names_key, names)
+            if view_name not in names:
+                return []
+            miss_key = names_key + (view_name,)
+            if miss_cache.get(miss_key) is not None:
+                return []
         views = []
         for req_type, ctx_type in itertools.product(
             request_iface.__sro__, context_iface.__sro__
@@ -602,18 +629,75 @@ def _find_views(
                 if view_callable is not None:
                     views.append(view_callable)
         if views:
-            # do not cache view lookup misses.  rationale: dont allow cache to
-            # grow without bound if somebody tries to hit the site with many
-            # missing URLs.  we could use an LRU cache instead, but then
-            # purposeful misses by an attacker would just blow out the cache
-            # anyway. downside: misses will almost always consume more CPU than
-            # hits in steady state.
+            # do not cache view lookup misses here.  rationale: dont allow
+            # cache to grow without bound if somebody tries to hit the site
+            # with many missing URLs.  misses are only remembered by the
+            # opt-in, size-bounded miss cache, which only has entries per
+            # interfaces and per registered view name.
             with registry._lock:
                 cache[(request_iface, context_iface, view_name)] = views
+        elif miss_cache is not None:
+            miss_cache.put(miss_key, True)
 
     return views
 
 
+def _view_names(
+    registry, request_iface, context_iface, view_types, view_classifier
+):
+    # Return the names of the views registered for ``request_iface``,
+    # ``context_iface`` or the interfaces they extend; a superset of the
+    # names that ``_find_views`` can find views for.
+    lookupAll = registry.adapters.lookupAll
+    required = (view_classifier, request_iface, context_iface)
+    return frozenset(
+        name
+        for view_type in view_types
+        for name, view_callable in lookupAll(required, view_type)
+    )
+
+
+class _RouteViewLookup(object):
+    """ The route request interface and the candidate views of a single
+    route, resolved once so that dispatching to the route's views does not
+    need to query the registry.
+
+    Candidate views are resolved the first time each context interface and
+    view name is seen.  The lookup is only valid while the registry's view
+    lookup cache is the one it was created with; that cache is replaced
+    whenever views are added (see ``Registry._clear_view_lookup_cache``).
+    """
+
+    def __init__(self, registry, request_iface):
+        self.request_iface = request_iface
+        self.lookup_cache = registry._view_lookup_cache
+        self.views = {}
+
+    def is_current(self, registry):
+        return registry._view_lookup_cache is self.lookup_cache
+
+    def find_views(self, registry, context_iface, view_name):
+        views = self.views.get((context_iface, view_name))
+        if views is None:
+            views = _find_views(
+                registry, self.request_iface, context_iface, view_name
+            )
+            if views:
+                # do not remember misses, see _find_views
+                with registry._lock:
+                    self.views[(context_iface, view_name)] = views
+        return views
+
+
+def _freeze_route_view_lookups(registry, mapper):
+    """ Attach a :class:`_RouteViewLookup` to every route of ``mapper``."""
+    for route in mapper.get_routes():
+        request_iface = registry.queryUtility(
+            IRouteRequest, name=route.name, default=IRequest
+        )
+        route._view_lookup = _RouteViewLookup(registry, request_iface)
+
+
 def _call_view(
     registry,
     request,
@@ -624,17 +708,28 @@ def _call_view(
     view_classifier=None,
     secure=True,
     request_iface=None,
+    view_lookup=None,
 ):
     if request_iface is None:
         request_iface = getattr(request, 'request_iface', IRequest)
-    view_callables = _find_views(
-        registry,
-        request_iface,
-        context_iface,
-        view_name,
-        view_types=view_types,
-        view_classifier=view_classifier,
-    )
+    if (
+        view_lookup is not None
+        and view_lookup.request_iface is request_iface
+        and view_types is None
+        and view_classifier is None
+    ):
+        view_callables = view_lookup.find_views(
+            registry, context_iface, view_name
+        )
+    else:
+        view_callables = _find_views(
+            registry,
+            request_iface,
+            context_iface,
+            view_name,
+            view_types=view_types,
+            view_classifier=view_classifier,
+        )
 
     pme = None
     response = None
@@ -20,6 +20,7 @@ from pyramid.interfaces import (
 from pyramid.exceptions import ConfigurationError
 from pyramid.httpexceptions import HTTPForbidden
 from pyramid.util import (
+    LRUCache,
     object_description,
     takes_one_arg,
     is_bound_method,
@@ -199,6 +200,7 @@ def preserve_view_attrs(view, wrapper):
         '__permission__',
         '__predicated__',
         '__predicates__',
+        '__unpredicated__',
         '__accept__',
         '__order__',
         '__text__',
@@ -435,6 +437,21 @@ def rendered_view(view, info):
     if renderer is renderers.null_renderer:
         return view
 
+    settings = info.settings
+    if settings and (
+        settings.get('reload_templates') or settings.get('reload_assets')
+    ):
+        # a new renderer is looked up and instantiated for each request so
+        # that it sees the templates and assets as they currently are
+        view_renderer = override_renderers = None
+    else:
+        # the renderer is looked up and instantiated the first time the view
+        # is rendered and then reused by every request; the renderers of the
+        # most recently used override_renderer names are remembered the same
+        # way
+        view_renderer = renderer.clone()
+        override_renderers = LRUCache(100)
+
     def rendered_view(context, request):
         result = view(context, request)
         if result.__class__ is Response:  # potential common case
@@ -448,18 +465,26 @@ def rendered_view(view, info):
                 if 'override_renderer' in attrs:
                     # renderer overridden by newrequest event or other
                     renderer_name = attrs.pop('override_renderer')
-                    view_renderer = renderers.RendererHelper(
-                        name=renderer_name,
-                        package=info.package,
-                        registry=info.registry,
-                    )
+                    helper = None
+                    if override_renderers is not None:
+                        helper = override_renderers.get(renderer_name)
+                    if helper is None:
+                        helper = renderers.RendererHelper(
+                            name=renderer_name,
+                            package=info.package,
+                            registry=info.registry,
+                        )
+                        if override_renderers is not None:
+                            override_renderers.put(renderer_name, helper)
+                elif view_renderer is None:
+                    helper = renderer.clone()
                 else:
-                    view_renderer = renderer.clone()
+                    helper = view_renderer
                 if '__view__' in attrs:
                     view_inst = attrs.pop('__view__')
                 else:
                     view_inst = getattr(view, '__original_view__', view)
-                response = view_renderer.render_view(
+                response = helper.render_view(
                     request, result, view_inst, context
                 )
         return response
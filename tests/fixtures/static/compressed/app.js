@@ -0,0 +1 @@
+var app = 'identity';
@@ -526,6 +526,74 @@ class TestRemoteUserAuthenticationPolicy(unittest.TestCase):
         result = policy.forget(request)
         self.assertEqual(result, [])
 
+    def test_callback_called_once_per_request(self):
+        from pyramid.security import Everyone
+        from pyramid.security import Authenticated
+
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+            return ['group:%s' % userid]
+
+        request = DummyRequest({'REMOTE_USER': 'fred'})
+        policy = self._makeOne(callback=callback)
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(
+            policy.effective_principals(request),
+            [Everyone, Authenticated, 'fred', 'group:fred'],
+        )
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(calls, ['fred'])
+        request.environ['REMOTE_USER'] = 'bob'
+        self.assertEqual(
+            policy.effective_principals(request),
+            [Everyone, Authenticated, 'bob', 'group:bob'],
+        )
+        self.assertEqual(calls, ['fred', 'bob'])
+        other_request = DummyRequest({'REMOTE_USER': 'fred'})
+        self.assertEqual(policy.authenticated_userid(other_request), 'fred')
+        self.assertEqual(calls, ['fred', 'bob', 'fred'])
+
+    def test_callback_returning_None_called_once_per_request(self):
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+
+        request = DummyRequest({'REMOTE_USER': 'fred'})
+        policy = self._makeOne(callback=callback)
+        self.assertEqual(policy.authenticated_userid(request), None)
+        self.assertEqual(policy.authenticated_userid(request), None)
+        self.assertEqual(calls, ['fred'])
+
+    def test_callback_not_cached(self):
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+            return []
+
+        request = DummyRequest({'REMOTE_USER': 'fred'})
+        policy = self._makeOne(callback=callback)
+        policy.cache_callback = False
+        policy.authenticated_userid(request)
+        policy.effective_principals(request)
+        self.assertEqual(calls, ['fred', 'fred'])
+
+    def test_callback_unhashable_userid(self):
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+            return []
+
+        request = DummyRequest({'REMOTE_USER': ['fred']})
+        policy = self._makeOne(callback=callback)
+        policy.authenticated_userid(request)
+        policy.authenticated_userid(request)
+        self.assertEqual(calls, [['fred'], ['fred']])
+
 
 class TestAuthTktAuthenticationPolicy(unittest.TestCase):
     def _getTargetClass(self):
@@ -566,6 +634,10 @@ class TestAuthTktAuthenticationPolicy(unittest.TestCase):
         inst = self._getTargetClass()('secret', hashalg='sha512')
         self.assertEqual(inst.cookie.hashalg, 'sha512')
 
+    def test_ticket_cache_size(self):
+        inst = self._getTargetClass()('secret', ticket_cache_size=10)
+        self.assertEqual(inst.cookie.ticket_cache.maxsize, 10)
+
     def test_unauthenticated_userid_returns_None(self):
         request = DummyRequest({})
         policy = self._makeOne(None, None)
@@ -1018,6 +1090,73 @@ class TestAuthTktCookieHelper(unittest.TestCase):
         self.assertEqual(response.headerlist[0][0], 'Set-Cookie')
         self.assertTrue("/tokens=/" in response.headerlist[0][1])
 
+    def _makeCachingOne(self, *arg, **kw):
+        helper = self._makeOne(*arg, ticket_cache_size=10, **kw)
+        parse_ticket = helper.parse_ticket
+        helper.parsed = []
+
+        def counting_parse_ticket(secret, value, remote_addr, hashalg):
+            helper.parsed.append((value, remote_addr))
+            return parse_ticket(secret, value, remote_addr, hashalg)
+
+        helper.parse_ticket = counting_parse_ticket
+        return helper
+
+    def test_identify_ticket_cache_disabled_by_default(self):
+        helper = self._makeOne('secret')
+        self.assertEqual(helper.ticket_cache, None)
+
+    def test_identify_ticket_cache_hit(self):
+        helper = self._makeCachingOne('secret')
+        helper.auth_tkt.tokens = ['a', 'b']
+        result = helper.identify(self._makeRequest('ticket'))
+        result['tokens'].append('c')
+        request = self._makeRequest('ticket')
+        result = helper.identify(request)
+        self.assertEqual(helper.parsed, [('ticket', '0.0.0.0')])
+        self.assertEqual(result['tokens'], ['a', 'b'])
+        self.assertEqual(result['userid'], 'userid')
+        self.assertEqual(result['userdata'], '')
+        self.assertEqual(result['timestamp'], 0)
+        environ = request.environ
+        self.assertEqual(environ['REMOTE_USER_TOKENS'], ['a', 'b'])
+        self.assertEqual(environ['AUTH_TYPE'], 'cookie')
+        helper.identify(self._makeRequest('other'))
+        self.assertEqual(len(helper.parsed), 2)
+
+    def test_identify_ticket_cache_include_ip(self):
+        helper = self._makeCachingOne('secret', include_ip=True)
+        helper.identify(self._makeRequest('ticket'))
+        helper.identify(self._makeRequest('ticket', ipv6=True))
+        helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(
+            helper.parsed, [('ticket', '1.1.1.1'), ('ticket', '::1')]
+        )
+
+    def test_identify_ticket_cache_bad_ticket_not_cached(self):
+        helper = self._makeCachingOne('secret')
+        helper.auth_tkt.parse_raise = True
+        self.assertEqual(helper.identify(self._makeRequest('bogus')), None)
+        self.assertEqual(helper.identify(self._makeRequest('bogus')), None)
+        self.assertEqual(len(helper.parsed), 2)
+
+    def test_identify_ticket_cache_timeout(self):
+        helper = self._makeCachingOne('secret', timeout=10)
+        helper.now = 5
+        self.assertTrue(helper.identify(self._makeRequest('ticket')))
+        helper.now = 11
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+        self.assertEqual(len(helper.parsed), 1)
+
+    def test_identify_ticket_cache_decoded_userid(self):
+        helper = self._makeCachingOne('secret')
+        helper.auth_tkt.userid = '1'
+        helper.auth_tkt.user_data = 'userid_type:int'
+        helper.identify(self._makeRequest('ticket'))
+        result = helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(result['userid'], 1)
+        self.assertEqual(len(helper.parsed), 1)
+
     def test_remember(self):
         helper = self._makeOne('secret')
         request = self._makeRequest()
@@ -271,6 +271,217 @@ class TestACLAuthorizationPolicy(unittest.TestCase):
         result = policy.permits(context, ['bob'], 'read')
         self.assertTrue(result)
 
+    def test_permits_first_matching_ace_wins(self):
+        from pyramid.security import Allow, Deny
+
+        context = _compiledContext(
+            (Allow, 'bob', 'read'),
+            (Deny, 'fred', ('read', 'write')),
+            (Allow, 'fred', 'read'),
+            (Allow, 'bob', 'write'),
+        )
+        policy = self._makeOne()
+        result = policy.permits(context, ['bob', 'fred'], 'read')
+        self.assertTrue(result)
+        self.assertEqual(result.ace, (Allow, 'bob', 'read'))
+        result = policy.permits(context, ['bob', 'fred'], 'write')
+        self.assertFalse(result)
+        self.assertEqual(result.ace, (Deny, 'fred', ('read', 'write')))
+        result = policy.permits(context, ['fred'], 'read')
+        self.assertFalse(result)
+        result = policy.permits(context, ['bob'], 'write')
+        self.assertTrue(result)
+
+    def test_permits_all_permissions_ordered(self):
+        from pyramid.security import Allow, DENY_ALL, Everyone
+
+        context = _compiledContext((Allow, 'bob', 'read'), DENY_ALL)
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, [Everyone, 'bob'], 'read'))
+        result = policy.permits(context, [Everyone, 'bob'], 'write')
+        self.assertFalse(result)
+        self.assertEqual(result.ace, DENY_ALL)
+
+    def test_permits_tuple_acl(self):
+        from pyramid.security import Allow
+
+        context = _compiledContext((Allow, 'bob', 'read'))
+        context.__class__.__acl__ = tuple(context.__acl__)
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, ['bob'], 'read'))
+        self.assertFalse(policy.permits(context, ['bob'], 'write'))
+
+    def test_permits_acl_changed(self):
+        from pyramid.security import Allow, Deny
+
+        context = _compiledContext((Allow, 'bob', 'read'))
+        acl = context.__acl__
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, ['bob'], 'read'))
+        acl.insert(0, (Deny, 'bob', 'read'))
+        self.assertFalse(policy.permits(context, ['bob'], 'read'))
+        acl[0] = (Allow, 'bob', 'write')
+        self.assertTrue(policy.permits(context, ['bob'], 'write'))
+
+    def test_permits_acl_shared_between_contexts(self):
+        from pyramid.security import Allow
+
+        root = DummyContext()
+        one = _compiledContext((Allow, 'bob', 'read'), __parent__=root)
+        two = one.__class__(__parent__=root)
+        policy = self._makeOne()
+        result = policy.permits(one, ['bob'], 'read')
+        self.assertEqual(result.context, one)
+        result = policy.permits(two, ['bob'], 'read')
+        self.assertEqual(result.context, two)
+
+    def test_permits_unhashable_principal(self):
+        from pyramid.security import Allow
+
+        context = _compiledContext(
+            (Allow, ['bob'], 'read'), (Allow, 'fred', 'read')
+        )
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, [['bob']], 'read'))
+        self.assertTrue(policy.permits(context, ['fred'], 'read'))
+        self.assertFalse(policy.permits(context, ['bob'], 'read'))
+
+    def test_permits_custom_permissions_container(self):
+        from pyramid.security import Allow
+
+        class Prefixed(object):
+            def __iter__(self):
+                return iter(())
+
+            def __contains__(self, permission):
+                return permission.startswith('view_')
+
+        context = _compiledContext((Allow, 'bob', Prefixed()))
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, ['bob'], 'view_stuff'))
+        self.assertFalse(policy.permits(context, ['bob'], 'edit_stuff'))
+
+    def test_permits_many(self):
+        from pyramid.security import Allow, Deny
+
+        root = DummyContext(__acl__=[(Allow, 'bob', 'read')])
+        folder = DummyContext(__parent__=root)
+        denied = DummyContext(__parent__=folder)
+        denied.__acl__ = [(Deny, 'bob', 'read')]
+        other = DummyContext(__parent__=folder, __acl__=[])
+        contexts = [folder, denied, other, root, denied]
+        policy = self._makeOne()
+        for principals, permission in [
+            (['bob'], 'read'),
+            (['fred'], 'read'),
+            (['bob'], 'write'),
+        ]:
+            results = policy.permits_many(contexts, principals, permission)
+            expected = [
+                policy.permits(context, principals, permission)
+                for context in contexts
+            ]
+            self.assertEqual(len(results), len(expected))
+            for result, other_result in zip(results, expected):
+                self.assertEqual(result.__class__, other_result.__class__)
+                self.assertEqual(result.msg, other_result.msg)
+                self.assertEqual(result.context, other_result.context)
+                self.assertEqual(result.acl, other_result.acl)
+
+    def test_permits_many_ancestors_consulted_once(self):
+        from pyramid.security import Allow
+
+        calls = []
+
+        def acl():
+            calls.append(1)
+            return [(Allow, 'bob', 'read')]
+
+        root = DummyContext(__acl__=acl)
+        folder = DummyContext(__parent__=root)
+        contexts = [DummyContext(__parent__=folder) for i in range(5)]
+        policy = self._makeOne()
+        results = policy.permits_many(contexts, ['bob'], 'read')
+        self.assertEqual(results, [True] * 5)
+        self.assertEqual(results[0].context, root)
+        self.assertEqual(len(calls), 1)
+        results = policy.permits_many(contexts, ['fred'], 'read')
+        self.assertEqual(results, [False] * 5)
+        self.assertEqual(results[4].context, contexts[4])
+        self.assertEqual(results[4].acl, [(Allow, 'bob', 'read')])
+        self.assertEqual(len(calls), 2)
+
+    def test_permits_many_no_acl(self):
+        policy = self._makeOne()
+        context = DummyContext()
+        results = policy.permits_many([context], ['bob'], 'read')
+        self.assertEqual(results, [False])
+        self.assertEqual(
+            results[0].acl, '<No ACL found on any object in resource lineage>'
+        )
+        self.assertEqual(policy.permits_many([], ['bob'], 'read'), [])
+
+    def test_permits_short_acl_not_compiled(self):
+        from pyramid.authorization import _acl_cache
+        from pyramid.security import Allow
+
+        context = _compiledContext()
+        context.__class__.__acl__ = [(Allow, 'bob', 'read')]
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, ['bob'], 'read'))
+        self.assertFalse(id(context.__acl__) in _acl_cache)
+        context = _compiledContext((Allow, 'bob', 'read'))
+        self.assertTrue(policy.permits(context, ['bob'], 'read'))
+        self.assertTrue(id(context.__acl__) in _acl_cache)
+
+    def test_permits_instance_acl_not_compiled(self):
+        from pyramid.authorization import _acl_cache
+        from pyramid.security import Allow
+
+        context = DummyContext(__acl__=_compiledACL((Allow, 'bob', 'read')))
+        policy = self._makeOne()
+        self.assertTrue(policy.permits(context, ['bob'], 'read'))
+        self.assertFalse(policy.permits(context, ['bob'], 'write'))
+        self.assertFalse(id(context.__acl__) in _acl_cache)
+        results = policy.permits_many([context], ['bob'], 'read')
+        self.assertEqual(results, [True])
+        self.assertFalse(id(context.__acl__) in _acl_cache)
+
+    def test_permits_property_acl_not_compiled(self):
+        from pyramid.authorization import _acl_cache
+        from pyramid.security import Allow
+
+        class Context(DummyContext):
+            @property
+            def __acl__(self):
+                return _compiledACL((Allow, 'bob', 'read'))
+
+        context = Context()
+        policy = self._makeOne()
+        size = len(_acl_cache)
+        for i in range(5):
+            self.assertTrue(policy.permits(context, ['bob'], 'read'))
+            self.assertFalse(policy.permits(context, ['bob'], 'write'))
+        results = policy.permits_many([context], ['bob'], 'read')
+        self.assertEqual(results, [True])
+        self.assertEqual(len(_acl_cache), size)
+
+
+def _compiledACL(*aces):
+    # pad an ACL out to a length which ACLAuthorizationPolicy compiles
+    from pyramid.authorization import _compile_min_aces
+
+    return list(aces) + [('Deny', 'nobody', 'nothing')] * _compile_min_aces
+
+
+def _compiledContext(*aces, **kw):
+    # a context whose class defines an ACL which ACLAuthorizationPolicy
+    # compiles
+    class CompiledContext(DummyContext):
+        __acl__ = _compiledACL(*aces)
+
+    return CompiledContext(**kw)
+
 
 class DummyContext:
     def __init__(self, *arg, **kw):
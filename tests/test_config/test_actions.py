@@ -245,6 +245,32 @@ class ActionConfiguratorMixinTests(unittest.TestCase):
         registeredview = self._getViewCallable(config)
         self.assertEqual(registeredview.__name__, 'view3')
 
+    def test_commit_debug_commit_logs_order_timings(self):
+        logger = DummyLogger()
+        config = self._makeOne(
+            settings={'debug_commit': True}, debug_logger=logger
+        )
+        config.commit()
+        del logger.messages[:]
+        config.action(None, order=-5)
+        config.action(None)
+        config.action(None)
+        config.commit()
+        self.assertEqual(len(logger.messages), 2)
+        self.assertTrue(
+            logger.messages[0].startswith('committed 1 actions of order -5')
+        )
+        self.assertTrue(
+            logger.messages[1].startswith('committed 2 actions of order 0')
+        )
+
+    def test_commit_without_debug_commit_logs_nothing(self):
+        logger = DummyLogger()
+        config = self._makeOne(debug_logger=logger)
+        config.action(None)
+        config.commit()
+        self.assertEqual(logger.messages, [])
+
     def test_conflict_set_notfound_view(self):
         config = self._makeOne()
 
@@ -687,6 +713,59 @@ class TestActionState(unittest.TestCase):
         c.actions = [(1, f, (1,), {}, (), None, -1)]
         self.assertRaises(ConfigurationConflictError, c.execute_actions)
 
+    def test_reentrant_action_after_overridden_action(self):
+        output = []
+        c = self._makeOne()
+
+        def f(*a, **k):
+            output.append(('f', a, k))
+
+        def g(*a, **k):
+            output.append(('g', a, k))
+            c.actions.append((3, f, (8,), {}, (), None, 1))
+
+        c.actions = [
+            (1, f, (1,), {}, ()),
+            (1, f, (2,), {}, ('x',)),  # overridden by the above
+            (2, g, (3,), {}, (), None, 1),
+        ]
+        c.execute_actions()
+        self.assertEqual(
+            output, [('f', (1,), {}), ('g', (3,), {}), ('f', (8,), {})]
+        )
+
+    def test_order_timings(self):
+        c = self._makeOne()
+        c.now = 0.0
+
+        def timer():
+            c.now += 1.0
+            return c.now
+
+        def f(*a, **k):
+            c.actions.append((4, None, (), {}, (), None, 2))
+
+        c.timer = timer
+        c.actions = [
+            (1, None, (), {}, (), None, 1),
+            (2, None, (), {}, (), None, 1),
+            (3, f, (), {}, (), None, -1),
+        ]
+        c.execute_actions()
+        self.assertEqual(
+            c.order_timings, [(-1, 1, 1.0), (1, 2, 2.0), (2, 1, 1.0)]
+        )
+
+    def test_order_timings_on_error(self):
+        c = self._makeOne()
+
+        def bad():
+            raise AttributeError
+
+        c.actions = [(1, None), (2, bad, (), {}, (), None, 1)]
+        self.assertRaises(Exception, c.execute_actions)
+        self.assertEqual([t[:2] for t in c.order_timings], [(0, 1)])
+
 
 class Test_reentrant_action_functional(unittest.TestCase):
     def _makeConfigurator(self, *arg, **kw):
@@ -1028,6 +1107,53 @@ class Test_resolveConflicts(unittest.TestCase):
         )
         self.assertRaises(ConfigurationConflictError, list, result)
 
+    def test_overridden_actions_are_dropped(self):
+        from pyramid.config.actions import ConflictResolverState
+        from . import dummyfactory as f
+
+        state = ConflictResolverState()
+        resolveConflicts = self._getFUT()
+        result = list(
+            resolveConflicts(
+                [
+                    (1, f, (1,), {}, (), 'first'),
+                    (1, f, (2,), {}, ('x',), 'second'),
+                    (2, f, (3,), {}, (), 'third', 5),
+                ],
+                state=state,
+            )
+        )
+        self.assertEqual([a['info'] for a in result], ['first', 'third'])
+        self.assertEqual(state.remaining_actions, {})
+        self.assertEqual(state.start, 3)
+
+    def test_resume_with_new_actions(self):
+        from pyramid.config.actions import ConflictResolverState
+        from . import dummyfactory as f
+
+        state = ConflictResolverState()
+        resolveConflicts = self._getFUT()
+        result = resolveConflicts(
+            [(1, f, (1,), {}, (), 'first'), (2, f, (2,), {}, (), 'second')],
+            state=state,
+        )
+        self.assertEqual(next(result)['info'], 'first')
+        result = resolveConflicts(
+            [
+                (3, f, (3,), {}, (), 'third', 5),
+                (4, f, (4,), {}, (), 'fourth'),
+            ],
+            state=state,
+        )
+        self.assertEqual(
+            [a['info'] for a in result], ['second', 'fourth', 'third']
+        )
+
+    def _getFUT(self):
+        from pyramid.config.actions import resolveConflicts
+
+        return resolveConflicts
+
 
 class TestActionInfo(unittest.TestCase):
     def _getTargetClass(self):
@@ -1071,6 +1197,14 @@ def _conflictFunctions(e):
             yield confinst.function
 
 
+class DummyLogger(object):
+    def __init__(self):
+        self.messages = []
+
+    def debug(self, msg):
+        self.messages.append(msg)
+
+
 class DummyActionState(object):
     autocommit = False
     info = ''
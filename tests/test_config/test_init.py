@@ -471,6 +471,32 @@ class ConfiguratorTests(unittest.TestCase):
         self.assertFalse(hasattr(reg, '_view_lookup_cache'))
         reg._clear_view_lookup_cache()
         self.assertEqual(reg._view_lookup_cache, {})
+        self.assertEqual(reg._view_lookup_miss_cache, None)
+
+    def test_setup_registry_view_lookup_miss_cache_size(self):
+        from pyramid.registry import Registry
+
+        reg = Registry()
+        config = self._makeOne(reg)
+        config.setup_registry(
+            settings={'pyramid.view_lookup_miss_cache_size': '50'}
+        )
+        self.assertEqual(reg._view_lookup_miss_cache.maxsize, 50)
+
+    def test_setup_registry_path_segment_cache_size(self):
+        from pyramid.registry import Registry
+        from pyramid import traversal
+
+        maxsize = traversal.segment_cache_stats()['maxsize']
+        reg = Registry()
+        config = self._makeOne(reg)
+        try:
+            config.setup_registry(
+                settings={'pyramid.path_segment_cache_size': '50'}
+            )
+            self.assertEqual(traversal.segment_cache_stats()['maxsize'], 50)
+        finally:
+            traversal._resize_segment_cache(maxsize)
 
     def test_setup_registry_calls_fix_registry(self):
         reg = DummyRegistry()
@@ -297,6 +297,24 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
         else:  # pragma: no cover
             raise AssertionError
 
+    def test_commit_freezes_route_lookups(self):
+        from pyramid.interfaces import IRouteRequest
+
+        config = self._makeOne(settings={'freeze_route_lookups': True})
+        config.add_route('name', 'path')
+        config.commit()
+        route = self._assertRoute(config, 'name', 'path')
+        request_iface = config.registry.getUtility(IRouteRequest, 'name')
+        self.assertEqual(route._view_lookup.request_iface, request_iface)
+        self.assertTrue(route._view_lookup.is_current(config.registry))
+
+    def test_commit_does_not_freeze_route_lookups_by_default(self):
+        config = self._makeOne()
+        config.add_route('name', 'path')
+        config.commit()
+        route = self._assertRoute(config, 'name', 'path')
+        self.assertEqual(route._view_lookup, None)
+
     def test_add_route_no_view_with_view_renderer(self):
         config = self._makeOne(autocommit=True)
         from pyramid.exceptions import ConfigurationError
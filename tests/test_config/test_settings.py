@@ -495,6 +495,23 @@ class TestSettings(unittest.TestCase):
         self.assertEqual(result['debug_templates'], True)
         self.assertEqual(result['pyramid.debug_templates'], True)
 
+    def test_debug_commit(self):
+        result = self._makeOne({})
+        self.assertEqual(result['debug_commit'], False)
+        self.assertEqual(result['pyramid.debug_commit'], False)
+        result = self._makeOne({'debug_commit': 't'})
+        self.assertEqual(result['debug_commit'], True)
+        self.assertEqual(result['pyramid.debug_commit'], True)
+        result = self._makeOne({'pyramid.debug_commit': '1'})
+        self.assertEqual(result['debug_commit'], True)
+        self.assertEqual(result['pyramid.debug_commit'], True)
+        result = self._makeOne({}, {'PYRAMID_DEBUG_COMMIT': '1'})
+        self.assertEqual(result['debug_commit'], True)
+        self.assertEqual(result['pyramid.debug_commit'], True)
+        result = self._makeOne({'debug_all': 'true'})
+        self.assertEqual(result['debug_commit'], True)
+        self.assertEqual(result['pyramid.debug_commit'], True)
+
     def test_debug_all(self):
         result = self._makeOne({})
         self.assertEqual(result['debug_notfound'], False)
@@ -630,6 +647,41 @@ class TestSettings(unittest.TestCase):
             ['example.com', 'foo.example.com', 'asdf.example.com'],
         )
 
+    def test_freeze_route_lookups(self):
+        result = self._makeOne({})
+        self.assertEqual(result['freeze_route_lookups'], False)
+        self.assertEqual(result['pyramid.freeze_route_lookups'], False)
+        result = self._makeOne({'freeze_route_lookups': 'true'})
+        self.assertEqual(result['freeze_route_lookups'], True)
+        self.assertEqual(result['pyramid.freeze_route_lookups'], True)
+        result = self._makeOne({}, {'PYRAMID_FREEZE_ROUTE_LOOKUPS': '1'})
+        self.assertEqual(result['freeze_route_lookups'], True)
+        self.assertEqual(result['pyramid.freeze_route_lookups'], True)
+
+    def test_view_lookup_miss_cache_size(self):
+        result = self._makeOne({})
+        self.assertEqual(result['view_lookup_miss_cache_size'], 0)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 0)
+        result = self._makeOne({'view_lookup_miss_cache_size': '100'})
+        self.assertEqual(result['view_lookup_miss_cache_size'], 100)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 100)
+        result = self._makeOne(
+            {}, {'PYRAMID_VIEW_LOOKUP_MISS_CACHE_SIZE': '10'}
+        )
+        self.assertEqual(result['view_lookup_miss_cache_size'], 10)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 10)
+
+    def test_path_segment_cache_size(self):
+        result = self._makeOne({})
+        self.assertEqual(result['path_segment_cache_size'], 0)
+        self.assertEqual(result['pyramid.path_segment_cache_size'], 0)
+        result = self._makeOne({'path_segment_cache_size': '100'})
+        self.assertEqual(result['path_segment_cache_size'], 100)
+        self.assertEqual(result['pyramid.path_segment_cache_size'], 100)
+        result = self._makeOne({}, {'PYRAMID_PATH_SEGMENT_CACHE_SIZE': '10'})
+        self.assertEqual(result['path_segment_cache_size'], 10)
+        self.assertEqual(result['pyramid.path_segment_cache_size'], 10)
+
     def test_originals_kept(self):
         result = self._makeOne({'a': 'i am so a'})
         self.assertEqual(result['a'], 'i am so a')
@@ -3352,6 +3352,74 @@ class TestMultiView(unittest.TestCase):
         response = mv(context, request)
         self.assertEqual(response, expected_response)
 
+    def _makePredicatedView(self, response, *preds):
+        from pyramid.config.views import predicated_view
+
+        info = DummyViewInfo()
+        info.predicates = preds
+        return predicated_view(lambda context, request: response, info)
+
+    def test___call__with_plans_evaluates_shared_predicates_once(self):
+        mv = self._makeOne()
+        context = DummyContext()
+        request = DummyRequest()
+        calls = []
+        get1 = DummyViewPredicate('request_method = GET', False, calls)
+        get2 = DummyViewPredicate('request_method = GET', False, calls)
+        xhr = DummyViewPredicate('xhr = True', True, calls)
+        mv.add(self._makePredicatedView('view1', get1), 100)
+        mv.add(self._makePredicatedView('view2', get2, xhr), 101)
+        mv.add(self._makePredicatedView('view3', xhr), 102)
+        self.assertEqual(mv(context, request), 'view3')
+        self.assertEqual(calls, ['request_method = GET', 'xhr = True'])
+
+    def test___call__with_plans_skips_predicate_wrapper(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        context = DummyContext()
+        request = DummyRequest()
+        pred = DummyViewPredicate('pred', True, [])
+        view = self._makePredicatedView('view1', pred)
+        view.__unpredicated__ = lambda context, request: 'unpredicated'
+        mv.add(view, 100)
+        self.assertEqual(mv(context, request), 'unpredicated')
+        pred.result = False
+        self.assertRaises(PredicateMismatch, mv, context, request)
+
+    def test___call__with_plans_unpredicated_raises_mismatch(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        context = DummyContext()
+        request = DummyRequest()
+        pred = DummyViewPredicate('pred', True, [])
+        view = self._makePredicatedView('view1', pred)
+
+        def unpredicated(context, request):
+            raise PredicateMismatch
+
+        view.__unpredicated__ = unpredicated
+        mv.add(view, 100)
+        mv.add(lambda context, request: 'view2', 101)
+        self.assertEqual(mv(context, request), 'view2')
+
+    def test_add_compiles_plans(self):
+        mv = self._makeOne()
+        pred = DummyViewPredicate('pred', True, [])
+        view1 = self._makePredicatedView('view1', pred)
+        view2 = self._makePredicatedView('view2', pred)
+        mv.add(view1, 100)
+        mv.add(view2, 100, accept='text/html')
+        mv.add('view3', 100)
+        self.assertEqual(
+            mv.plans,
+            {
+                id(view1): ([(0, pred)], view1.__unpredicated__),
+                id(view2): ([(0, pred)], view2.__unpredicated__),
+            },
+        )
+
     def test__call_permissive__not_found(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -4069,6 +4137,30 @@ class TestStaticURLInfo(unittest.TestCase):
         )
         self.assertEqual(config.view_kw['context'], DummyContext)
 
+    def test_add_viewname_with_stat_cache_ttl(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(config, 'view', 'anotherpackage:path', stat_cache_ttl=5)
+        view = config.view_kw['view']
+        self.assertEqual(view.stat_cache_ttl, 5)
+        self.assertFalse('stat_cache_ttl' in config.route_kw)
+
+    def test_add_viewname_with_precompressed(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(config, 'view', 'anotherpackage:path', precompressed=True)
+        view = config.view_kw['view']
+        self.assertEqual(view.precompressed, True)
+        self.assertFalse('precompressed' in config.route_kw)
+
+    def test_add_viewname_with_memory_cache_size(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(config, 'view', 'anotherpackage:path', memory_cache_size=10)
+        view = config.view_kw['view']
+        self.assertEqual(view.memory_cache.maxsize, 10)
+        self.assertFalse('memory_cache_size' in config.route_kw)
+
     def test_add_viewname_with_renderer(self):
         config = DummyConfig()
         inst = self._makeOne()
@@ -4332,6 +4424,26 @@ class DummyPredicate(object):
     phash = text
 
 
+class DummyViewPredicate(object):
+    def __init__(self, val, result, calls):
+        self.val = val
+        self.result = result
+        self.calls = calls
+
+    def text(self):
+        return self.val
+
+    phash = text
+
+    def __call__(self, context, request):
+        self.calls.append(self.val)
+        return self.result
+
+
+class DummyViewInfo(object):
+    predicates = ()
+
+
 class DummyIntrospector(object):
     def __init__(self, getval=None):
         self.related = []
@@ -32,6 +32,10 @@ class UrlEncodeTests(unittest.TestCase):
         result = self._callFUT([('a', s)], doseq=True)
         self.assertEqual(result, 'a=1&a=2')
 
+    def test_non_ascii_alphanumeric_val(self):
+        result = self._callFUT([('a', text_(b'\xc3\xa91', 'utf-8'))])
+        self.assertEqual(result, 'a=%C3%A91')
+
     def test_with_spaces(self):
         result = self._callFUT([('a', '123 456')], doseq=True)
         self.assertEqual(result, 'a=123+456')
@@ -61,6 +65,64 @@ class UrlEncodeTests(unittest.TestCase):
         )
         self.assertEqual(result, 'xxxa=xxx1&xxxb=&xxxc=')
 
+    def test_empty_sequence_value(self):
+        result = self._callFUT([('a', []), ('b', 1), ('c', ()), ('d', 2)])
+        self.assertEqual(result, 'b=1&d=2')
+
+    def test_non_str_keys(self):
+        result = self._callFUT([(1, 'a'), (True, 'b'), (b'c d', 'c')])
+        self.assertEqual(result, '1=a&True=b&c+d=c')
+
+    def test_matches_previous_implementation(self):
+        la = text_(b'LaPe\xc3\xb1a', 'utf-8')
+        queries = [
+            [],
+            {'a': 1, 'b': 'two'},
+            [('a', 'abc'), ('a', 'ABC123'), ('b', '')],
+            [('q', 'hello world'), ('page', 2), ('sort', '-date')],
+            [('a/b', 'c&d=e'), ('x y', 'a+b'), ('~', '._-~')],
+            [(la, la), ('bytes', b'\xc3\xb1 x'), ('neg', -5)],
+            [('f', 1.5), ('t', True), ('n', None), ('l', [1, 'a b', la])],
+            [('k', ('x', None)), ('e', '')],
+            {'tags': ['a', 'b', 'c'], 'q': 'caf\xe9 cr\xe8me'},
+        ]
+        for query in queries:
+            self.assertEqual(
+                self._callFUT(query, doseq=True), _previous_urlencode(query)
+            )
+
+
+def _previous_urlencode(query):
+    # pyramid.encode.urlencode as it was before being rewritten for speed
+    from pyramid.encode import quote_plus
+    from pyramid.util import is_nonstr_iter
+
+    try:
+        query = query.items()
+    except AttributeError:
+        pass
+
+    result = ''
+    prefix = ''
+
+    for (k, v) in query:
+        k = quote_plus(k)
+
+        if is_nonstr_iter(v):
+            for x in v:
+                x = quote_plus(x)
+                result += '%s%s=%s' % (prefix, k, x)
+                prefix = '&'
+        elif v is None:
+            result += '%s%s=' % (prefix, k)
+        else:
+            v = quote_plus(v)
+            result += '%s%s=%s' % (prefix, k, v)
+
+        prefix = '&'
+
+    return result
+
 
 class URLQuoteTests(unittest.TestCase):
     def _callFUT(self, val, safe=''):
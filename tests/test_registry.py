@@ -25,6 +25,17 @@ class TestRegistry(unittest.TestCase):
         registry._view_lookup_cache[1] = 2
         registry._clear_view_lookup_cache()
         self.assertEqual(registry._view_lookup_cache, {})
+        self.assertEqual(registry._view_lookup_miss_cache, None)
+
+    def test_clear_view_cache_lookup_with_miss_cache(self):
+        registry = self._makeOne()
+        registry._view_lookup_miss_cache_size = 10
+        registry._clear_view_lookup_cache()
+        miss_cache = registry._view_lookup_miss_cache
+        self.assertEqual(miss_cache.maxsize, 10)
+        miss_cache.put(1, True)
+        registry._clear_view_lookup_cache()
+        self.assertEqual(len(registry._view_lookup_miss_cache), 0)
 
     def test_package_name(self):
         package_name = 'testing'
@@ -59,6 +70,29 @@ class TestRegistry(unittest.TestCase):
         )
         self.assertEqual(registry.has_listeners, True)
 
+    def test__has_subscribers(self):
+        registry = self._makeOne()
+        self.assertFalse(registry._has_subscribers(DummyEvent))
+
+        def handler(event):
+            pass
+
+        registry.registerHandler(handler, [IDummyOtherEvent])
+        self.assertFalse(registry._has_subscribers(DummyEvent))
+        registry.registerHandler(handler, [IDummyEvent])
+        self.assertTrue(registry._has_subscribers(DummyEvent))
+        registry.unregisterHandler(handler, [IDummyEvent])
+        self.assertFalse(registry._has_subscribers(DummyEvent))
+
+    def test__has_subscribers_ignores_subscription_adapters(self):
+        from zope.interface import Interface
+
+        registry = self._makeOne()
+        registry.registerSubscriptionAdapter(
+            DummyEvent, [IDummyEvent], Interface
+        )
+        self.assertFalse(registry._has_subscribers(DummyEvent))
+
     def test__get_settings(self):
         registry = self._makeOne()
         registry._settings = 'foo'
@@ -447,6 +481,10 @@ class IDummyEvent(Interface):
     pass
 
 
+class IDummyOtherEvent(Interface):
+    pass
+
+
 @implementer(IDummyEvent)
 class DummyEvent(object):
     pass
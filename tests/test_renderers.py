@@ -104,6 +104,102 @@ class TestJSON(unittest.TestCase):
         renderer = self._makeOne()(None)
         self.assertRaises(TypeError, renderer, objects, {})
 
+    def test_adapter_lookup_cached_per_class(self):
+        from datetime import date
+
+        calls = []
+
+        def adapter(obj, req):
+            return obj.isoformat()
+
+        renderer = self._makeOne(adapters=((date, adapter),))
+        lookup = renderer._lookup_adapter
+
+        def counting_lookup(obj):
+            calls.append(obj)
+            return lookup(obj)
+
+        renderer._lookup_adapter = counting_lookup
+        render = renderer(None)
+        values = [date(2020, 1, 1), date(2020, 1, 2)]
+        self.assertEqual(render(values, {}), '["2020-01-01", "2020-01-02"]')
+        self.assertEqual(render(values, {}), '["2020-01-01", "2020-01-02"]')
+        self.assertEqual(calls, [values[0]])
+
+    def test_adapter_cache_cleared_by_add_adapter(self):
+        class MyObject(object):
+            pass
+
+        renderer = self._makeOne()
+        render = renderer(None)
+        self.assertRaises(TypeError, render, [MyObject()], {})
+        renderer.add_adapter(MyObject, lambda obj, req: 'mine')
+        self.assertEqual(render([MyObject()], {}), '["mine"]')
+
+    def test_adapter_not_cached_for_directly_provided_interfaces(self):
+        from zope.interface import Interface, alsoProvides
+
+        class IMarked(Interface):
+            pass
+
+        class MyObject(object):
+            pass
+
+        marked = MyObject()
+        alsoProvides(marked, IMarked)
+        renderer = self._makeOne()
+        renderer.add_adapter(IMarked, lambda obj, req: 'marked')
+        render = renderer(None)
+        self.assertEqual(render([marked], {}), '["marked"]')
+        self.assertRaises(TypeError, render, [MyObject()], {})
+
+    def test_instance___json___not_cached(self):
+        class MyObject(object):
+            pass
+
+        obj = MyObject()
+        obj.__json__ = lambda req: 'instance'
+        renderer = self._makeOne()(None)
+        self.assertEqual(renderer([obj], {}), '["instance"]')
+        self.assertRaises(TypeError, renderer, [MyObject()], {})
+
+    def test_customized_instance_after_cached_plain_instance(self):
+        from zope.interface import Interface, alsoProvides
+
+        class IFoo(Interface):
+            pass
+
+        class Thing(object):
+            pass
+
+        a, b, c = Thing(), Thing(), Thing()
+        alsoProvides(b, IFoo)
+        c.__json__ = lambda req: 'instance-json'
+        renderer = self._makeOne(
+            adapters=(
+                (Thing, lambda obj, req: 'class-adapter'),
+                (IFoo, lambda obj, req: 'iface-adapter'),
+            )
+        )
+        render = renderer(None)
+        self.assertEqual(
+            render([a, b, c], {}),
+            '["class-adapter", "iface-adapter", "instance-json"]',
+        )
+        self.assertEqual(list(renderer._adapter_cache), [Thing])
+
+    def test_with_bytes_serializer(self):
+        import json
+
+        def serializer(obj, default):
+            return json.dumps(obj, default=default).encode('utf-8')
+
+        request = testing.DummyRequest()
+        renderer = self._makeOne(serializer=serializer)(None)
+        result = renderer({'a': 1}, {'request': request})
+        self.assertEqual(result, b'{"a": 1}')
+        self.assertEqual(request.response.content_type, 'application/json')
+
 
 class Test_string_renderer_factory(unittest.TestCase):
     def _callFUT(self, name):
@@ -142,6 +238,108 @@ class Test_string_renderer_factory(unittest.TestCase):
         renderer('', {'request': request})
         self.assertEqual(request.response.content_type, 'text/mishmash')
 
+    def test_iterator_is_streamed(self):
+        request = testing.DummyRequest()
+        request.response.content_type = 'text/csv'
+        request.response.charset = 'latin-1'
+        renderer = self._callFUT(None)
+        result = renderer(iter(['caf\xe9', 1]), {'request': request})
+        self.assertEqual(list(result), [b'caf\xe9', b'1'])
+        self.assertEqual(request.response.content_type, 'text/csv')
+
+    def test_iterator_without_request(self):
+        renderer = self._callFUT(None)
+        result = renderer((x for x in ['caf\xe9']), {})
+        self.assertEqual(list(result), [b'caf\xc3\xa9'])
+
+
+class TestJSONStream(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _makeOne(self, **kw):
+        from pyramid.renderers import JSONStream
+
+        return JSONStream(**kw)
+
+    def test_it(self):
+        renderer = self._makeOne()(None)
+        result = renderer({'a': [1, 2]}, {})
+        self.assertEqual(b''.join(result), b'{"a": [1, 2]}')
+
+    def test_list(self):
+        renderer = self._makeOne()(None)
+        result = renderer([{'a': 1}, 'b'], {})
+        self.assertEqual(list(result), [b'[{"a": 1}, "b"]'])
+
+    def test_empty_list(self):
+        renderer = self._makeOne()(None)
+        self.assertEqual(b''.join(renderer([], {})), b'[]')
+
+    def test_generator_consumed_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(4):
+                consumed.append(i)
+                yield {'i': i}
+
+        renderer = self._makeOne(chunk_size=10)(None)
+        result = renderer(rows(), {})
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(result), b'[{"i": 0}, ')
+        self.assertEqual(consumed, [0, 1])
+        self.assertEqual(b''.join(result), b'{"i": 1}, {"i": 2}, {"i": 3}]')
+
+    def test_encoder_kw(self):
+        renderer = self._makeOne(separators=(',', ':'))(None)
+        result = renderer(iter([{'a': 1}, [2, 3]]), {})
+        self.assertEqual(b''.join(result), b'[{"a":1},[2,3]]')
+
+    def test_with_custom_adapter(self):
+        from datetime import date
+
+        request = testing.DummyRequest()
+
+        def adapter(obj, req):
+            self.assertEqual(req, request)
+            return obj.isoformat()
+
+        renderer = self._makeOne(adapters=((date, adapter),))(None)
+        result = renderer({'a': date(2020, 1, 1)}, {'request': request})
+        self.assertEqual(b''.join(result), b'{"a": "2020-01-01"}')
+
+    def test_with_request_content_type_notset(self):
+        request = testing.DummyRequest()
+        renderer = self._makeOne()(None)
+        renderer({'a': 1}, {'request': request})
+        self.assertEqual(request.response.content_type, 'application/json')
+
+    def test_with_request_content_type_set(self):
+        request = testing.DummyRequest()
+        request.response.content_type = 'text/mishmash'
+        renderer = self._makeOne()(None)
+        renderer({'a': 1}, {'request': request})
+        self.assertEqual(request.response.content_type, 'text/mishmash')
+
+    def test_response_streamed(self):
+        from pyramid.config import Configurator
+        from pyramid.request import Request
+
+        def view(request):
+            return ({'i': i} for i in range(3))
+
+        config = Configurator()
+        config.add_view(view, renderer='json-stream')
+        app = config.make_wsgi_app()
+        response = Request.blank('/').get_response(app)
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertEqual(response.content_length, None)
+        self.assertEqual(response.body, b'[{"i": 0}, {"i": 1}, {"i": 2}]')
+
 
 class TestRendererHelper(unittest.TestCase):
     def setUp(self):
@@ -274,6 +472,31 @@ class TestRendererHelper(unittest.TestCase):
         self.assertEqual(reg.event, {})
         self.assertEqual(reg.event.__class__.__name__, 'BeforeRender')
 
+    def test_render_no_before_render_subscribers(self):
+        self._registerRendererFactory()
+        system = {'a': 1}
+        helper = self._makeOne('loo.foo')
+        result = helper.render('value', system)
+        self.assertEqual(result[0], 'value')
+        self.assertTrue(result[1] is system)
+
+    def test_render_with_before_render_subscriber(self):
+        from pyramid.interfaces import IBeforeRender
+
+        self._registerRendererFactory()
+        events = []
+
+        def subscriber(event):
+            event['b'] = 2
+            events.append(event)
+
+        self.config.add_subscriber(subscriber, IBeforeRender)
+        helper = self._makeOne('loo.foo')
+        result = helper.render('value', {'a': 1})
+        self.assertEqual(result[1], {'a': 1, 'b': 2})
+        self.assertEqual(result[1].__class__.__name__, 'BeforeRender')
+        self.assertEqual(events[0].rendering_val, 'value')
+
     def test_render_system_values_is_None(self):
         import pyramid.csrf
 
@@ -749,6 +972,18 @@ class TestJSONP(unittest.TestCase):
         result = renderer({'a': '1'}, {})
         self.assertEqual(result, '{"a": "1"}')
 
+    def test_render_to_jsonp_bytes_serializer(self):
+        from pyramid.renderers import JSONP
+
+        def serializer(obj, default):
+            return b'{"a": "1"}'
+
+        renderer = JSONP(serializer=serializer)(None)
+        request = testing.DummyRequest()
+        request.GET['callback'] = 'callback'
+        result = renderer({'a': '1'}, {'request': request})
+        self.assertEqual(result, b'/**/callback({"a": "1"});')
+
     def test_render_to_jsonp_invalid_callback(self):
         from pyramid.httpexceptions import HTTPBadRequest
 
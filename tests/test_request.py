@@ -218,6 +218,41 @@ class TestRequest(unittest.TestCase):
         result = inst.resource_url(root)
         self.assertEqual(result, 'http://example.com/context/')
 
+    def test_application_url(self):
+        from webob.request import BaseRequest
+
+        environ = {
+            'PATH_INFO': '/',
+            'SCRIPT_NAME': '/script name',
+            'HTTP_HOST': '[::1]:8080',
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '5432',
+            'wsgi.url_scheme': 'http',
+        }
+        inst = self._makeOne(environ)
+        expected = BaseRequest(environ).application_url
+        self.assertEqual(expected, 'http://[::1]:8080/script%20name')
+        self.assertEqual(inst.application_url, expected)
+        self.assertEqual(inst._application_urls[1], {None: expected})
+        self.assertEqual(inst.application_url, expected)
+
+    def test_application_url_environ_changed(self):
+        environ = {
+            'PATH_INFO': '/',
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '5432',
+            'wsgi.url_scheme': 'http',
+        }
+        inst = self._makeOne(environ)
+        self.assertEqual(inst.application_url, 'http://example.com:5432')
+        inst.host = 'example.org'
+        self.assertEqual(inst.application_url, 'http://example.org')
+        inst.script_name = '/foo'
+        self.assertEqual(inst.application_url, 'http://example.org/foo')
+        inst.scheme = 'https'
+        self.assertEqual(inst.application_url, 'https://example.org/foo')
+        self.assertEqual(inst.path_url, 'https://example.org/foo/')
+
     def test_route_url(self):
         environ = {
             'PATH_INFO': '/',
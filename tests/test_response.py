@@ -91,12 +91,84 @@ class TestFileResponse(unittest.TestCase):
         finally:
             response.mimetypes = old_mimetypes
 
+    def _callApp(self, r, **environ):
+        from webob.request import BaseRequest
+
+        request = BaseRequest.blank('/', **environ)
+        status = []
+
+        def start_response(s, headers):
+            status.append(s)
+
+        app_iter = r.conditional_response_app(request.environ, start_response)
+        return status[0], b''.join(app_iter)
+
+    def test_range_with_file_iter(self):
+        from pyramid.response import FileIter
+
+        path = self._getPath()
+        r = self._makeOne(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        status, body = self._callApp(r, headers={'Range': 'bytes=2-4'})
+        self.assertEqual(status, '206 Partial Content')
+        self.assertEqual(body, data[2:5])
+        self.assertEqual(r.app_iter.__class__, FileIter)
+        r.app_iter.close()
+
+    def test_range_with_file_wrapper_to_end_of_file(self):
+        path = self._getPath()
+        request = testing.DummyRequest(
+            environ={'wsgi.file_wrapper': DummyFileWrapper}
+        )
+        r = self._makeOne(path, request=request)
+        with open(path, 'rb') as f:
+            data = f.read()
+        app_iter = r.app_iter_range(2, len(data))
+        self.assertTrue(isinstance(app_iter, DummyFileWrapper))
+        self.assertEqual(app_iter.file.read(), data[2:])
+        r.app_iter.close()
+
+    def test_range_with_file_wrapper_partial(self):
+        from pyramid.response import FileIter
+
+        path = self._getPath()
+        request = testing.DummyRequest(
+            environ={'wsgi.file_wrapper': DummyFileWrapper}
+        )
+        r = self._makeOne(path, request=request)
+        with open(path, 'rb') as f:
+            data = f.read()
+        app_iter = r.app_iter_range(1, 3)
+        self.assertTrue(isinstance(app_iter, FileIter))
+        self.assertEqual(b''.join(app_iter), data[1:3])
+        r.app_iter.close()
+
+    def test_range_with_replaced_app_iter(self):
+        path = self._getPath()
+        request = testing.DummyRequest(
+            environ={'wsgi.file_wrapper': DummyFileWrapper}
+        )
+        r = self._makeOne(path, request=request)
+        r.app_iter.close()
+        r.app_iter = [b'abcdef']
+        self.assertEqual(b''.join(r.app_iter_range(1, 3)), b'bc')
+
+
+class DummyFileWrapper(object):
+    def __init__(self, file, block_size):
+        self.file = file
+        self.block_size = block_size
+
+    def close(self):
+        self.file.close()
+
 
 class TestFileIter(unittest.TestCase):
-    def _makeOne(self, file, block_size):
+    def _makeOne(self, file, block_size, *arg):
         from pyramid.response import FileIter
 
-        return FileIter(file, block_size)
+        return FileIter(file, block_size, *arg)
 
     def test___iter__(self):
         f = io.BytesIO(b'abc')
@@ -119,6 +191,64 @@ class TestFileIter(unittest.TestCase):
         inst.close()
         self.assertTrue(f.closed)
 
+    def test_offset_and_length(self):
+        f = io.BytesIO(b'abcdef')
+        inst = self._makeOne(f, 2, 1, 3)
+        self.assertEqual(inst.offset, 1)
+        self.assertEqual(inst.length, 3)
+        self.assertEqual(list(inst), [b'bc', b'd'])
+
+    def test_fileno(self):
+        class DummyFile(object):
+            def fileno(self):
+                return 42
+
+        inst = self._makeOne(DummyFile(), 1)
+        self.assertEqual(inst.fileno(), 42)
+
+    def test_app_iter_range(self):
+        f = io.BytesIO(b'abcdef')
+        inst = self._makeOne(f, 2, 0)
+        result = inst.app_iter_range(1, 4)
+        self.assertEqual(result.offset, 1)
+        self.assertEqual(result.length, 3)
+        self.assertEqual(b''.join(result), b'bcd')
+
+    def test_app_iter_range_relative_to_current_position(self):
+        f = io.BytesIO(b'abcdef')
+        f.seek(2)
+        inst = self._makeOne(f, 2)
+        result = inst.app_iter_range(1, 3)
+        self.assertEqual(result.offset, 3)
+        self.assertEqual(b''.join(result), b'de')
+
+    def test_app_iter_range_within_length(self):
+        f = io.BytesIO(b'abcdef')
+        inst = self._makeOne(f, 2, 1, 3)
+        result = inst.app_iter_range(1, 10)
+        self.assertEqual(result.offset, 2)
+        self.assertEqual(result.length, 2)
+        self.assertEqual(b''.join(result), b'cd')
+
+    def test_app_iter_range_open_ended(self):
+        f = io.BytesIO(b'abcdef')
+        inst = self._makeOne(f, 2, 0)
+        result = inst.app_iter_range(4, None)
+        self.assertEqual(result.length, None)
+        self.assertEqual(b''.join(result), b'ef')
+
+    def test_app_iter_range_file_without_tell(self):
+        class DummyFile(object):
+            def __init__(self):
+                self.data = io.BytesIO(b'abcdef')
+
+            def read(self, size):
+                return self.data.read(size)
+
+        inst = self._makeOne(DummyFile(), 2)
+        result = inst.app_iter_range(1, 4)
+        self.assertEqual(b''.join(result), b'bcd')
+
 
 class Test_patch_mimetypes(unittest.TestCase):
     def _callFUT(self, module):
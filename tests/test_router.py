@@ -800,6 +800,53 @@ class TestRouter(unittest.TestCase):
         )
         self.assertTrue("predicates: 'predicate'" in logger.messages[0])
 
+    def test_call_route_matches_frozen_view_lookup(self):
+        from pyramid.interfaces import IRoutesMapper, IViewClassifier
+        from pyramid.view import _freeze_route_view_lookups
+
+        iface = self._registerRouteRequest('foo')
+        route = self._connectRoute('foo', 'archives/:action/:article')
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, iface, None)
+        self._registerRootFactory(context)
+        mapper = self.registry.getUtility(IRoutesMapper)
+        _freeze_route_view_lookups(self.registry, mapper)
+        router = self._makeOne()
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        self.assertEqual(view.request.request_iface, iface)
+        self.assertEqual(list(route._view_lookup.views.values()), [[view]])
+
+    def test_call_route_matches_stale_frozen_view_lookup(self):
+        from pyramid.interfaces import IRoutesMapper, IViewClassifier
+        from pyramid.view import _freeze_route_view_lookups
+
+        iface = self._registerRouteRequest('foo')
+        route = self._connectRoute('foo', 'archives/:action/:article')
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, iface, None)
+        self._registerRootFactory(context)
+        mapper = self.registry.getUtility(IRoutesMapper)
+        _freeze_route_view_lookups(self.registry, mapper)
+        self.registry._clear_view_lookup_cache()
+        router = self._makeOne()
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        self.assertEqual(view.request.request_iface, iface)
+        self.assertEqual(route._view_lookup.views, {})
+
     def test_call_route_match_miss_debug_routematch(self):
         from pyramid.httpexceptions import HTTPNotFound
 
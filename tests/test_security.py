@@ -215,6 +215,15 @@ class TestRemember(unittest.TestCase):
         _registerAuthenticationPolicy(registry, 'yo')
         self.assertRaises(TypeError, lambda: self._callFUT(request))
 
+    def test_discards_callback_results(self):
+        from pyramid.security import _get_callback_results
+
+        request = _makeRequest()
+        _registerAuthenticationPolicy(request.registry, 'yo')
+        _get_callback_results(request)['key'] = 'value'
+        self._callFUT(request, 'me')
+        self.assertEqual(_get_callback_results(request), {})
+
 
 class TestForget(unittest.TestCase):
     def setUp(self):
@@ -249,6 +258,15 @@ class TestForget(unittest.TestCase):
         result = self._callFUT(request)
         self.assertEqual(result, [('X-Pyramid-Test', 'logout')])
 
+    def test_discards_callback_results(self):
+        from pyramid.security import _get_callback_results
+
+        request = _makeRequest()
+        _registerAuthenticationPolicy(request.registry, 'yo')
+        _get_callback_results(request)['key'] = 'value'
+        self._callFUT(request)
+        self.assertEqual(_get_callback_results(request), {})
+
 
 class TestViewExecutionPermitted(unittest.TestCase):
     def setUp(self):
@@ -472,6 +490,59 @@ class TestHasPermission(unittest.TestCase):
         del request.context
         self.assertRaises(AttributeError, request.has_permission, 'view')
 
+    def test_result_memoized(self):
+        request = self._makeOne()
+        _registerAuthenticationPolicy(request.registry, ['bob', 'fred'])
+        _registerACLAuthorizationPolicy(request.registry)
+        context = DummyACLContext()
+        self.assertTrue(request.has_permission('view', context))
+        self.assertTrue(request.has_permission('view', context))
+        self.assertEqual(context.acl_calls, 1)
+        self.assertFalse(request.has_permission('edit', context))
+        self.assertEqual(context.acl_calls, 2)
+        other = DummyACLContext()
+        request.has_permission('view', other)
+        self.assertEqual(other.acl_calls, 1)
+
+    def test_result_memoized_per_principals(self):
+        request = self._makeOne()
+        authn_policy = _registerAuthenticationPolicy(request.registry, ['bob'])
+        _registerACLAuthorizationPolicy(request.registry)
+        request.context = context = DummyACLContext()
+        request.has_permission('view')
+        authn_policy.result = ['bob', 'fred']
+        request.has_permission('view')
+        authn_policy.result = ['fred', 'bob']
+        request.has_permission('view')
+        self.assertEqual(context.acl_calls, 2)
+
+    def test_result_memoized_per_authorization_policy(self):
+        request = self._makeOne()
+        _registerAuthenticationPolicy(request.registry, ['bob'])
+        _registerACLAuthorizationPolicy(request.registry)
+        request.context = context = DummyACLContext()
+        request.has_permission('view')
+        _registerACLAuthorizationPolicy(request.registry)
+        request.has_permission('view')
+        self.assertEqual(context.acl_calls, 2)
+
+    def test_result_not_memoized_other_policy(self):
+        request = self._makeOne()
+        _registerAuthenticationPolicy(request.registry, ['bob'])
+        policy = _registerAuthorizationPolicy(request.registry, 'yo')
+        self.assertEqual(request.has_permission('view'), 'yo')
+        self.assertEqual(request.has_permission('view'), 'yo')
+        self.assertEqual(len(policy.permits_calls), 2)
+
+    def test_unhashable_principals_not_memoized(self):
+        request = self._makeOne()
+        _registerAuthenticationPolicy(request.registry, [['bob']])
+        _registerACLAuthorizationPolicy(request.registry)
+        request.context = context = DummyACLContext()
+        request.has_permission('view')
+        request.has_permission('view')
+        self.assertEqual(context.acl_calls, 2)
+
 
 _TEST_HEADER = 'X-Pyramid-Test'
 
@@ -505,11 +576,24 @@ class DummyAuthenticationPolicy:
         return headers
 
 
+class DummyACLContext:
+    def __init__(self):
+        self.acl_calls = 0
+
+    def __acl__(self):
+        from pyramid.security import Allow
+
+        self.acl_calls += 1
+        return [(Allow, 'bob', 'view')]
+
+
 class DummyAuthorizationPolicy:
     def __init__(self, result):
         self.result = result
+        self.permits_calls = []
 
     def permits(self, context, principals, permission):
+        self.permits_calls.append((context, principals, permission))
         return self.result
 
     def principals_allowed_by_permission(self, context, permission):
@@ -532,6 +616,15 @@ def _registerAuthorizationPolicy(reg, result):
     return policy
 
 
+def _registerACLAuthorizationPolicy(reg):
+    from pyramid.authorization import ACLAuthorizationPolicy
+    from pyramid.interfaces import IAuthorizationPolicy
+
+    policy = ACLAuthorizationPolicy()
+    reg.registerUtility(policy, IAuthorizationPolicy)
+    return policy
+
+
 def _makeRequest():
     from pyramid.registry import Registry
 
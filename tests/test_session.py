@@ -352,6 +352,23 @@ class TestBaseCookieSession(SharedCookieSessionTests, unittest.TestCase):
             ValueError, self._makeOne, request, max_age='invalid value'
         )
 
+    def test_serializer_by_name(self):
+        from pyramid.session import BaseCookieSessionFactory, PickleSerializer
+
+        factory = BaseCookieSessionFactory('pickle')
+        self.assertIsInstance(factory.serializer, PickleSerializer)
+
+    def test_collect_stats(self):
+        from pyramid.session import BaseCookieSessionFactory
+
+        serializer = DummySerializer()
+        factory = BaseCookieSessionFactory(serializer, collect_stats=True)
+        self.assertEqual(factory.serializer.serializer, serializer)
+        request = testing.DummyRequest()
+        request.cookies['session'] = self._serialize((0, 0, {}))
+        factory(request)
+        self.assertEqual(factory.serializer.stats()['loads'], 1)
+
 
 class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
     def _makeOne(self, request, **kw):
@@ -505,6 +522,60 @@ class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
         self.assertEqual(result, None)
         self.assertTrue('Set-Cookie' in dict(response.headerlist))
 
+    def test_serializer_by_name(self):
+        from pyramid.session import (
+            CompactJSONSerializer,
+            SignedCookieSessionFactory,
+        )
+
+        factory = SignedCookieSessionFactory(
+            'secret', serializer='compact_json'
+        )
+        self.assertIsInstance(
+            factory.serializer.serializer, CompactJSONSerializer
+        )
+
+    def test_serializer_unknown_name(self):
+        from pyramid.session import SignedCookieSessionFactory
+
+        self.assertRaises(
+            ValueError,
+            SignedCookieSessionFactory,
+            'secret',
+            serializer='yaml',
+        )
+
+    def test_collect_stats(self):
+        import webob
+
+        request = testing.DummyRequest()
+        factory = self._makeFactory(
+            serializer='compact_json', collect_stats=True
+        )
+        session = factory(request)
+        session['a'] = 1
+        response = webob.Response()
+        request.response_callbacks[0](request, response)
+        cookieval = response.headers['Set-Cookie'].split(';')[0][8:]
+        stats = factory.serializer.stats()
+        self.assertEqual(stats['dumps'], 1)
+        self.assertEqual(stats['max_size'], len(cookieval))
+        self.assertEqual(stats['total_size'], len(cookieval))
+
+        request = testing.DummyRequest()
+        request.cookies['session'] = cookieval
+        session = factory(request)
+        self.assertEqual(session['a'], 1)
+        stats = factory.serializer.stats()
+        self.assertEqual(stats['loads'], 1)
+        self.assertEqual(stats['loads_errors'], 0)
+
+    def _makeFactory(self, **kw):
+        from pyramid.session import SignedCookieSessionFactory
+
+        kw.setdefault('secret', 'secret')
+        return SignedCookieSessionFactory(**kw)
+
 
 class Test_manage_accessed(unittest.TestCase):
     def _makeOne(self, wrapped):
@@ -598,6 +669,96 @@ class TestPickleSerializer(unittest.TestCase):
         self.assertIsInstance(result, bytes)
 
 
+class TestCompactJSONSerializer(unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import CompactJSONSerializer
+
+        return CompactJSONSerializer(**kw)
+
+    def test_dumps(self):
+        serializer = self._makeOne()
+        result = serializer.dumps((1, 2, {'a': [1, 'b']}))
+        self.assertEqual(result, b'[1,2,{"a":[1,"b"]}]')
+
+    def test_loads(self):
+        serializer = self._makeOne()
+        result = serializer.loads(b'[1,2,{"a":[1,"b"]}]')
+        self.assertEqual(result, [1, 2, {'a': [1, 'b']}])
+
+    def test_loads_raises_ValueError_on_invalid_data(self):
+        serializer = self._makeOne()
+        self.assertRaises(ValueError, serializer.loads, b'not json')
+        self.assertRaises(ValueError, serializer.loads, b'\xff')
+        self.assertRaises(ValueError, serializer.loads, b'znot zlib')
+
+    def test_dumps_compressed_above_threshold(self):
+        serializer = self._makeOne(compress_threshold=100)
+        value = {'key': 'x' * 200}
+        result = serializer.dumps(value)
+        self.assertTrue(result.startswith(b'z'))
+        self.assertLess(len(result), 100)
+        self.assertEqual(serializer.loads(result), value)
+
+    def test_dumps_below_threshold_not_compressed(self):
+        serializer = self._makeOne(compress_threshold=100)
+        result = serializer.dumps({'key': 'x' * 50})
+        self.assertEqual(result, b'{"key":"%s"}' % (b'x' * 50))
+
+    def test_dumps_not_compressed_when_larger(self):
+        import os
+
+        serializer = self._makeOne(compress_threshold=10)
+        value = os.urandom(8).hex()
+        result = serializer.dumps(value)
+        self.assertEqual(result, b'"%s"' % value.encode('ascii'))
+
+
+class TestMeteredSerializer(unittest.TestCase):
+    def _makeOne(self, serializer):
+        from pyramid.session import MeteredSerializer
+
+        inst = MeteredSerializer(serializer)
+        inst.now = 0.0
+
+        def timer():
+            inst.now += 0.5
+            return inst.now
+
+        inst.timer = timer
+        return inst
+
+    def test_dumps(self):
+        inst = self._makeOne(DummySerializer())
+        result = inst.dumps({'a': 1})
+        self.assertEqual(result, DummySerializer().dumps({'a': 1}))
+        inst.dumps({})
+        stats = inst.stats()
+        self.assertEqual(stats['dumps'], 2)
+        self.assertEqual(stats['dumps_time'], 1.0)
+        self.assertEqual(stats['max_size'], len(result))
+        self.assertEqual(
+            stats['total_size'], len(result) + len(DummySerializer().dumps({}))
+        )
+
+    def test_loads(self):
+        inst = self._makeOne(DummySerializer())
+        result = inst.loads(DummySerializer().dumps({'a': 1}))
+        self.assertEqual(result, {'a': 1})
+        stats = inst.stats()
+        self.assertEqual(stats['loads'], 1)
+        self.assertEqual(stats['loads_time'], 0.5)
+        self.assertEqual(stats['loads_errors'], 0)
+
+    def test_loads_error(self):
+        from pyramid.session import CompactJSONSerializer
+
+        inst = self._makeOne(CompactJSONSerializer())
+        self.assertRaises(ValueError, inst.loads, b'not json')
+        stats = inst.stats()
+        self.assertEqual(stats['loads'], 1)
+        self.assertEqual(stats['loads_errors'], 1)
+
+
 class Dummy(object):
     pass
 
@@ -150,7 +150,7 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
         context = DummyContext()
         response = inst(context, request)
         self.assertTrue(b'<html>static</html>' in response.body)
-        self.assertEqual(len(response.headerlist), 5)
+        self.assertEqual(len(response.headerlist), 6)
         header_names = [x[0] for x in response.headerlist]
         header_names.sort()
         self.assertEqual(
@@ -159,6 +159,7 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
                 'Cache-Control',
                 'Content-Length',
                 'Content-Type',
+                'ETag',
                 'Expires',
                 'Last-Modified',
             ],
@@ -170,11 +171,12 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
         context = DummyContext()
         response = inst(context, request)
         self.assertTrue(b'<html>static</html>' in response.body)
-        self.assertEqual(len(response.headerlist), 3)
+        self.assertEqual(len(response.headerlist), 4)
         header_names = [x[0] for x in response.headerlist]
         header_names.sort()
         self.assertEqual(
-            header_names, ['Content-Length', 'Content-Type', 'Last-Modified']
+            header_names,
+            ['Content-Length', 'Content-Type', 'ETag', 'Last-Modified'],
         )
 
     def test_resource_notmodified(self):
@@ -185,11 +187,8 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
         response = inst(context, request)
         start_response = DummyStartResponse()
         app_iter = response(request.environ, start_response)
-        try:
-            self.assertEqual(start_response.status, '304 Not Modified')
-            self.assertEqual(list(app_iter), [])
-        finally:
-            app_iter.close()
+        self.assertEqual(start_response.status, '304 Not Modified')
+        self.assertEqual(list(app_iter), [])
 
     def test_not_found(self):
         inst = self._makeOne('tests:fixtures/static')
@@ -219,6 +218,443 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
         self.assertEqual(response.content_encoding, None)
         response.app_iter.close()
 
+    def test_resource_etag(self):
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        response = inst(context, request)
+        response.app_iter.close()
+        st = os.stat(os.path.join(here, 'fixtures/static/index.html'))
+        self.assertEqual(
+            response.etag,
+            '%x-%x-%x' % (st.st_ino, st.st_size, st.st_mtime_ns),
+        )
+        self.assertTrue(response.headers['ETag'].startswith('"'))
+
+    def test_resource_if_none_match_not_opened(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne('tests:fixtures/static', cache_max_age=600)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        etag = inst(context, request).etag
+        request = self._makeRequest(
+            {'PATH_INFO': '/index.html', 'HTTP_IF_NONE_MATCH': '"%s"' % etag}
+        )
+        response = inst(context, request)
+        self.assertFalse(isinstance(response, FileResponse))
+        self.assertEqual(response.etag, etag)
+        self.assertEqual(response.cache_control.max_age, 600)
+        self.assertTrue(response.last_modified is not None)
+        start_response = DummyStartResponse()
+        app_iter = response(request.environ, start_response)
+        self.assertEqual(start_response.status, '304 Not Modified')
+        self.assertEqual(list(app_iter), [])
+
+    def test_resource_if_none_match_overrides_if_modified_since(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest(
+            {'PATH_INFO': '/index.html', 'HTTP_IF_NONE_MATCH': '"other"'}
+        )
+        request.if_modified_since = fiveyrsfuture
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertTrue(isinstance(response, FileResponse))
+        self.assertTrue(b'<html>static</html>' in response.body)
+
+    def test_resource_if_modified_since_past(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        request.if_modified_since = datetime.datetime(2000, 1, 1)
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertTrue(isinstance(response, FileResponse))
+        response.app_iter.close()
+
+    def test_resource_notmodified_unsafe_method(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest(
+            {'PATH_INFO': '/index.html', 'REQUEST_METHOD': 'POST'}
+        )
+        request.if_modified_since = fiveyrsfuture
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertTrue(isinstance(response, FileResponse))
+        response.app_iter.close()
+
+    def test_precompressed_etag(self):
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        context = DummyContext()
+        request = self._makeRequest({'PATH_INFO': '/compressed/app.js'})
+        identity = inst(context, request)
+        identity.app_iter.close()
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_ACCEPT_ENCODING': 'br'}
+        )
+        response = inst(context, request)
+        response.app_iter.close()
+        self.assertTrue(response.etag.endswith('-br'))
+        self.assertNotEqual(response.etag, identity.etag)
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/compressed/app.js',
+                'HTTP_ACCEPT_ENCODING': 'br',
+                'HTTP_IF_NONE_MATCH': '"%s"' % identity.etag,
+            }
+        )
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'br';\n")
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/compressed/app.js',
+                'HTTP_ACCEPT_ENCODING': 'br',
+                'HTTP_IF_NONE_MATCH': '"%s"' % response.etag,
+            }
+        )
+        response = inst(context, request)
+        self.assertEqual(response.status_int, 304)
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+
+    def test_precompressed_disabled_by_default(self):
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_ACCEPT_ENCODING': 'br'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'identity';\n")
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.vary, None)
+
+    def test_precompressed_prefers_br(self):
+        from pyramid.response import _guess_type
+
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/compressed/app.js',
+                'HTTP_ACCEPT_ENCODING': 'gzip, deflate, br',
+            }
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'br';\n")
+        self.assertEqual(response.content_encoding, 'br')
+        self.assertEqual(response.content_type, _guess_type('app.js')[0])
+        self.assertEqual(response.content_length, len(response.body))
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+
+    def test_precompressed_gzip(self):
+        import gzip
+
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertEqual(
+            gzip.decompress(response.body), b"var app = 'identity';\n"
+        )
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+
+    def test_precompressed_honors_qvalues(self):
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/compressed/app.js',
+                'HTTP_ACCEPT_ENCODING': 'br;q=0.5, gzip',
+            }
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        response.app_iter.close()
+
+    def test_precompressed_not_accepted(self):
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/compressed/app.js',
+                'HTTP_ACCEPT_ENCODING': 'br;q=0, gzip;q=0, deflate',
+            }
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'identity';\n")
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+
+    def test_precompressed_no_accept_encoding(self):
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        request = self._makeRequest({'PATH_INFO': '/compressed/app.js'})
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'identity';\n")
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+
+    def test_precompressed_without_variants(self):
+        inst = self._makeOne('tests:fixtures/static', precompressed=True)
+        request = self._makeRequest(
+            {'PATH_INFO': '/index.html', 'HTTP_ACCEPT_ENCODING': 'gzip, br'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertTrue(b'<html>static</html>' in response.body)
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.vary, None)
+
+    def test_precompressed_filesystem(self):
+        inst = self._makeOne(
+            os.path.join(here, 'fixtures/static'), precompressed=True
+        )
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_ACCEPT_ENCODING': 'br'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'br';\n")
+        self.assertEqual(response.content_encoding, 'br')
+
+    def test_precompressed_variant_is_cached(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', stat_cache_ttl=10, precompressed=True
+        )
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        context = DummyContext()
+        inst(context, request).app_iter.close()
+        info = inst.stat_cache.get('compressed/app.js')
+        self.assertEqual(
+            [variant.content_encoding for variant in info.encodings],
+            ['br', 'gzip'],
+        )
+
+    def test_memory_cache_disabled_by_default(self):
+        inst = self._makeOne('tests:fixtures/static')
+        self.assertEqual(inst.memory_cache, None)
+
+    def test_memory_cache_hit(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne(
+            'tests:fixtures/static', cache_max_age=600, memory_cache_size=1000
+        )
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        first = inst(context, request)
+        self.assertFalse(isinstance(first, FileResponse))
+        self.assertEqual(len(inst.memory_cache), 1)
+        fn = os.path.join(here, 'fixtures/static/index.html')
+        inst.memory_cache.get(fn).body = b'<html>cached</html>'
+        response = inst(context, request)
+        self.assertEqual(response.body, b'<html>cached</html>')
+        self.assertEqual(response.content_type, 'text/html')
+        self.assertEqual(response.etag, first.etag)
+        self.assertEqual(response.last_modified, first.last_modified)
+        self.assertEqual(response.cache_control.max_age, 600)
+        self.assertTrue(response.expires is not None)
+
+    def test_memory_cache_revalidates_changed_file(self):
+        import shutil
+        import tempfile
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fn = os.path.join(tmpdir, 'foo.txt')
+            with open(fn, 'wb') as fp:
+                fp.write(b'foo')
+            inst = self._makeOne(tmpdir, memory_cache_size=1000)
+            request = self._makeRequest({'PATH_INFO': '/foo.txt'})
+            context = DummyContext()
+            self.assertEqual(inst(context, request).body, b'foo')
+            with open(fn, 'wb') as fp:
+                fp.write(b'foobar')
+            os.utime(fn, (0, 0))
+            response = inst(context, request)
+            self.assertEqual(response.body, b'foobar')
+            self.assertEqual(response.content_length, 6)
+            self.assertEqual(inst.memory_cache.get(fn).body, b'foobar')
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_memory_cache_skips_large_files(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne(
+            'tests:fixtures/static',
+            memory_cache_size=1000,
+            memory_cache_file_size=5,
+        )
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertTrue(isinstance(response, FileResponse))
+        response.app_iter.close()
+        self.assertEqual(len(inst.memory_cache), 0)
+
+    def test_memory_cache_size_budget(self):
+        fn = os.path.join(here, 'fixtures/static/compressed/app.js')
+        inst = self._makeOne(
+            'tests:fixtures/static',
+            memory_cache_size=os.path.getsize(fn) + 1,
+        )
+        context = DummyContext()
+        for path in ('/compressed/app.js', '/index.html'):
+            request = self._makeRequest({'PATH_INFO': path})
+            inst(context, request)
+        self.assertFalse(fn in inst.memory_cache)
+        self.assertTrue(
+            inst.memory_cache.currsize <= inst.memory_cache.maxsize
+        )
+
+    def test_memory_cache_precompressed(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', precompressed=True, memory_cache_size=1000
+        )
+        context = DummyContext()
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_ACCEPT_ENCODING': 'br'}
+        )
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'br';\n")
+        self.assertEqual(response.content_encoding, 'br')
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+        request = self._makeRequest({'PATH_INFO': '/compressed/app.js'})
+        response = inst(context, request)
+        self.assertEqual(response.body, b"var app = 'identity';\n")
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(len(inst.memory_cache), 2)
+
+    def test_memory_cache_range(self):
+        inst = self._makeOne('tests:fixtures/static', memory_cache_size=1000)
+        request = self._makeRequest(
+            {'PATH_INFO': '/compressed/app.js', 'HTTP_RANGE': 'bytes=4-6'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        start_response = DummyStartResponse()
+        app_iter = response(request.environ, start_response)
+        self.assertEqual(start_response.status, '206 Partial Content')
+        self.assertEqual(b''.join(app_iter), b'app')
+
+    def test_stat_cache_disabled_by_default(self):
+        inst = self._makeOne('tests:fixtures/static')
+        self.assertEqual(inst.stat_cache, None)
+
+    def test_stat_cache_hit(self):
+        inst = self._makeOne('tests:fixtures/static', stat_cache_ttl=10)
+        inst.monotonic = lambda: 100
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        response = inst(context, request)
+        response.app_iter.close()
+        info = inst.stat_cache.get('index.html')
+        self.assertEqual(info.expires, 110)
+        self.assertEqual(info.content_type, 'text/html')
+        self.assertEqual(
+            info.size,
+            os.path.getsize(os.path.join(here, 'fixtures/static/index.html')),
+        )
+        inst._make_file_info = None  # would fail if consulted
+        response = inst(context, request)
+        self.assertTrue(b'<html>static</html>' in response.body)
+        self.assertEqual(inst.stat_cache.hits, 2)
+
+    def test_stat_cache_revalidates_after_ttl(self):
+        inst = self._makeOne('tests:fixtures/static', stat_cache_ttl=10)
+        inst.monotonic = lambda: 100
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        inst(context, request).app_iter.close()
+        inst.monotonic = lambda: 110
+        inst(context, request).app_iter.close()
+        self.assertEqual(inst.stat_cache.get('index.html').expires, 120)
+
+    def test_stat_cache_redirects_cached_directory(self):
+        from pyramid.httpexceptions import HTTPMovedPermanently
+
+        inst = self._makeOne('tests:fixtures/static', stat_cache_ttl=10)
+        context = DummyContext()
+        request = self._makeRequest({'PATH_INFO': '/subdir/'})
+        response = inst(context, request)
+        self.assertTrue(b'<html>subdir</html>' in response.body)
+        request = self._makeRequest({'PATH_INFO': '/subdir'})
+        self.assertRaises(HTTPMovedPermanently, inst, context, request)
+
+    def test_stat_cache_does_not_cache_misses(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne('tests:fixtures/static', stat_cache_ttl=10)
+        request = self._makeRequest({'PATH_INFO': '/notthere.html'})
+        context = DummyContext()
+        self.assertRaises(HTTPNotFound, inst, context, request)
+        self.assertEqual(len(inst.stat_cache), 0)
+
+    def test_stat_cache_drops_file_removed_on_revalidation(self):
+        import shutil
+        import tempfile
+        from pyramid.httpexceptions import HTTPNotFound
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(tmpdir, 'foo.txt'), 'wb') as fp:
+                fp.write(b'foo')
+            inst = self._makeOne(tmpdir, stat_cache_ttl=10)
+            inst.monotonic = lambda: 100
+            request = self._makeRequest({'PATH_INFO': '/foo.txt'})
+            context = DummyContext()
+            self.assertEqual(inst(context, request).body, b'foo')
+            os.remove(os.path.join(tmpdir, 'foo.txt'))
+            inst.monotonic = lambda: 200
+            self.assertRaises(HTTPNotFound, inst, context, request)
+            self.assertEqual(len(inst.stat_cache), 0)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_stat_cache_file_removed_within_ttl(self):
+        import shutil
+        import tempfile
+        from pyramid.httpexceptions import HTTPNotFound
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for kw in ({}, {'memory_cache_size': 1024}):
+                with open(os.path.join(tmpdir, 'foo.txt'), 'wb') as fp:
+                    fp.write(b'foo')
+                inst = self._makeOne(tmpdir, stat_cache_ttl=10, **kw)
+                inst.monotonic = lambda: 100
+                request = self._makeRequest({'PATH_INFO': '/foo.txt'})
+                context = DummyContext()
+                # only stat the file, so that nothing is in memory yet
+                inst._get_file_info('foo.txt')
+                os.remove(os.path.join(tmpdir, 'foo.txt'))
+                self.assertRaises(HTTPNotFound, inst, context, request)
+                self.assertEqual(len(inst.stat_cache), 0)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_stat_cache_size(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', stat_cache_ttl=10, stat_cache_size=1
+        )
+        context = DummyContext()
+        for path in ('/index.html', '/subdir/'):
+            request = self._makeRequest({'PATH_INFO': path})
+            inst(context, request).app_iter.close()
+        stats = inst.stat_cache.stats()
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(stats['evictions'], 1)
+
 
 class Test_static_view_use_subpath_True(unittest.TestCase):
     def _getTargetClass(self):
@@ -350,7 +786,7 @@ class Test_static_view_use_subpath_True(unittest.TestCase):
         context = DummyContext()
         response = inst(context, request)
         self.assertTrue(b'<html>static</html>' in response.body)
-        self.assertEqual(len(response.headerlist), 5)
+        self.assertEqual(len(response.headerlist), 6)
         header_names = [x[0] for x in response.headerlist]
         header_names.sort()
         self.assertEqual(
@@ -359,6 +795,7 @@ class Test_static_view_use_subpath_True(unittest.TestCase):
                 'Cache-Control',
                 'Content-Length',
                 'Content-Type',
+                'ETag',
                 'Expires',
                 'Last-Modified',
             ],
@@ -371,11 +808,12 @@ class Test_static_view_use_subpath_True(unittest.TestCase):
         context = DummyContext()
         response = inst(context, request)
         self.assertTrue(b'<html>static</html>' in response.body)
-        self.assertEqual(len(response.headerlist), 3)
+        self.assertEqual(len(response.headerlist), 4)
         header_names = [x[0] for x in response.headerlist]
         header_names.sort()
         self.assertEqual(
-            header_names, ['Content-Length', 'Content-Type', 'Last-Modified']
+            header_names,
+            ['Content-Length', 'Content-Type', 'ETag', 'Last-Modified'],
         )
 
     def test_resource_notmodified(self):
@@ -387,11 +825,8 @@ class Test_static_view_use_subpath_True(unittest.TestCase):
         response = inst(context, request)
         start_response = DummyStartResponse()
         app_iter = response(request.environ, start_response)
-        try:
-            self.assertEqual(start_response.status, '304 Not Modified')
-            self.assertEqual(list(app_iter), [])
-        finally:
-            app_iter.close()
+        self.assertEqual(start_response.status, '304 Not Modified')
+        self.assertEqual(list(app_iter), [])
 
     def test_not_found(self):
         inst = self._makeOne('tests:fixtures/static')
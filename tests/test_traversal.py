@@ -476,6 +476,198 @@ class ResourceTreeTraverserTests(unittest.TestCase):
         self.assertEqual(result['virtual_root'], abc)
         self.assertEqual(result['virtual_root_path'], ('abc',))
 
+    def test_traverse_many(self):
+        baz = DummyContext()
+        bar = DummyContext(baz)
+        foo = DummyContext(bar)
+        root = DummyBulkContext({'foo': foo, 'bar': bar, 'baz': baz})
+        environ = self._getEnviron()
+        request = DummyRequest(environ, path_info=text_('/foo/bar/baz'))
+        policy = self._makeOne(root)
+        result = policy(request)
+        self.assertEqual(root.calls, [('foo', 'bar', 'baz')])
+        self.assertEqual(result['context'], baz)
+        self.assertEqual(result['view_name'], '')
+        self.assertEqual(result['subpath'], ())
+        self.assertEqual(result['traversed'], ('foo', 'bar', 'baz'))
+        self.assertEqual(result['root'], root)
+        self.assertEqual(result['virtual_root'], root)
+        self.assertEqual(result['virtual_root_path'], ())
+
+    def test_traverse_many_partial(self):
+        foo = DummyContext()
+        root = DummyBulkContext({'foo': foo})
+        environ = self._getEnviron()
+        request = DummyRequest(environ, path_info=text_('/foo/bar/baz'))
+        policy = self._makeOne(root)
+        result = policy(request)
+        self.assertEqual(root.calls, [('foo', 'bar', 'baz')])
+        self.assertEqual(result['context'], foo)
+        self.assertEqual(result['view_name'], 'bar')
+        self.assertEqual(result['subpath'], ('baz',))
+        self.assertEqual(result['traversed'], ('foo',))
+        self.assertEqual(result['root'], root)
+
+    def test_traverse_many_nothing_found(self):
+        root = DummyBulkContext({})
+        environ = self._getEnviron()
+        request = DummyRequest(environ, path_info=text_('/foo/bar'))
+        policy = self._makeOne(root)
+        result = policy(request)
+        self.assertEqual(result['context'], root)
+        self.assertEqual(result['view_name'], 'foo')
+        self.assertEqual(result['subpath'], ('bar',))
+        self.assertEqual(result['traversed'], ())
+
+    def test_traverse_many_stops_at_view_selector(self):
+        bar = DummyContext()
+        foo = DummyContext(bar)
+        root = DummyBulkContext({'foo': foo, 'bar': bar})
+        environ = self._getEnviron()
+        request = DummyRequest(
+            environ, path_info=text_('/foo/bar/@@view/baz')
+        )
+        policy = self._makeOne(root)
+        result = policy(request)
+        self.assertEqual(root.calls, [('foo', 'bar')])
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['view_name'], 'view')
+        self.assertEqual(result['subpath'], ('baz',))
+        self.assertEqual(result['traversed'], ('foo', 'bar'))
+
+    def test_traverse_many_below_getitem(self):
+        bar = DummyContext()
+        foo = DummyBulkContext({'bar': bar})
+        root = DummyContext(foo)
+        environ = self._getEnviron()
+        request = DummyRequest(environ, path_info=text_('/foo/bar/baz'))
+        policy = self._makeOne(root)
+        result = policy(request)
+        self.assertEqual(foo.calls, [('bar', 'baz')])
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['view_name'], 'baz')
+        self.assertEqual(result['subpath'], ())
+        self.assertEqual(result['traversed'], ('foo', 'bar'))
+
+    def test_traverse_many_with_vroot(self):
+        bar = DummyContext()
+        foo = DummyContext(bar)
+        root = DummyBulkContext({'foo': foo, 'bar': bar})
+        environ = self._getEnviron(HTTP_X_VHM_ROOT='/foo')
+        request = DummyRequest(environ, path_info=text_('/bar/@@view'))
+        policy = self._makeOne(root)
+        result = policy(request)
+        self.assertEqual(root.calls, [('foo', 'bar')])
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['view_name'], 'view')
+        self.assertEqual(result['subpath'], ())
+        self.assertEqual(result['traversed'], ('foo', 'bar', '@@view'))
+        self.assertEqual(result['root'], root)
+        self.assertEqual(result['virtual_root'], foo)
+        self.assertEqual(result['virtual_root_path'], ('foo',))
+
+
+class CachingResourceTreeTraverserTests(ResourceTreeTraverserTests):
+    def setUp(self):
+        cleanUp()
+        self._getTargetClass().cache.clear()
+
+    def _getTargetClass(self):
+        from pyramid.traversal import CachingResourceTreeTraverser
+
+        return CachingResourceTreeTraverser
+
+    def _makeTree(self):
+        root = DummyCacheableResource()
+        foo = root['foo'] = DummyCacheableResource()
+        bar = foo['bar'] = DummyCacheableResource()
+        return root, foo, bar
+
+    def _traverse(self, root, path, **kw):
+        request = DummyRequest(self._getEnviron(**kw), path_info=path)
+        return self._makeOne(root)(request)
+
+    def test_cached(self):
+        root, foo, bar = self._makeTree()
+        result = self._traverse(root, text_('/foo/bar/baz/buz'))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['view_name'], 'baz')
+        self.assertEqual(result['subpath'], ('buz',))
+        del foo['bar']
+        result = self._traverse(root, text_('/foo/bar/baz/buz'))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['traversed'], ('foo', 'bar'))
+        self.assertEqual(result['root'], root)
+        self.assertEqual(self._getTargetClass().cache.hits, 1)
+
+    def test_cached_result_is_a_copy(self):
+        root, foo, bar = self._makeTree()
+        result = self._traverse(root, text_('/foo'))
+        result['context'] = None
+        result = self._traverse(root, text_('/foo'))
+        self.assertEqual(result['context'], foo)
+
+    def test_invalidate(self):
+        klass = self._getTargetClass()
+        root, foo, bar = self._makeTree()
+        self._traverse(root, text_('/foo/bar'))
+        del foo['bar']
+        generation = klass.generation
+        klass.invalidate()
+        self.assertEqual(klass.generation, generation + 1)
+        result = self._traverse(root, text_('/foo/bar'))
+        self.assertEqual(result['context'], foo)
+        self.assertEqual(result['view_name'], 'bar')
+
+    def test_virtual_root_in_key(self):
+        root, foo, bar = self._makeTree()
+        result = self._traverse(root, text_('/bar'), HTTP_X_VHM_ROOT='/foo')
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['virtual_root'], foo)
+        result = self._traverse(root, text_('/foo/bar'))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['virtual_root'], root)
+
+    def test_root_not_cacheable(self):
+        root, foo, bar = self._makeTree()
+        root.__traversal_cacheable__ = False
+        self._traverse(root, text_('/foo/bar'))
+        self.assertEqual(len(self._getTargetClass().cache), 0)
+
+    def test_resource_not_cacheable(self):
+        root, foo, bar = self._makeTree()
+        foo.__traversal_cacheable__ = False
+        result = self._traverse(root, text_('/foo/bar'))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(len(self._getTargetClass().cache), 0)
+        result = self._traverse(root, text_('/'))
+        self.assertEqual(result['context'], root)
+        self.assertEqual(len(self._getTargetClass().cache), 1)
+
+    def test_context_not_under_root(self):
+        root, foo, bar = self._makeTree()
+        other = DummyCacheableResource()
+        root.children['other'] = other
+        result = self._traverse(root, text_('/other'))
+        self.assertEqual(result['context'], other)
+        self.assertEqual(len(self._getTargetClass().cache), 0)
+
+    def test_different_roots(self):
+        root, foo, bar = self._makeTree()
+        other_root, other_foo, other_bar = self._makeTree()
+        self._traverse(root, text_('/foo'))
+        result = self._traverse(other_root, text_('/foo'))
+        self.assertEqual(result['context'], other_foo)
+
+    def test_matchdict_subpath_in_key(self):
+        root, foo, bar = self._makeTree()
+        traverser = self._makeOne(root)
+        request = DummyRequest(self._getEnviron())
+        request.matchdict = {'traverse': text_('/foo'), 'subpath': ('a',)}
+        self.assertEqual(traverser(request)['subpath'], ('a',))
+        request.matchdict = {'traverse': text_('/foo'), 'subpath': ('b',)}
+        self.assertEqual(traverser(request)['subpath'], ('b',))
+
 
 class FindInterfaceTests(unittest.TestCase):
     def _callFUT(self, context, iface):
@@ -879,6 +1071,100 @@ class QuotePathSegmentTests(unittest.TestCase):
         result = self._callFUT(s)
         self.assertEqual(result, 'abc')
 
+    def test_cached(self):
+        from pyramid import traversal
+
+        info = traversal._cached_quote_segment.cache_info()
+        result = self._callFUT('cached segment')
+        self.assertEqual(result, 'cached%20segment')
+        result = self._callFUT('cached segment')
+        self.assertEqual(result, 'cached%20segment')
+        after = traversal._cached_quote_segment.cache_info()
+        self.assertEqual(after.misses, info.misses + 1)
+        self.assertEqual(after.hits, info.hits + 1)
+
+    def test_resize_same_size_keeps_cache(self):
+        from pyramid import traversal
+
+        self._callFUT('kept segment')
+        cached = traversal._cached_quote_segment
+        traversal._resize_segment_cache(cached.cache_info().maxsize)
+        self.assertIs(traversal._cached_quote_segment, cached)
+
+    def test_cache_bounded(self):
+        from pyramid import traversal
+
+        maxsize = traversal._cached_quote_segment.cache_info().maxsize
+        traversal._resize_segment_cache(10)
+        try:
+            for i in range(100):
+                result = self._callFUT('bounded %d' % i)
+                self.assertEqual(result, 'bounded%%20%d' % i)
+            info = traversal._cached_quote_segment.cache_info()
+            self.assertEqual(info.currsize, 10)
+            self.assertEqual(info.maxsize, 10)
+        finally:
+            traversal._resize_segment_cache(maxsize)
+
+
+class Test_warm_segment_cache(unittest.TestCase):
+    def _callFUT(self, segments, **kw):
+        from pyramid.traversal import warm_segment_cache
+
+        return warm_segment_cache(segments, **kw)
+
+    def test_it(self):
+        from pyramid.traversal import quote_path_segment, segment_cache_stats
+
+        self._callFUT(['warm a', 'warm b'])
+        before = segment_cache_stats()
+        self.assertEqual(quote_path_segment('warm a'), 'warm%20a')
+        self.assertEqual(quote_path_segment('warm b'), 'warm%20b')
+        self.assertEqual(segment_cache_stats()['hits'], before['hits'] + 2)
+
+    def test_safe(self):
+        from pyramid.traversal import quote_path_segment, segment_cache_stats
+
+        self._callFUT(['warm/c'], safe='/')
+        before = segment_cache_stats()
+        self.assertEqual(quote_path_segment('warm/c', safe='/'), 'warm/c')
+        self.assertEqual(segment_cache_stats()['hits'], before['hits'] + 1)
+
+
+class Test_segment_cache_stats(unittest.TestCase):
+    def _callFUT(self):
+        from pyramid.traversal import segment_cache_stats
+
+        return segment_cache_stats()
+
+    def test_it(self):
+        from pyramid.traversal import quote_path_segment
+
+        quote_path_segment('stats segment')
+        before = self._callFUT()
+        quote_path_segment('stats segment')
+        after = self._callFUT()
+        self.assertEqual(after['hits'], before['hits'] + 1)
+        self.assertEqual(after['misses'], before['misses'])
+        self.assertEqual(
+            sorted(after), ['evictions', 'hits', 'maxsize', 'misses', 'size']
+        )
+
+    def test_evictions(self):
+        from pyramid import traversal
+
+        maxsize = self._callFUT()['maxsize']
+        traversal._resize_segment_cache(10)
+        try:
+            for i in range(15):
+                traversal.quote_path_segment('evicted %d' % i)
+            stats = self._callFUT()
+            self.assertEqual(stats['size'], 10)
+            self.assertEqual(stats['misses'], 15)
+            self.assertEqual(stats['evictions'], 5)
+        finally:
+            traversal._resize_segment_cache(maxsize)
+
 
 class ResourceURLTests(unittest.TestCase):
     def _makeOne(self, context, url):
@@ -1267,6 +1553,44 @@ class DummyContext(object):
         )
 
 
+class DummyBulkContext(object):
+    __parent__ = None
+    __name__ = None
+
+    def __init__(self, resources):
+        self.resources = resources
+        self.calls = []
+
+    def __traverse_many__(self, segments):
+        self.calls.append(segments)
+        found = []
+        for segment in segments:
+            if segment not in self.resources:
+                break
+            found.append(self.resources[segment])
+        return found
+
+
+class DummyCacheableResource(object):
+    __parent__ = None
+    __name__ = None
+    __traversal_cacheable__ = True
+
+    def __init__(self):
+        self.children = {}
+
+    def __setitem__(self, name, resource):
+        resource.__name__ = name
+        resource.__parent__ = self
+        self.children[name] = resource
+
+    def __getitem__(self, name):
+        return self.children[name]
+
+    def __delitem__(self, name):
+        del self.children[name]
+
+
 class DummyRequest:
 
     application_url = (
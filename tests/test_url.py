@@ -783,6 +783,127 @@ class TestURLMethodsMixin(unittest.TestCase):
         )
         self.assertEqual(result, '/foo/1/2/3/extra1/extra2?a=1#foo')
 
+    def test_route_urls(self):
+        from pyramid.interfaces import IRoutesMapper
+        from pyramid.urldispatch import Route
+
+        request = self._makeOne()
+        mapper = DummyRoutesMapper(route=Route('item', '/items/{id}'))
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        kws = [{'id': 1}, {'id': 'a b'}, {'id': 3, '_query': {'b': 2}}]
+        result = request.route_urls('item', kws, 'edit', _query={'a': 1})
+        self.assertEqual(
+            result,
+            [
+                'http://example.com:5432/items/1/edit?a=1',
+                'http://example.com:5432/items/a%20b/edit?a=1',
+                'http://example.com:5432/items/3/edit?b=2',
+            ],
+        )
+        self.assertEqual(
+            result,
+            [
+                request.route_url(
+                    'item', 'edit', **dict({'_query': {'a': 1}}, **kw)
+                )
+                for kw in kws
+            ],
+        )
+
+    def test_route_urls_computes_application_url_once(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        calls = []
+
+        class Request(request.__class__):
+            @property
+            def application_url(self):
+                calls.append(True)
+                return 'http://example.com'
+
+        request.__class__ = Request
+        mapper = DummyRoutesMapper(route=DummyRoute('/1/2/3'))
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        result = request.route_urls('flub', [{}, {}, {}])
+        self.assertEqual(result, ['http://example.com/1/2/3'] * 3)
+        self.assertEqual(len(calls), 1)
+
+    def test_route_urls_with_overrides(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne(
+            {
+                'wsgi.url_scheme': 'http',
+                'SERVER_NAME': 'example.com',
+                'SERVER_PORT': '5432',
+            }
+        )
+        mapper = DummyRoutesMapper(route=DummyRoute('/1/2/3'))
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        result = request.route_urls(
+            'flub',
+            [{}, {'_host': 'foo.com'}, {'_app_url': 'http://bar.com'}],
+            _anchor='a',
+        )
+        self.assertEqual(
+            result,
+            [
+                'http://example.com:5432/1/2/3#a',
+                'http://foo.com:5432/1/2/3#a',
+                'http://bar.com/1/2/3#a',
+            ],
+        )
+
+    def test_route_urls_with_pregenerator(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        route = DummyRoute(result='/1/2/3')
+        pregenerated = []
+
+        def pregenerator(request, elements, kw):
+            pregenerated.append(kw)
+            return ('a',), {'_app_url': 'http://example2.com'}
+
+        route.pregenerator = pregenerator
+        mapper = DummyRoutesMapper(route=route)
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        result = request.route_urls('flub', [{'x': 1}, {'x': 2}], y=3)
+        self.assertEqual(result, ['http://example2.com/1/2/3/a'] * 2)
+        self.assertEqual(pregenerated, [{'x': 1, 'y': 3}, {'x': 2, 'y': 3}])
+
+    def test_route_urls_empty(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        mapper = DummyRoutesMapper(route=DummyRoute('/1/2/3'))
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        self.assertEqual(request.route_urls('flub', []), [])
+
+    def test_route_urls_no_such_route(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        mapper = DummyRoutesMapper(route=None)
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        self.assertRaises(KeyError, request.route_urls, 'flub', [{}])
+
+    def test_route_paths(self):
+        from pyramid.interfaces import IRoutesMapper
+        from pyramid.urldispatch import Route
+
+        request = self._makeOne()
+        request.script_name = '/foo'
+        mapper = DummyRoutesMapper(route=Route('item', '/items/{id}'))
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        result = request.route_paths(
+            'item',
+            [{'id': 1}, {'id': 2, '_app_url': 'http://example.com'}],
+            _app_url='http://example.com',
+        )
+        self.assertEqual(result, ['/foo/items/1', '/foo/items/2'])
+
     def test_static_url_staticurlinfo_notfound(self):
         request = self._makeOne()
         self.assertRaises(ValueError, request.static_url, 'static/foo.css')
@@ -1074,6 +1195,38 @@ class TestURLMethodsMixin(unittest.TestCase):
         result = request._partial_application_url()
         self.assertEqual(result, 'http://example.com:8000/abc')
 
+    def test_partial_application_url_memoized(self):
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '8000',
+        }
+        request = self._makeOne(environ)
+        result = request._partial_application_url(port=8080)
+        self.assertEqual(result, 'http://example.com:8080')
+        request._make_partial_application_url = None  # would fail if called
+        result = request._partial_application_url(port=8080)
+        self.assertEqual(result, 'http://example.com:8080')
+
+    def test_partial_application_url_memo_invalidated(self):
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '8000',
+        }
+        request = self._makeOne(environ)
+        result = request._partial_application_url()
+        self.assertEqual(result, 'http://example.com:8000')
+        environ['HTTP_HOST'] = 'example.org'
+        result = request._partial_application_url()
+        self.assertEqual(result, 'http://example.org:8000')
+        request.script_name = '/abc'
+        result = request._partial_application_url()
+        self.assertEqual(result, 'http://example.org:8000/abc')
+        environ['wsgi.url_scheme'] = 'https'
+        result = request._partial_application_url(host='foo.com')
+        self.assertEqual(result, 'https://foo.com:8000/abc')
+
 
 class Test_route_url(unittest.TestCase):
     def _callFUT(self, route_name, request, *elements, **kw):
@@ -48,6 +48,10 @@ class TestRoute(unittest.TestCase):
         route = self._makeOne('name', ':path')
         self.assertEqual(route.generate({'path': 'abc'}), '/abc')
 
+    def test_static_prefix(self):
+        route = self._makeOne('name', 'archives/:action/:article')
+        self.assertEqual(route.static_prefix, '/archives/')
+
 
 class RoutesMapperTests(unittest.TestCase):
     def setUp(self):
@@ -265,6 +269,85 @@ class RoutesMapperTests(unittest.TestCase):
         self.assertEqual(result['route'], mapper.routes['root'])
         self.assertEqual(result['match'], {})
 
+    def test___call__first_match_wins_across_prefixes(self):
+        mapper = self._makeOne()
+        mapper.connect('catchall', '/{path:.*}', predicates=[lambda *arg: 0])
+        mapper.connect('deep', '/a/b/{c}')
+        mapper.connect('shallow', '/a/{b}/{c}')
+        mapper.connect('root', '/*traverse')
+        request = self._getRequest(path_info='/a/b/c')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['deep'])
+        request = self._getRequest(path_info='/a/x/c')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['shallow'])
+        request = self._getRequest(path_info='/z')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['root'])
+
+    def test___call__earlier_shallow_route_wins(self):
+        mapper = self._makeOne()
+        mapper.connect('shallow', '/a/{b}/{c}')
+        mapper.connect('deep', '/a/b/{c}')
+        request = self._getRequest(path_info='/a/b/c')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['shallow'])
+
+    def test_dispatch_tree_candidates(self):
+        from pyramid.urldispatch import _DispatchNode
+
+        mapper = self._makeOne()
+        mapper.connect('a', '/a/{b}')
+        mapper.connect('ab1', '/a/b/{c}')
+        mapper.connect('root', '/{x}')
+        mapper.connect('ab2', '/a/b/c/{d}')
+        mapper.connect('a2', '/a/{c}/{d}')
+        tree = _DispatchNode.build(mapper.routelist)
+        routes = mapper.routes
+        self.assertEqual(list(tree.candidates('/z/y')), [routes['root']])
+        self.assertEqual(
+            list(tree.candidates('/a/b/c/d')),
+            [
+                routes['a'],
+                routes['ab1'],
+                routes['root'],
+                routes['ab2'],
+                routes['a2'],
+            ],
+        )
+        self.assertIs(tree.candidates('/a/b/c/x'), tree.candidates('/a/b/c/d'))
+        self.assertIs(tree.candidates('/z/y'), tree.candidates('/y/z'))
+        self.assertEqual(list(_DispatchNode().candidates('/a')), [])
+
+    def test___call__partial_segment_prefix(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/a/foo-{id}')
+        request = self._getRequest(path_info='/a/foo-1')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+        request = self._getRequest(path_info='/a/bar-1')
+        result = mapper(request)
+        self.assertEqual(result['route'], None)
+
+    def test___call__connect_after_call(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo')
+        request = self._getRequest(path_info='/bar')
+        self.assertEqual(mapper(request)['route'], None)
+        mapper.connect('bar', '/bar')
+        self.assertEqual(mapper(request)['route'], mapper.routes['bar'])
+
+    def test___call__route_without_static_prefix(self):
+        mapper = self._makeOne()
+        route = DummyRoute(None)
+        route.match = lambda path: {}
+        route.predicates = ()
+        mapper.connect('foo', '/a/b')
+        mapper.routelist.insert(0, route)
+        mapper._dispatch_tree = None
+        request = self._getRequest(path_info='/a/b')
+        self.assertEqual(mapper(request)['route'], route)
+
     def test_has_routes(self):
         mapper = self._makeOne()
         self.assertEqual(mapper.has_routes(), False)
@@ -303,6 +386,33 @@ class RoutesMapperTests(unittest.TestCase):
         self.assertEqual(mapper.generate('abc', {}), 123)
 
 
+class Test_static_prefix(unittest.TestCase):
+    def _callFUT(self, pattern):
+        from pyramid.urldispatch import _static_prefix
+
+        return _static_prefix(pattern)
+
+    def test_root(self):
+        self.assertEqual(self._callFUT(''), '/')
+        self.assertEqual(self._callFUT('/'), '/')
+
+    def test_static(self):
+        self.assertEqual(self._callFUT('/foo/bar'), '/foo/bar')
+
+    def test_placeholder(self):
+        self.assertEqual(self._callFUT('/foo/{bar}/baz'), '/foo/')
+
+    def test_old_style_placeholder(self):
+        self.assertEqual(self._callFUT('foo/:bar/baz'), '/foo/')
+
+    def test_partial_segment(self):
+        self.assertEqual(self._callFUT('/foo/bar-{id}'), '/foo/bar-')
+
+    def test_star(self):
+        self.assertEqual(self._callFUT('/foo/bar*traverse'), '/foo/bar')
+        self.assertEqual(self._callFUT('*traverse'), '/')
+
+
 class TestCompileRoute(unittest.TestCase):
     def _callFUT(self, pattern):
         from pyramid.urldispatch import _compile_route
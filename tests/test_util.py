@@ -420,6 +420,235 @@ class Test_WeakOrderedSet(unittest.TestCase):
         self.assertEqual(wos.last, None)
 
 
+class Test_LRUCache(unittest.TestCase):
+    def _makeOne(self, maxsize, sizeof=None):
+        from pyramid.util import LRUCache
+
+        return LRUCache(maxsize, sizeof)
+
+    def test_ctor_invalid_maxsize(self):
+        self.assertRaises(ValueError, self._makeOne, 0)
+
+    def test_get_miss(self):
+        cache = self._makeOne(2)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_put_and_get(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue('a' in cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_put_existing_does_not_evict(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+        self.assertEqual(cache.get('a'), 3)
+        self.assertEqual(cache.evictions, 0)
+        self.assertEqual(len(cache), 2)
+
+    def test_pop(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertEqual(cache.pop('a', 2), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 1)
+
+    def test_stats(self):
+        cache = self._makeOne(1)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('b')
+        cache.get('a')
+        self.assertEqual(
+            cache.stats(),
+            {
+                'size': 1,
+                'currsize': 1,
+                'maxsize': 1,
+                'hits': 1,
+                'misses': 1,
+                'evictions': 1,
+            },
+        )
+
+    def test_sizeof_evicts_until_value_fits(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'1234')
+        cache.put('b', b'1234')
+        cache.put('c', b'1234567')
+        self.assertFalse('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertEqual(cache.get('c'), b'1234567')
+        self.assertEqual(cache.currsize, 7)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_sizeof_replace_existing(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'123456')
+        cache.put('a', b'12345678')
+        self.assertEqual(cache.currsize, 8)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_sizeof_value_too_large(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'1234')
+        cache.put('b', b'12345678901')
+        self.assertFalse('b' in cache)
+        self.assertTrue('a' in cache)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_sizeof_pop_and_clear(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'1234')
+        cache.put('b', b'12')
+        cache.pop('a')
+        self.assertEqual(cache.currsize, 2)
+        cache.clear()
+        self.assertEqual(cache.currsize, 0)
+
+
+class Test_ClockCache(unittest.TestCase):
+    def _makeOne(self, maxsize):
+        from pyramid.util import ClockCache
+
+        return ClockCache(maxsize)
+
+    def test_ctor_invalid_maxsize(self):
+        self.assertRaises(ValueError, self._makeOne, 0)
+
+    def test_get_miss(self):
+        cache = self._makeOne(2)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_put_and_get(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue('a' in cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_evicts_oldest_unreferenced(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        self.assertFalse('a' in cache)
+        self.assertTrue('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_spares_referenced(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        # a was spared only once
+        cache.put('d', 4)
+        self.assertFalse('a' in cache)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_all_referenced(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.get('b')
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertFalse('a' in cache)
+        self.assertTrue('b' in cache)
+
+    def test_put_existing_does_not_evict(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+        self.assertEqual(cache.get('a'), 3)
+        self.assertEqual(cache.evictions, 0)
+        self.assertEqual(len(cache), 2)
+
+    def test_resize(self):
+        cache = self._makeOne(3)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        cache.resize(1)
+        self.assertEqual(cache.maxsize, 1)
+        self.assertEqual(len(cache), 1)
+        self.assertTrue('c' in cache)
+        self.assertRaises(ValueError, cache.resize, 0)
+
+    def test_pop(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.get('a')
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertEqual(cache.pop('a', 2), 2)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache._referenced, set())
+
+    def test_clear(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache._referenced, set())
+        self.assertEqual(cache.hits, 1)
+
+    def test_stale_references_dropped(self):
+        cache = self._makeOne(1)
+        cache.put('a', 1)
+        cache._referenced.update(['x', 'y'])
+        cache.put('b', 2)
+        self.assertEqual(cache._referenced, set())
+
+    def test_stats(self):
+        cache = self._makeOne(1)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('b')
+        cache.get('a')
+        self.assertEqual(
+            cache.stats(),
+            {'size': 1, 'maxsize': 1, 'hits': 1, 'misses': 1, 'evictions': 1},
+        )
+
+
 class Test_strings_differ(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from pyramid.util import strings_differ
@@ -1183,6 +1183,158 @@ class TestViewMethodsMixin(unittest.TestCase):
             self.fail()
 
 
+class Test__find_views(BaseTest, unittest.TestCase):
+    def _callFUT(self, registry, view_name, **kw):
+        from pyramid.view import _find_views
+
+        return _find_views(registry, IRequest, IContext, view_name, **kw)
+
+    def _makeRegistry(self, miss_cache_size=0):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        registry._view_lookup_miss_cache_size = miss_cache_size
+        registry._clear_view_lookup_cache()
+        return registry
+
+    def test_hit_is_cached(self):
+        registry = self._makeRegistry()
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        self.assertEqual(self._callFUT(registry, 'name'), [view])
+        self.assertEqual(
+            registry._view_lookup_cache[(IRequest, IContext, 'name')], [view]
+        )
+
+    def test_miss_not_cached_by_default(self):
+        registry = self._makeRegistry()
+        self.assertEqual(self._callFUT(registry, 'name'), [])
+        self.assertEqual(registry._view_lookup_cache, {})
+        self.assertEqual(registry._view_lookup_miss_cache, None)
+
+    def test_miss_cached(self):
+        registry = self._makeRegistry(2)
+        miss_cache = registry._view_lookup_miss_cache
+        self.assertEqual(self._callFUT(registry, 'name'), [])
+        self.assertEqual(miss_cache.misses, 1)
+        self.assertEqual(len(miss_cache), 1)
+        registry.adapters.registered = None  # would fail if consulted
+        self.assertEqual(self._callFUT(registry, 'name'), [])
+        self.assertEqual(miss_cache.hits, 1)
+
+    def test_miss_cache_is_bounded(self):
+        from zope.interface import Interface
+        from pyramid.view import _find_views
+
+        registry = self._makeRegistry(2)
+        miss_cache = registry._view_lookup_miss_cache
+        for name in ('a', 'b', 'c'):
+            context_iface = type(Interface)(name, (IContext,))
+            _find_views(registry, IRequest, context_iface, 'name')
+        self.assertEqual(len(miss_cache), 2)
+        self.assertEqual(miss_cache.evictions, 1)
+
+    def test_miss_cache_unknown_names_share_one_entry(self):
+        registry = self._makeRegistry(10)
+        self._registerView(registry, make_view('OK'), 'name')
+        registry._view_lookup_cache.clear()
+        miss_cache = registry._view_lookup_miss_cache
+        for i in range(100):
+            self.assertEqual(self._callFUT(registry, 'missing%d' % i), [])
+        self.assertEqual(len(miss_cache), 1)
+        self.assertEqual(miss_cache.evictions, 0)
+
+    def test_miss_cache_registered_name(self):
+        from zope.interface import Interface
+        from pyramid.interfaces import IViewClassifier
+
+        registry = self._makeRegistry(10)
+        self._registerView(registry, make_view('OK'), 'name')
+        registry._view_lookup_cache.clear()
+        miss_cache = registry._view_lookup_miss_cache
+        # views are only found for the exact classifier, but the names
+        # registered for the classifiers it extends are candidates
+        classifier = type(Interface)('ISubClassifier', (IViewClassifier,))
+        for i in range(2):
+            self.assertEqual(
+                self._callFUT(registry, 'name', view_classifier=classifier),
+                [],
+            )
+        self.assertEqual(len(miss_cache), 2)
+        self.assertEqual(miss_cache.hits, 2)
+
+    def test_miss_cache_keyed_on_view_types(self):
+        from pyramid.interfaces import IView
+
+        registry = self._makeRegistry(2)
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        registry._view_lookup_cache.clear()
+        self.assertEqual(self._callFUT(registry, 'name', view_types=()), [])
+        self.assertEqual(
+            self._callFUT(registry, 'name', view_types=(IView,)), [view]
+        )
+
+    def test_miss_cache_cleared_with_lookup_cache(self):
+        registry = self._makeRegistry(2)
+        self.assertEqual(self._callFUT(registry, 'name'), [])
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        registry._clear_view_lookup_cache()
+        self.assertEqual(self._callFUT(registry, 'name'), [view])
+
+
+class Test_RouteViewLookup(BaseTest, unittest.TestCase):
+    def _makeOne(self, registry, request_iface=IRequest):
+        from pyramid.view import _RouteViewLookup
+
+        return _RouteViewLookup(registry, request_iface)
+
+    def test_is_current(self):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        lookup = self._makeOne(registry)
+        self.assertTrue(lookup.is_current(registry))
+        registry._clear_view_lookup_cache()
+        self.assertFalse(lookup.is_current(registry))
+
+    def test_find_views_hit_is_remembered(self):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        lookup = self._makeOne(registry)
+        self.assertEqual(lookup.find_views(registry, IContext, 'name'), [view])
+        self.assertEqual(lookup.views, {(IContext, 'name'): [view]})
+
+    def test_find_views_miss_is_not_remembered(self):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        lookup = self._makeOne(registry)
+        self.assertEqual(lookup.find_views(registry, IContext, 'name'), [])
+        self.assertEqual(lookup.views, {})
+
+
+class Test_freeze_route_view_lookups(unittest.TestCase):
+    def test_it(self):
+        from pyramid.interfaces import IRouteRequest
+        from pyramid.registry import Registry
+        from pyramid.urldispatch import RoutesMapper
+        from pyramid.view import _freeze_route_view_lookups
+
+        registry = Registry()
+        registry.registerUtility(IContext, IRouteRequest, name='foo')
+        mapper = RoutesMapper()
+        foo = mapper.connect('foo', '/foo')
+        bar = mapper.connect('bar', '/bar')
+        _freeze_route_view_lookups(registry, mapper)
+        self.assertEqual(foo._view_lookup.request_iface, IContext)
+        self.assertEqual(bar._view_lookup.request_iface, IRequest)
+
+
 class ExceptionResponse(Exception):
     status = '404 Not Found'
     app_iter = ['Not Found']
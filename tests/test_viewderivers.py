@@ -233,6 +233,95 @@ class TestDeriveView(unittest.TestCase):
         context = testing.DummyResource()
         self.assertEqual(result(context, request).body, b'moo')
 
+    def test_function_with_renderer_factory_called_once(self):
+        infos = []
+
+        def moo(info):
+            infos.append(info)
+
+            def inner(value, system):
+                return value.encode('utf-8')
+
+            return inner
+
+        def view(request):
+            return request.params['value']
+
+        self.config.add_renderer('moo', moo)
+        result = self.config.derive_view(view, renderer='moo')
+        context = testing.DummyResource()
+        for value in ('a', 'b'):
+            request = self._makeRequest()
+            request.params = {'value': value}
+            response = result(context, request)
+            self.assertEqual(response.body, value.encode('utf-8'))
+        self.assertEqual(len(infos), 1)
+        self.assertEqual(infos[0].name, 'moo')
+
+    def test_function_with_renderer_request_override_reused(self):
+        infos = []
+
+        def moo(info):
+            infos.append(info)
+            return lambda value, system: b'moo'
+
+        def view(request):
+            return 'OK'
+
+        self.config.add_renderer('moo', moo)
+        result = self.config.derive_view(view, renderer='string')
+        context = testing.DummyResource()
+        for i in range(2):
+            request = self._makeRequest()
+            request.override_renderer = 'moo'
+            self.assertEqual(result(context, request).body, b'moo')
+        request = self._makeRequest()
+        self.assertEqual(result(context, request).text, 'OK')
+        self.assertEqual(len(infos), 1)
+
+    def test_function_with_renderer_reload_templates(self):
+        infos = []
+
+        def moo(info):
+            infos.append(info)
+            return lambda value, system: b'moo'
+
+        def view(request):
+            return 'OK'
+
+        self.config.add_renderer('moo', moo)
+        self.config.registry.settings = dict(reload_templates=True)
+        result = self.config.derive_view(view, renderer='moo')
+        context = testing.DummyResource()
+        for i in range(2):
+            request = self._makeRequest()
+            self.assertEqual(result(context, request).body, b'moo')
+            request = self._makeRequest()
+            request.override_renderer = 'moo'
+            self.assertEqual(result(context, request).body, b'moo')
+        self.assertEqual(len(infos), 4)
+
+    def test_function_with_renderer_request_overrides_bounded(self):
+        names = []
+
+        def moo(info):
+            names.append(info.name)
+            return lambda value, system: info.name.encode('utf-8')
+
+        def view(request):
+            return 'OK'
+
+        self.config.add_renderer('.moo', moo)
+        result = self.config.derive_view(view, renderer='string')
+        context = testing.DummyResource()
+        for i in list(range(150)) + [149, 0]:
+            request = self._makeRequest()
+            request.override_renderer = '%d.moo' % i
+            response = result(context, request)
+            self.assertEqual(response.body, b'%d.moo' % i)
+        self.assertEqual(len(names), 151)
+        self.assertEqual(names[-1], '0.moo')
+
     def test_requestonly_function_with_renderer_request_has_view(self):
         response = DummyResponse()
 
@@ -920,6 +1009,16 @@ class TestDeriveView(unittest.TestCase):
         self.assertEqual(next, response)
         self.assertEqual(predicates, [True, True])
 
+    def test_with_predicates_unpredicated(self):
+        response = DummyResponse()
+        view = lambda *arg: response
+
+        def predicate1(context, request):
+            return False
+
+        result = self.config._derive_view(view, predicates=[predicate1])
+        self.assertEqual(result.__unpredicated__(None, None), response)
+
     def test_with_predicates_checker(self):
         view = lambda *arg: 'OK'
         predicates = []